@@ -6,6 +6,7 @@ from nefertem_core.client.client import Client
 def create_client(
     output_path: str | None = None,
     stores: list[dict] | None = None,
+    cache: dict | None = None,
 ) -> Client:
     """
     Create a new Client object.
@@ -16,10 +17,12 @@ def create_client(
         Path to the metadata store.
     stores : list[dict]
         List of dict containing configuration for the artifact stores.
+    cache : dict
+        Configuration of the result cache shared by runs, by default None.
 
     Returns
     -------
     Client
         Client object.
     """
-    return Client(output_path, stores)
+    return Client(output_path, stores, cache)
@@ -4,9 +4,18 @@ Client module.
 from __future__ import annotations
 
 import typing
+from pathlib import Path
 
+from nefertem_core.plugins.factory import get_module_name
 from nefertem_core.run.builder import run_builder
+from nefertem_core.run.cache import ResultCache
+from nefertem_core.run.config import CacheConfig
+from nefertem_core.run.pool import WorkerPool
 from nefertem_core.stores.builder import store_builder
+from nefertem_core.utils.describe import set_describe_path
+from nefertem_core.utils.snapshot import set_snapshot_path
+from nefertem_core.utils.exceptions import RunError
+from pydantic import ValidationError
 
 if typing.TYPE_CHECKING:
     from nefertem_core.run.run import Run
@@ -23,6 +32,8 @@ class Client:
         Path where to store metadata and artifacts.
     stores : list[dict]
         List of dict containing configuration for the input stores.
+    cache : dict
+        Configuration of the result cache shared by runs. If None, results are not cached.
 
     Methods
     -------
@@ -30,16 +41,90 @@ class Client:
         Add a new store to the client internal registry.
     create_run
         Create a new run.
+    start_pool
+        Start a worker pool shared by runs.
+    shutdown_pool
+        Stop the worker pool.
     """
 
     def __init__(
         self,
         path: str | None = None,
         stores: list[dict] | None = None,
+        cache: dict | None = None,
     ) -> None:
         self._tmp_dir = "./ntruns/tmp"
+        self._pool: WorkerPool | None = None
+        self._cache = self._setup_cache(cache, path)
+        self._setup_folders(path)
         self._setup_stores(path, stores)
 
+    def _get_shared_path(self, path: str | None = None) -> Path:
+        """
+        Return the folder of the data shared by runs: the output path,
+        or the folder of the temporary directory if the client has no
+        output path.
+
+        Parameters
+        ----------
+        path : str
+            Path where to store metadata and artifacts.
+
+        Returns
+        -------
+        Path
+            Shared folder.
+        """
+        return Path(path) if path is not None else Path(self._tmp_dir).parent
+
+    def _setup_cache(self, config: dict | None = None, path: str | None = None) -> ResultCache | None:
+        """
+        Build the result cache shared by runs. The cache is kept in
+        the output path, or next to the temporary directory if the
+        client has no output path.
+
+        Parameters
+        ----------
+        config : dict
+            Result cache configuration.
+        path : str
+            Path where to store metadata and artifacts.
+
+        Returns
+        -------
+        ResultCache | None
+            Result cache, None if not configured.
+
+        Raises
+        ------
+        RunError
+            If the configuration is invalid.
+        """
+        if config is None:
+            return None
+        try:
+            cfg = CacheConfig(**config)
+        except (ValidationError, TypeError):
+            raise RunError("Invalid cache configuration.")
+        return ResultCache(self._get_shared_path(path) / ".cache", cfg.max_size, cfg.max_age)
+
+    def _setup_folders(self, path: str | None = None) -> None:
+        """
+        Set the folders of the file descriptions and of the reference
+        snapshots shared by runs, next to the result cache.
+
+        Parameters
+        ----------
+        path : str
+            Path where to store metadata and artifacts.
+
+        Returns
+        -------
+        None
+        """
+        set_describe_path(self._get_shared_path(path) / ".describe")
+        set_snapshot_path(self._get_shared_path(path) / ".snapshot")
+
     def _setup_stores(self, path: str | None = None, configs: list[dict] | None = None) -> None:
         """
         Build stores according to configurations provided by user and register
@@ -108,4 +193,65 @@ class Client:
         Run
             Run object.
         """
-        return run_builder.create_run(resources, run_config, self._tmp_dir, experiment, run_id, overwrite)
+        return run_builder.create_run(
+            resources,
+            run_config,
+            self._tmp_dir,
+            experiment,
+            run_id,
+            overwrite,
+            self._pool,
+            self._cache,
+        )
+
+    def start_pool(self, num_worker: int = 10, warmup: list[dict] | None = None) -> None:
+        """
+        Start a pool of worker processes shared by the runs created by the client.
+        Runs executed in parallel use it for multiprocess plugins instead of
+        starting their own processes. The pool lives until shutdown_pool is called.
+
+        Parameters
+        ----------
+        num_worker : int
+            Number of worker processes, by default 10.
+        warmup : list[dict]
+            List of dict with "operation" and "framework" keys. Every worker imports
+            the corresponding plugins at start-up, e.g.
+            [{"operation": "validation", "framework": "frictionless"}].
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        RunError
+            If a pool is already started.
+        """
+        if self._pool is not None:
+            raise RunError("Worker pool already started.")
+        try:
+            modules = [get_module_name(i["operation"], i["framework"]) for i in warmup or []]
+        except (KeyError, TypeError):
+            raise RunError("Invalid warmup configuration.")
+        pool = WorkerPool(num_worker, modules)
+        pool.start()
+        self._pool = pool
+
+    def shutdown_pool(self) -> None:
+        """
+        Stop the worker pool.
+
+        Returns
+        -------
+        None
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown_pool()
@@ -13,9 +13,10 @@ class PluginBuilder:
     Abstract PluginBuilder class.
     """
 
-    def __init__(self, stores: list[InputStore], exec_args: dict) -> None:
+    def __init__(self, stores: list[InputStore], exec_args: dict, num_worker: int = 1) -> None:
         self.exec_args = exec_args
         self.stores = {store.name: store for store in stores}
+        self.num_worker = num_worker
 
     @abstractmethod
     def build(self, *args, **kwargs) -> list[Plugin]:
@@ -15,12 +15,14 @@ if typing.TYPE_CHECKING:
 
 def builder_factory(config: RunConfig, stores: dict) -> list:
     """
-    Factory method that creates plugin builders.
+    Factory method that creates plugin builders. Builders receive the
+    number of plugins of the run that can be executed at the same time.
     """
+    num_worker = config.num_worker if config.parallel else 1
     builders = []
     for cfg in config.exec_config:
         ClsBuilder = _get_object(config.operation, cfg.framework)
-        builders.append(ClsBuilder(stores, cfg.exec_args))
+        builders.append(ClsBuilder(stores, cfg.exec_args, num_worker))
     return builders
 
 
@@ -41,7 +43,26 @@ def _get_object(operation: str, framework: str) -> PluginBuilder:
         Plugin builder class.
     """
     try:
-        module = importlib.import_module(f"nefertem_{operation}_{framework}")
+        module = importlib.import_module(get_module_name(operation, framework))
         return getattr(module, "Builder")
     except (ImportError, AttributeError):
         raise RunError(f"Builder of {framework} for {operation} not found.")
+
+
+def get_module_name(operation: str, framework: str) -> str:
+    """
+    Get the name of the plugin module of a framework.
+
+    Parameters
+    ----------
+    operation : str
+        Operation to perform.
+    framework : str
+        Framework to use.
+
+    Returns
+    -------
+    str
+        Plugin module name.
+    """
+    return f"nefertem_{operation}_{framework}"
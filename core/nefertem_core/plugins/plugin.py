@@ -5,13 +5,29 @@ from __future__ import annotations
 
 import typing
 from abc import ABCMeta, abstractmethod
+from typing import Any
 
 from nefertem_core.plugins.utils import RenderTuple
+from nefertem_core.utils.exceptions import RunError
 from nefertem_core.utils.logger import LOGGER
-from nefertem_core.utils.utils import build_uuid
+from nefertem_core.utils.utils import build_hash, build_uuid
+from pydantic import BaseModel
 
 if typing.TYPE_CHECKING:
     from nefertem_core.plugins.utils import Result
+    from nefertem_core.stores.input.objects._base import InputStore
+
+# Attributes that define the work of a plugin
+FINGERPRINT_ATTRIBUTES = (
+    "resource",
+    "reference_resource",
+    "constraint",
+    "constraints",
+    "metric",
+    "error_report",
+    "exec_args",
+    "chunk",
+)
 
 
 class Plugin(metaclass=ABCMeta):
@@ -29,6 +45,7 @@ class Plugin(metaclass=ABCMeta):
         self.exec_sequential = True
         self.exec_multiprocess = False
         self.exec_multithread = False
+        self.exec_partition = False
 
     @abstractmethod
     def setup(self, *args, **kwargs) -> None:
@@ -42,6 +59,55 @@ class Plugin(metaclass=ABCMeta):
         Execute main plugin operation.
         """
 
+    def get_inputs(self) -> list[tuple[InputStore, str]]:
+        """
+        Return the inputs read by the plugin as (store, path) tuples.
+        The run handler uses them to fetch data before the execution.
+        """
+        return []
+
+    def fingerprint(self) -> str:
+        """
+        Return a key of the work of the plugin. Plugins of the same class
+        with the same resources, constraint or metric and arguments produce
+        the same results, so the run handler executes them once. Random ids
+        given to models when they are built are not part of the key.
+        """
+        key = {"plugin": f"{type(self).__module__}.{type(self).__name__}"}
+        for attr in FINGERPRINT_ATTRIBUTES:
+            value = getattr(self, attr, None)
+            if isinstance(value, BaseModel):
+                value = value.dict(exclude={"id"})
+            elif isinstance(value, list):
+                value = [i.dict(exclude={"id"}) if isinstance(i, BaseModel) else i for i in value]
+            if value is not None:
+                key[attr] = value
+        return build_hash(key)
+
+    def partition(self) -> list[Plugin]:
+        """
+        Split the plugin workload into sub-plugins that can be executed
+        independently. Called by the run handler once the plugin inputs
+        are fetched, only if exec_partition is set. An empty list means
+        the plugin is executed as a whole.
+        """
+        return []
+
+    def execute_partition(self) -> Any:
+        """
+        Execute the workload of a sub-plugin returned by partition.
+        Must be implemented by plugins that support partitioning.
+        """
+        raise RunError(f"Plugin {type(self).__name__} {self.id} does not support the execution of partitions.")
+
+    def merge_partitions(self, results: list[Any]) -> dict:
+        """
+        Merge the results of the sub-plugins returned by partition into
+        the result of the plugin. Must be implemented by plugins that
+        support partitioning.
+        """
+        raise RunError(f"Plugin {type(self).__name__} {self.id} does not support the merge of partitions.")
+
     @abstractmethod
     def render_nefertem(self, obj: Result) -> RenderTuple:
         """
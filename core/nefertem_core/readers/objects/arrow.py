@@ -0,0 +1,175 @@
+"""
+ArrowReader module.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+
+from nefertem_core.readers.objects._base import DataReader
+from nefertem_core.utils.utils import listify
+
+# Formats read as a dataset, by file extension
+DATASET_FORMATS = {".csv": "csv", ".parquet": "parquet"}
+
+
+class ArrowReader(DataReader):
+    """
+    ArrowReader class.
+
+    The ArrowReader reads one or more CSV or Parquet files, e.g. the
+    partitions of a resource, as a single Arrow table through a pyarrow
+    dataset. Files are read batch by batch into the table, without an
+    intermediate DataFrame for every file, and only the requested columns
+    are read. The table is converted to pandas only when needed.
+    """
+
+    def fetch_data(
+        self,
+        src: str | list[str],
+        columns: list[str] | None = None,
+        delimiter: str = ",",
+        encoding: str | None = None,
+    ) -> pa.Table:
+        """
+        Fetch resources from backend.
+
+        Parameters
+        ----------
+        src : str | list[str]
+            Resource path or list of resource paths.
+        columns : list[str]
+            Columns to read, by default all.
+        delimiter : str
+            Delimiter of CSV files.
+        encoding : str
+            Encoding of CSV files, by default utf-8.
+
+        Returns
+        -------
+        pa.Table
+            Arrow table.
+        """
+        return self.fetch_dataset(src, delimiter, encoding).to_table(columns=columns)
+
+    def fetch_dataset(
+        self,
+        src: str | list[str],
+        delimiter: str = ",",
+        encoding: str | None = None,
+    ) -> ds.Dataset:
+        """
+        Fetch resources from backend and return a dataset that reads them
+        lazily.
+
+        Parameters
+        ----------
+        src : str | list[str]
+            Resource path or list of resource paths.
+        delimiter : str
+            Delimiter of CSV files.
+        encoding : str
+            Encoding of CSV files, by default utf-8.
+
+        Returns
+        -------
+        ds.Dataset
+            Arrow dataset.
+
+        Raises
+        ------
+        ValueError
+            If the files are not all CSV or all Parquet files.
+        """
+        srcs = listify(src)
+        file_format = get_dataset_format(srcs)
+        if file_format is None:
+            raise ValueError("Only lists of CSV files or of Parquet files can be read as a dataset!")
+        paths = [str(self.store.fetch_file(i)) for i in srcs]
+        if file_format == "csv":
+            file_format = ds.CsvFileFormat(
+                parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+                read_options=pa_csv.ReadOptions(encoding=encoding or "utf8"),
+            )
+
+            # The schema of a dataset is inferred from its first file only
+            if len(paths) > 1:
+                schema = unify_schemas([ds.dataset(path, format=file_format).schema for path in paths])
+                return ds.dataset(paths, schema=schema, format=file_format)
+        return ds.dataset(paths, format=file_format)
+
+
+def get_dataset_format(srcs: list[str]) -> str | None:
+    """
+    Return the format of a list of files if they can be read as a dataset.
+
+    Parameters
+    ----------
+    srcs : list[str]
+        List of resource paths.
+
+    Returns
+    -------
+    str | None
+        "csv" or "parquet", None if the files are not all CSV or all Parquet files.
+    """
+    formats = {DATASET_FORMATS.get(Path(src).suffix.lower()) for src in srcs}
+    if len(formats) != 1:
+        return None
+    return formats.pop()
+
+
+def unify_schemas(schemas: list[pa.Schema]) -> pa.Schema:
+    """
+    Unify the schemas inferred from the files of a resource. Types are
+    promoted, e.g. int64 to double, and columns whose types can not be
+    promoted are read as strings.
+
+    Parameters
+    ----------
+    schemas : list[pa.Schema]
+        Schemas of the files.
+
+    Returns
+    -------
+    pa.Schema
+        Schema of the resource.
+    """
+    try:
+        return pa.unify_schemas(schemas, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    types = {}
+    for schema in schemas:
+        for field in schema:
+            types.setdefault(field.name, []).append(pa.schema([field]))
+    fields = []
+    for name, field_schemas in types.items():
+        try:
+            fields.append(pa.unify_schemas(field_schemas, promote_options="permissive").field(name))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            fields.append(pa.field(name, pa.string()))
+    return pa.schema(fields)
+
+
+def to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Convert an Arrow table to a pandas DataFrame, releasing the memory of
+    the table while converting it. The table can not be used afterwards.
+
+    Parameters
+    ----------
+    table : pa.Table
+        Arrow table.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame.
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=True)
@@ -3,7 +3,7 @@ DataReader registry.
 """
 from __future__ import annotations
 
-from nefertem_core.utils.commons import FILE_READER, NATIVE_READER
+from nefertem_core.utils.commons import ARROW_READER, FILE_READER, NATIVE_READER
 
 
 class ReaderRegistry(dict):
@@ -30,3 +30,4 @@ class ReaderRegistry(dict):
 reader_registry = ReaderRegistry()
 reader_registry.register(FILE_READER, "nefertem_core.readers.objects.file", "FileReader")
 reader_registry.register(NATIVE_READER, "nefertem_core.readers.objects.native", "NativeReader")
+reader_registry.register(ARROW_READER, "nefertem_core.readers.objects.arrow", "ArrowReader")
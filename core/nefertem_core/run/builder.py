@@ -16,6 +16,8 @@ from nefertem_core.utils.utils import build_uuid
 from pydantic import ValidationError
 
 if typing.TYPE_CHECKING:
+    from nefertem_core.run.cache import ResultCache
+    from nefertem_core.run.pool import WorkerPool
     from nefertem_core.run.run import Run
 
 
@@ -41,6 +43,8 @@ class RunBuilder:
         experiment_name: str | None = None,
         run_id: str | None = None,
         overwrite: bool = False,
+        pool: WorkerPool | None = None,
+        cache: ResultCache | None = None,
     ) -> Run:
         """
         Create a new run.
@@ -59,6 +63,10 @@ class RunBuilder:
             Run id, by default None.
         overwrite : bool
             If True, overwrite run if already exists.
+        pool : WorkerPool
+            Worker pool shared by runs, by default None.
+        cache : ResultCache
+            Result cache shared by runs, by default None.
 
         Returns
         -------
@@ -87,7 +95,7 @@ class RunBuilder:
         ClsRun: Run = self._get_run_object(cfg.operation)
 
         # Create run
-        run_handler = RunHandler(cfg)
+        run_handler = RunHandler(cfg, tmp_dir, pool, cache, run_path)
         run_info = RunInfo(
             run_id=run_id,
             experiment_name=experiment_name,
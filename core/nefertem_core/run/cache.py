@@ -0,0 +1,203 @@
+"""
+Result cache module.
+"""
+from __future__ import annotations
+
+import os
+import pickle
+import time
+import typing
+from io import BytesIO
+from pathlib import Path
+
+from nefertem_core.plugins.utils import ExecutionStatus, RenderTuple, ResultType
+from nefertem_core.utils.logger import LOGGER
+from nefertem_core.utils.pickle_utils import dump
+from nefertem_core.utils.utils import build_hash, build_uuid, listify
+
+if typing.TYPE_CHECKING:
+    from nefertem_core.plugins.plugin import Plugin
+    from nefertem_core.plugins.utils import Result
+
+
+class ResultCache:
+    """
+    On-disk cache of plugin results shared by runs.
+
+    A result is keyed by the fingerprint of the plugin, the framework
+    name and version and the fingerprints of the content of the inputs,
+    so a plugin whose inputs did not change is not executed again.
+    The partitions of a plugin are cached the same way, so only the
+    partitions whose inputs changed are executed again.
+    Results unused for longer than max_age are evicted, then the least
+    recently used ones until the cache fits in max_size.
+
+    Attributes
+    ----------
+    path : Path
+        Cache folder.
+    max_size : int
+        Maximum size in bytes of the cache.
+    max_age : int
+        Maximum time in seconds a result is kept without being used.
+    """
+
+    def __init__(self, path: str | Path, max_size: int, max_age: int) -> None:
+        """
+        Constructor.
+        """
+        self.path = Path(path)
+        self.max_size = max_size
+        self.max_age = max_age
+
+    def get_key(self, plugin: Plugin, partition: bool = False) -> str | None:
+        """
+        Return the cache key of a plugin.
+
+        Parameters
+        ----------
+        plugin : Plugin
+            Plugin to execute.
+        partition : bool
+            Whether the plugin is a sub-plugin executing a partition.
+
+        Returns
+        -------
+        str | None
+            Cache key, None if the plugin has no inputs or the content
+            of an input can not be fingerprinted.
+        """
+        inputs = plugin.get_inputs()
+        if not inputs:
+            return None
+        fingerprints = []
+        for store, path in inputs:
+            fingerprint = store.get_fingerprint(path)
+            if fingerprint is None:
+                return None
+            fingerprints.append([store.store_type, path, fingerprint])
+        key = {
+            "plugin": plugin.fingerprint(),
+            "framework": plugin.get_framework(),
+            "inputs": fingerprints,
+        }
+        if partition:
+            key["partition"] = True
+        return build_hash(key)
+
+    def get(self, key: str) -> dict | Result | None:
+        """
+        Return a cached result.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        dict | Result | None
+            Plugin result, None if not cached or expired.
+        """
+        src = self.path / f"{key}.pickle"
+        try:
+            if time.time() - src.stat().st_mtime > self.max_age:
+                return None
+            with open(src, "rb") as file:
+                result = pickle.load(file)
+            os.utime(src)
+            return result
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as ex:
+            if not isinstance(ex, FileNotFoundError):
+                LOGGER.warning(f"Unable to read cached result {key}. Arguments: {str(ex.args)}")
+            return None
+
+    def set(self, key: str, result: dict | Result) -> None:
+        """
+        Cache a result. Results of failed executions are not cached.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        result : dict | Result
+            Plugin result, or result of the partition of a plugin.
+
+        Returns
+        -------
+        None
+        """
+        if isinstance(result, dict):
+            objs = listify(result.get(ResultType.FRAMEWORK.value, []))
+        else:
+            objs = [result]
+        for obj in objs:
+            if obj.status == ExecutionStatus.ERROR.value:
+                return
+        self.path.mkdir(parents=True, exist_ok=True)
+        dst = self.path / f"{key}.pickle"
+        tmp = self.path / f"{key}.{build_uuid()}.tmp"
+        try:
+            with open(tmp, "wb") as file:
+                dump(self._detach(result), file)
+            os.replace(tmp, dst)
+        except Exception as ex:
+            LOGGER.warning(f"Unable to cache result {key}. Arguments: {str(ex.args)}")
+            tmp.unlink(missing_ok=True)
+
+    @staticmethod
+    def _detach(result: dict | Result) -> dict | Result:
+        """
+        Read in memory rendered artifacts that point to temporary files.
+
+        Parameters
+        ----------
+        result : dict | Result
+            Plugin result.
+
+        Returns
+        -------
+        dict | Result
+            Plugin result that does not depend on temporary files.
+        """
+        if not isinstance(result, dict):
+            return result
+        for obj in listify(result.get(ResultType.RENDERED.value, [])):
+            if obj.artifact is None:
+                continue
+            rendered = []
+            for item in listify(obj.artifact):
+                if isinstance(item.object, (str, Path)):
+                    item = RenderTuple(BytesIO(Path(item.object).read_bytes()), item.filename)
+                rendered.append(item)
+            obj.artifact = rendered
+        return result
+
+    def evict(self) -> None:
+        """
+        Remove expired results, then the least recently used
+        results until the cache fits in its maximum size.
+
+        Returns
+        -------
+        None
+        """
+        if not self.path.exists():
+            return
+        now = time.time()
+        entries = []
+        for src in self.path.glob("*.pickle"):
+            try:
+                stat = src.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.max_age:
+                src.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, src))
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, src in sorted(entries):
+            if size <= self.max_size:
+                break
+            src.unlink(missing_ok=True)
+            size -= entry_size
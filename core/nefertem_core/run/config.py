@@ -4,6 +4,7 @@ Run configuration objects module.
 from __future__ import annotations
 
 from pydantic import BaseModel
+from typing_extensions import Literal
 
 
 class ExecConfig(BaseModel):
@@ -34,3 +35,23 @@ class RunConfig(BaseModel):
 
     num_worker: int = 10
     """Number of workers to execute operation in parallel, by default 10"""
+
+    num_fetch_worker: int = 4
+    """Number of concurrent downloads of input resources, by default 4"""
+
+    registry: Literal["memory", "stream"] = "memory"
+    """Registry of the results. With "memory" all the results are kept in memory,
+    with "stream" framework and rendered artifacts are written on disk as they
+    are produced and framework artifacts are loaded back on request, by default "memory"."""
+
+
+class CacheConfig(BaseModel):
+    """
+    Result cache configuration.
+    """
+
+    max_size: int = 1024**3
+    """Maximum size in bytes of the cache, by default 1 GB."""
+
+    max_age: int = 7 * 24 * 60 * 60
+    """Maximum time in seconds a result is kept without being used, by default 7 days."""
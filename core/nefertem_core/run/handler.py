@@ -4,18 +4,27 @@ Run handler module.
 from __future__ import annotations
 
 import concurrent.futures
+import functools
 import typing
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
 
 from nefertem_core.plugins.factory import builder_factory
 from nefertem_core.plugins.utils import ResultType
+from nefertem_core.run.registry import build_registry
+from nefertem_core.run.scheduler import Lane, Scheduler, Task
 from nefertem_core.stores.builder import get_all_input_stores
-from nefertem_core.utils.utils import flatten_list, listify
+from nefertem_core.utils.logger import LOGGER
+from nefertem_core.utils.utils import build_hash, build_uuid, flatten_list
+from pydantic import BaseModel
 
 if typing.TYPE_CHECKING:
     from nefertem_core.plugins.builder import PluginBuilder
     from nefertem_core.plugins.plugin import Plugin
+    from nefertem_core.run.cache import ResultCache
     from nefertem_core.run.config import RunConfig
+    from nefertem_core.run.pool import WorkerPool
+    from nefertem_core.stores.input.objects._base import InputStore
 
 
 class RunHandler:
@@ -30,22 +39,74 @@ class RunHandler:
         Run configuration.
     _tmp_dir : str
         Temporary directory to store artifacts.
-    _registry : dict
-        Resul registry.
+    _registry : ResultRegistry
+        Result registry.
+    _pool : WorkerPool
+        Worker pool shared by runs, used to execute multiprocess plugins.
+    _executed : set
+        Fingerprints of the plugins already executed.
+    _order : dict
+        Fingerprints of the plugins built, in build order.
+    _cache : ResultCache
+        Cache of the results shared by runs.
+    _cache_keys : dict
+        Cache keys of the plugins being executed, by fingerprint.
+    _builders : list[PluginBuilder]
+        Plugin builders, created by the first run.
+    _runs : dict
+        Fingerprints of the plugins built by every run, by run arguments.
     """
 
-    def __init__(self, config: RunConfig) -> None:
+    def __init__(
+        self,
+        config: RunConfig,
+        tmp_dir: str,
+        pool: WorkerPool | None = None,
+        cache: ResultCache | None = None,
+        run_path: str | Path | None = None,
+    ) -> None:
         """
         Constructor.
         """
         self._config = config
-        self._registry = {}
+        self._tmp_dir = tmp_dir
+        self._registry = build_registry(config.registry, self._get_registry_path(tmp_dir, run_path))
+        self._pool = pool
+        self._executed = set()
+        self._order = {}
+        self._cache = cache
+        self._cache_keys = {}
+        self._builders = None
+        self._runs = {}
+
+    @staticmethod
+    def _get_registry_path(tmp_dir: str, run_path: str | Path | None = None) -> Path:
+        """
+        Return the folder where a stream registry writes artifacts. It is
+        the registry folder of the run, kept when the run ends, or a folder
+        in the temporary directory if the run is not persisted.
+
+        Parameters
+        ----------
+        tmp_dir : str
+            Temporary directory.
+        run_path : str | Path
+            Path of the run in the output store.
+
+        Returns
+        -------
+        Path
+            Registry folder.
+        """
+        if run_path is not None:
+            return Path(run_path, "registry")
+        return Path(tmp_dir, "registry", build_uuid())
 
     #############################
     # Execution methods
     #############################
 
-    def run(self, *args, **kwargs) -> None:
+    def run(self, *args, **kwargs) -> list[str]:
         """
         Run plugins.
 
@@ -64,10 +125,98 @@ class RunHandler:
             Arguments.
         kwargs : Any
             Keyword arguments.
+
+        Returns
+        -------
+        list[str]
+            Fingerprints of the plugins built for the arguments, to retrieve their results.
+        """
+        # Plugins are built once for the same arguments, e.g. when the
+        # framework and the nefertem results of a validation are requested
+        run_key = self._get_run_key(args, kwargs)
+        if run_key in self._runs:
+            return list(self._runs[run_key])
+        if self._builders is None:
+            self._builders = self._get_builder()
+        plugins = self._create_plugins(self._builders, *args, **kwargs)
+
+        # Execute once the work of plugins, skipping the work already done in the run
+        keys = [plugin.fingerprint() for plugin in plugins]
+        self._order.update(dict.fromkeys(keys))
+        to_execute = {}
+        for key, plugin in zip(keys, plugins):
+            if key not in self._executed and key not in to_execute:
+                to_execute[key] = plugin
+        to_execute = self._load_cached(to_execute)
+        self._scheduler(to_execute)
+        self._executed.update(to_execute)
+        if self._cache is not None:
+            self._cache.evict()
+        self._runs[run_key] = list(dict.fromkeys(keys))
+        return list(self._runs[run_key])
+
+    @staticmethod
+    def _get_run_key(args: tuple, kwargs: dict) -> str:
+        """
+        Return a key of the arguments of a run.
+
+        Parameters
+        ----------
+        args : tuple
+            Arguments.
+        kwargs : dict
+            Keyword arguments.
+
+        Returns
+        -------
+        str
+            Key of the arguments.
+        """
+
+        def dump(value: Any) -> Any:
+            if isinstance(value, BaseModel):
+                return value.dict()
+            if isinstance(value, (list, tuple)):
+                return [dump(i) for i in value]
+            if isinstance(value, dict):
+                return {k: dump(v) for k, v in value.items()}
+            return value
+
+        return build_hash({"args": dump(args), "kwargs": dump(kwargs)})
+
+    def _load_cached(self, plugins: dict[str, Plugin]) -> dict[str, Plugin]:
         """
-        builders = self._get_builder()
-        plugins = self._create_plugins(builders, *args, **kwargs)
-        self._scheduler(plugins)
+        Register the cached results of plugins whose inputs did not change
+        and return the plugins to execute. Inputs are fingerprinted
+        concurrently, without being fetched.
+
+        Parameters
+        ----------
+        plugins : dict[str, Plugin]
+            Plugins by fingerprint.
+
+        Returns
+        -------
+        dict[str, Plugin]
+            Plugins without a cached result by fingerprint.
+        """
+        if self._cache is None or not plugins:
+            return plugins
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._config.num_fetch_worker) as pool:
+            cache_keys = list(pool.map(self._cache.get_key, plugins.values()))
+
+        to_execute = {}
+        for (key, plugin), cache_key in zip(plugins.items(), cache_keys):
+            result = self._cache.get(cache_key) if cache_key is not None else None
+            if result is not None:
+                LOGGER.info(f"Using cached result for plugin {plugin.id}")
+                self._register_results(result, key)
+                self._executed.add(key)
+                continue
+            if cache_key is not None:
+                self._cache_keys[key] = cache_key
+            to_execute[key] = plugin
+        return to_execute
 
     def _get_builder(self) -> list[PluginBuilder]:
         """
@@ -87,54 +236,230 @@ class RunHandler:
         """
         return flatten_list([builder.build(*args, **kwargs) for builder in builders])
 
-    def _scheduler(self, plugins: list[Plugin]) -> None:
+    def _scheduler(self, plugins: dict[str, Plugin]) -> None:
         """
         Schedule execution to avoid multiprocessing issues.
         """
-        multiprocess = []
-        multithreading = []
-        sequential = []
-
-        for plugin in plugins:
-            # Concurrent execution
-            if self._config.parallel:
-                if plugin.exec_multiprocess:
-                    multiprocess.append(plugin)
-                elif plugin.exec_multithread:
-                    multithreading.append(plugin)
-            # Sequential execution
-            else:
-                sequential.append(plugin)
+        if self._config.parallel:
+            self._graph_execute(plugins)
+        else:
+            self._prefetch(plugins)
+            self._sequential_execute(plugins)
 
-        self._sequential_execute(sequential)
-        self._pool_execute_multithread(multithreading)
-        self._pool_execute_multiprocess(multiprocess)
+    @staticmethod
+    def _collect_inputs(plugins: dict[str, Plugin]) -> dict[str, tuple[InputStore, str, int]]:
+        """
+        Collect the distinct inputs read by plugins.
 
-    def _sequential_execute(self, plugins: list[Plugin]) -> None:
+        Parameters
+        ----------
+        plugins : dict[str, Plugin]
+            Plugins by fingerprint.
+
+        Returns
+        -------
+        dict[str, tuple[InputStore, str, int]]
+            Mapping between input key and (store, path, number of plugins that read it).
+        """
+        inputs = {}
+        for plugin in plugins.values():
+            for store, path in plugin.get_inputs():
+                key = f"fetch:{store.name}:{path}"
+                _, _, count = inputs.get(key, (store, path, 0))
+                inputs[key] = (store, path, count + 1)
+        return inputs
+
+    def _prefetch(self, plugins: dict[str, Plugin]) -> None:
+        """
+        Fetch once all the inputs read by plugins, with a bounded number
+        of concurrent downloads. Plugins then find their inputs in the
+        stores cache.
+        """
+        inputs = self._collect_inputs(plugins)
+        if not inputs:
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._config.num_fetch_worker) as pool:
+            for store, path, _ in inputs.values():
+                pool.submit(self._fetch, store, path)
+
+    def _sequential_execute(self, plugins: dict[str, Plugin]) -> None:
         """
         Execute operations in sequence.
         """
-        for plugin in plugins:
+        for key, plugin in plugins.items():
             data = self._execute(plugin)
-            self._register_results(data)
+            self._register_results(data, key)
+
+    def _graph_execute(self, plugins: dict[str, Plugin]) -> None:
+        """
+        Execute operations as a dependency graph.
+
+        Every input declared by the plugins is fetched once by a dedicated
+        task, and a plugin starts as soon as its own inputs are available,
+        so fetching a resource overlaps with the execution of the plugins
+        that use the resources already fetched. Multiprocess, multithread
+        and sequential plugins run concurrently on their own lanes.
+        Plugins are pickled only when dispatched, so multiprocess plugins
+        receive stores whose cache already holds their inputs.
+        Plugins that support partitioning are split once their inputs are
+        fetched, and their partitions are executed as independent tasks
+        whose results are merged into the result of the plugin.
+        Results are registered as soon as they are produced, and
+        get_item returns them in build order.
+        """
+        scheduler = Scheduler(self._get_capacity(), self._get_executors())
+
+        # Fetch first the inputs needed by most plugins
+        for key, (store, path, count) in self._collect_inputs(plugins).items():
+            scheduler.add_task(Task(key, self._fetch, (store, path), Lane.IO.value, priority=-count))
+
+        for key, plugin in plugins.items():
+            depends_on = []
+            for store, path in plugin.get_inputs():
+                fetch_key = f"fetch:{store.name}:{path}"
+                if fetch_key not in depends_on:
+                    depends_on.append(fetch_key)
+            callback = functools.partial(self._register_results, key=key)
+            if plugin.exec_partition:
+                task = Task(
+                    f"partition:{plugin.id}",
+                    self._partition,
+                    (plugin,),
+                    self._get_lane(plugin),
+                    callback=functools.partial(self._expand, scheduler, plugin, callback),
+                )
+            else:
+                task = Task(
+                    f"plugin:{plugin.id}",
+                    self._execute,
+                    (plugin,),
+                    self._get_lane(plugin),
+                    callback=callback,
+                )
+            scheduler.add_task(task, depends_on)
+        scheduler.run()
+
+    def _expand(self, scheduler: Scheduler, plugin: Plugin, callback: Callable, partitions: list[Plugin]) -> None:
+        """
+        Add to the graph the tasks that execute the partitions of a plugin
+        and the task that merges their results. Partitions with a cached
+        result are not executed. If the plugin was not split, add the task
+        that executes the plugin as a whole.
+
+        Parameters
+        ----------
+        scheduler : Scheduler
+            Scheduler executing the graph.
+        plugin : Plugin
+            Partitioned plugin.
+        callback : Callable
+            Function called with the result of the plugin.
+        partitions : list[Plugin]
+            Sub-plugins returned by the plugin partition method.
+
+        Returns
+        -------
+        None
+        """
+        lane = self._get_lane(plugin)
+        if not partitions:
+            scheduler.add_task(Task(f"plugin:{plugin.id}", self._execute, (plugin,), lane, callback=callback))
+            return
+
+        results = [None] * len(partitions)
+        keys = []
+        for idx, part in enumerate(partitions):
+            # Partitions whose inputs did not change are not executed again
+            cache_key = self._cache.get_key(part, partition=True) if self._cache is not None else None
+            result = self._cache.get(cache_key) if cache_key is not None else None
+            if result is not None:
+                LOGGER.info(f"Using cached result for partition {idx} of plugin {plugin.id}")
+                results[idx] = result
+                continue
+            key = f"plugin:{plugin.id}:{idx}"
+            task = Task(
+                key,
+                self._execute_partition,
+                (part,),
+                lane,
+                callback=functools.partial(self._set_partition, results, idx, cache_key),
+            )
+            scheduler.add_task(task)
+            keys.append(key)
+        task = Task(f"merge:{plugin.id}", self._merge, (plugin, results), Lane.THREAD.value, callback=callback)
+        scheduler.add_task(task, keys)
+
+    def _get_capacity(self) -> dict[str, int]:
+        """
+        Return the number of workers for every lane.
 
-    def _pool_execute_multiprocess(self, plugins: list[Plugin]) -> None:
+        Returns
+        -------
+        dict[str, int]
+            Number of workers by lane.
         """
-        Instantiate a concurrent.future.ProcessPoolExecutor pool to execute operations in
-        multiprocessing.
+        return {
+            Lane.IO.value: self._config.num_fetch_worker,
+            Lane.THREAD.value: self._config.num_worker,
+            Lane.PROCESS.value: self._config.num_worker if self._pool is None else self._pool.num_worker,
+            Lane.SEQUENTIAL.value: 1,
+        }
+
+    def _get_executors(self) -> dict:
         """
-        with concurrent.futures.ProcessPoolExecutor(max_workers=self._config.num_worker) as pool:
-            for data in pool.map(self._execute, plugins):
-                self._register_results(data)
+        Return the executors shared with other runs.
 
-    def _pool_execute_multithread(self, plugins: list[Plugin]) -> None:
+        Returns
+        -------
+        dict
+            Executors by lane.
         """
-        Instantiate a concurrent.future.ThreadPoolExecutor pool to execute operations in
-        multithreading.
+        if self._pool is None:
+            return {}
+        return {Lane.PROCESS.value: self._pool.get_executor()}
+
+    @staticmethod
+    def _get_lane(plugin: Plugin) -> str:
         """
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self._config.num_worker) as pool:
-            for data in pool.map(self._execute, plugins):
-                self._register_results(data)
+        Return the lane where a plugin is executed.
+
+        Parameters
+        ----------
+        plugin : Plugin
+            Plugin to execute.
+
+        Returns
+        -------
+        str
+            Lane.
+        """
+        if plugin.exec_multiprocess:
+            return Lane.PROCESS.value
+        if plugin.exec_multithread:
+            return Lane.THREAD.value
+        return Lane.SEQUENTIAL.value
+
+    @staticmethod
+    def _fetch(store: InputStore, path: str) -> None:
+        """
+        Fetch an input into the store cache. Errors are only logged,
+        plugins fetch their inputs again and report the failure.
+
+        Parameters
+        ----------
+        store : InputStore
+            Store where the input is located.
+        path : str
+            Input path.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            store.fetch_file(path)
+        except Exception as ex:
+            LOGGER.warning(f"Unable to prefetch {path} from store {store.name}. Arguments: {str(ex.args)}")
 
     @staticmethod
     def _execute(plugin: Plugin) -> dict:
@@ -146,11 +471,70 @@ class RunHandler:
         """
         return plugin.execute()
 
+    @staticmethod
+    def _partition(plugin: Plugin) -> list[Plugin]:
+        """
+        Split a plugin into sub-plugins. Errors are only logged,
+        the plugin is then executed as a whole.
+
+        Parameters
+        ----------
+        plugin : Plugin
+            Plugin to split.
+
+        Returns
+        -------
+        list[Plugin]
+            List of sub-plugins.
+        """
+        try:
+            return plugin.partition()
+        except Exception as ex:
+            LOGGER.warning(f"Unable to partition plugin {plugin.id}. Arguments: {str(ex.args)}")
+            return []
+
+    @staticmethod
+    def _execute_partition(plugin: Plugin) -> Any:
+        """
+        Execute a sub-plugin returned by a plugin partition method.
+        """
+        return plugin.execute_partition()
+
+    def _set_partition(self, results: list[Any], idx: int, cache_key: str | None, result: Any) -> None:
+        """
+        Collect the result of a partition and cache it.
+
+        Parameters
+        ----------
+        results : list[Any]
+            Results of the partitions of a plugin.
+        idx : int
+            Partition index.
+        cache_key : str | None
+            Cache key of the partition, None if not cached.
+        result : Any
+            Result of the partition.
+
+        Returns
+        -------
+        None
+        """
+        results[idx] = result
+        if cache_key is not None:
+            self._cache.set(cache_key, result)
+
+    @staticmethod
+    def _merge(plugin: Plugin, results: list[Any]) -> dict:
+        """
+        Merge the results of the sub-plugins into the result of the plugin.
+        """
+        return plugin.merge_partitions(results)
+
     #############################
     # Registry methods
     #############################
 
-    def _register_results(self, result: dict) -> None:
+    def _register_results(self, result: dict, key: str) -> None:
         """
         Register results.
 
@@ -158,20 +542,19 @@ class RunHandler:
         ----------
         result : dict
             Result dictionary.
+        key : str
+            Fingerprint of the plugin that produced the result.
 
         Returns
         -------
         None
         """
-        for key, value in result.items():
-            if key not in self._registry:
-                self._registry[key] = []
-            if isinstance(value, list):
-                self._registry[key].extend(value)
-            else:
-                self._registry[key].append(value)
+        self._registry.register(result, key)
+        cache_key = self._cache_keys.pop(key, None)
+        if cache_key is not None:
+            self._cache.set(cache_key, result)
 
-    def get_item(self, item_type: str) -> list[Any]:
+    def get_item(self, item_type: str, keys: list[str] | None = None) -> list[Any]:
         """
         Get item from registry.
 
@@ -179,20 +562,15 @@ class RunHandler:
         ----------
         item_type : str
             Item type.
+        keys : list[str]
+            Fingerprints returned by run. If None, return the items of all the plugins executed.
 
         Returns
         -------
         list[Any]
-            List of object.
+            List of object, in the order of the given fingerprints or in build order.
         """
-        objects = self._registry.get(item_type, [])
-
-        # Get artifacts and nefertem report
-        if item_type in [ResultType.FRAMEWORK.value, ResultType.NEFERTEM.value]:
-            return [obj.artifact for obj in objects]
-
-        # Get rendered
-        return listify(flatten_list([obj.artifact for obj in objects]))
+        return self._registry.get_item(item_type, keys if keys is not None else list(self._order))
 
     def get_libraries(self) -> list[dict]:
         """
@@ -203,8 +581,4 @@ class RunHandler:
         list[dict]
             List of libraries.
         """
-        libs = []
-        for i in self._registry.get(ResultType.LIBRARY.value, []):
-            if dict(**i) not in libs:
-                libs.append(i)
-        return libs
+        return self._registry.get_item(ResultType.LIBRARY.value)
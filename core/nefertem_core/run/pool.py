@@ -0,0 +1,113 @@
+"""
+Worker pool module.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import importlib
+
+from nefertem_core.utils.exceptions import RunError
+from nefertem_core.utils.logger import LOGGER
+
+
+def _warmup(modules: list[str]) -> None:
+    """
+    Worker initializer. Import plugins modules, and with them the
+    frameworks they depend on, once for the whole worker life.
+
+    Parameters
+    ----------
+    modules : list[str]
+        Modules to import.
+
+    Returns
+    -------
+    None
+    """
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError as ex:
+            LOGGER.warning(f"Unable to import module {module} in worker. Arguments: {str(ex.args)}")
+
+
+def _ping() -> None:
+    """
+    No-op task used to start workers.
+    """
+
+
+class WorkerPool:
+    """
+    Long-lived pool of worker processes.
+
+    The pool is started once and reused by every run that executes
+    multiprocess plugins, so workers start-up and frameworks imports
+    are paid once instead of once per run.
+
+    Attributes
+    ----------
+    num_worker : int
+        Number of worker processes.
+    modules : list[str]
+        Modules imported by every worker at start-up.
+    """
+
+    def __init__(self, num_worker: int, modules: list[str] | None = None) -> None:
+        """
+        Constructor.
+        """
+        self.num_worker = num_worker
+        self.modules = modules if modules is not None else []
+        self._executor = None
+
+    def start(self) -> None:
+        """
+        Start the worker processes and wait until they are ready.
+
+        Returns
+        -------
+        None
+        """
+        if self._executor is not None:
+            return
+        LOGGER.info(f"Starting worker pool with {self.num_worker} workers.")
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.num_worker,
+            initializer=_warmup,
+            initargs=(self.modules,),
+        )
+        futures = [self._executor.submit(_ping) for _ in range(self.num_worker)]
+        concurrent.futures.wait(futures)
+
+    def get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        """
+        Return the executor of the pool.
+
+        Returns
+        -------
+        concurrent.futures.ProcessPoolExecutor
+            Pool executor.
+
+        Raises
+        ------
+        RunError
+            If the pool is not started.
+        """
+        if self._executor is None:
+            raise RunError("Worker pool not started.")
+        return self._executor
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes.
+
+        Returns
+        -------
+        None
+        """
+        if self._executor is None:
+            return
+        LOGGER.info("Shutting down worker pool.")
+        self._executor.shutdown(wait=True)
+        self._executor = None
@@ -0,0 +1,240 @@
+"""
+Result registry module.
+"""
+from __future__ import annotations
+
+import pickle
+from enum import Enum
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import Any
+
+from nefertem_core.plugins.utils import RenderTuple, ResultType
+from nefertem_core.utils.io_utils import write_json, write_object
+from nefertem_core.utils.pickle_utils import dump
+from nefertem_core.utils.utils import build_uuid, listify
+
+
+class RegistryMode(Enum):
+    """
+    Enum class for the modes of the result registry.
+    """
+
+    MEMORY = "memory"
+    STREAM = "stream"
+
+
+class ResultRegistry:
+    """
+    Registry of the results produced by plugins.
+
+    Results are unpacked once when registered, so that retrieving them
+    does not require to flatten them again. Every item is registered with
+    the fingerprint of the plugin that produced it.
+
+    Attributes
+    ----------
+    _items : dict
+        Registered (fingerprint, item) tuples by result type.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._items = {result_type.value: [] for result_type in ResultType}
+
+    def register(self, result: dict, key: str) -> None:
+        """
+        Register the result of a plugin. Values can be a single
+        result or a list of results.
+
+        Parameters
+        ----------
+        result : dict
+            Result dictionary.
+        key : str
+            Fingerprint of the plugin that produced the result.
+
+        Returns
+        -------
+        None
+        """
+        for item_type, value in result.items():
+            items = self._items.setdefault(item_type, [])
+            for obj in listify(value):
+                if item_type == ResultType.LIBRARY.value:
+                    if obj not in [lib for _, lib in items]:
+                        items.append((key, obj))
+                elif item_type == ResultType.RENDERED.value:
+                    if obj.artifact is not None:
+                        items.extend((key, self._store_rendered(rendered)) for rendered in listify(obj.artifact))
+                elif item_type == ResultType.FRAMEWORK.value:
+                    items.append((key, self._store_framework(obj.artifact)))
+                else:
+                    items.append((key, obj.artifact))
+
+    def get_item(self, item_type: str, keys: list[str] | None = None) -> list[Any]:
+        """
+        Get items from registry.
+
+        Parameters
+        ----------
+        item_type : str
+            Item type.
+        keys : list[str]
+            Fingerprints of the plugins whose items are returned, in the
+            given order. If None, return all the items.
+
+        Returns
+        -------
+        list[Any]
+            List of object.
+        """
+        items = self._items.get(item_type, [])
+        if keys is not None:
+            order = {key: idx for idx, key in enumerate(keys)}
+            items = sorted((item for item in items if item[0] in order), key=lambda item: order[item[0]])
+        objects = [obj for _, obj in items]
+        if item_type == ResultType.FRAMEWORK.value:
+            return [self._load_framework(obj) for obj in objects]
+        return objects
+
+    def _store_framework(self, obj: Any) -> Any:
+        """
+        Store a framework artifact.
+        """
+        return obj
+
+    def _load_framework(self, obj: Any) -> Any:
+        """
+        Load a framework artifact.
+        """
+        return obj
+
+    def _store_rendered(self, obj: RenderTuple) -> RenderTuple:
+        """
+        Store a rendered artifact.
+        """
+        return obj
+
+
+class StreamRegistry(ResultRegistry):
+    """
+    Registry that writes framework and rendered artifacts on disk as
+    soon as they are registered, keeping in memory only the nefertem
+    reports. Framework artifacts are loaded back when requested, rendered
+    artifacts are kept as files ready to be persisted.
+
+    Attributes
+    ----------
+    _path : Path
+        Folder where artifacts are written.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Constructor.
+        """
+        super().__init__()
+        self._path = Path(path)
+
+    def _store_framework(self, obj: Any) -> Path:
+        """
+        Write a framework artifact on disk.
+
+        Parameters
+        ----------
+        obj : Any
+            Framework artifact.
+
+        Returns
+        -------
+        Path
+            Path to the pickled artifact.
+        """
+        self._path.mkdir(parents=True, exist_ok=True)
+        dst = self._path / f"{build_uuid()}.pickle"
+        with open(dst, "wb") as file:
+            dump(obj, file)
+        return dst
+
+    def _load_framework(self, obj: Path) -> Any:
+        """
+        Load a framework artifact from disk.
+
+        Parameters
+        ----------
+        obj : Path
+            Path to the pickled artifact.
+
+        Returns
+        -------
+        Any
+            Framework artifact.
+        """
+        with open(obj, "rb") as file:
+            return pickle.load(file)
+
+    def _store_rendered(self, obj: RenderTuple) -> RenderTuple:
+        """
+        Write a rendered artifact on disk. Files are left where they are.
+
+        Parameters
+        ----------
+        obj : RenderTuple
+            Rendered artifact.
+
+        Returns
+        -------
+        RenderTuple
+            Rendered artifact pointing to the written file.
+        """
+        if isinstance(obj.object, dict):
+            dst = self._get_path(obj.filename)
+            write_json(obj.object, dst)
+        elif isinstance(obj.object, (BytesIO, StringIO)):
+            dst = self._get_path(obj.filename)
+            write_object(obj.object, dst)
+        else:
+            return obj
+        return RenderTuple(dst, obj.filename)
+
+    def _get_path(self, filename: str) -> Path:
+        """
+        Return a unique path for a rendered artifact.
+
+        Parameters
+        ----------
+        filename : str
+            Artifact filename.
+
+        Returns
+        -------
+        Path
+            Destination path.
+        """
+        dst = self._path / build_uuid()
+        dst.mkdir(parents=True, exist_ok=True)
+        return dst / filename
+
+
+def build_registry(mode: str, path: str | Path) -> ResultRegistry:
+    """
+    Build a result registry.
+
+    Parameters
+    ----------
+    mode : str
+        Registry mode.
+    path : str | Path
+        Folder where a stream registry writes artifacts.
+
+    Returns
+    -------
+    ResultRegistry
+        Result registry.
+    """
+    if mode == RegistryMode.STREAM.value:
+        return StreamRegistry(path)
+    return ResultRegistry()
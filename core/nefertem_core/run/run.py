@@ -12,6 +12,7 @@ from nefertem_core.readers.builder import build_reader
 from nefertem_core.run.status import RunStatus
 from nefertem_core.stores.builder import get_all_input_stores, get_input_store, get_output_store
 from nefertem_core.utils.commons import FILE_READER
+from nefertem_core.utils.describe import evict_descriptions
 from nefertem_core.utils.logger import LOGGER
 from nefertem_core.utils.utils import get_time, listify
 
@@ -144,6 +145,7 @@ class Run:
         """
         for store in get_all_input_stores():
             store.clean_paths()
+        evict_descriptions()
         try:
             shutil.rmtree(self._tmp_dir)
         except FileNotFoundError:
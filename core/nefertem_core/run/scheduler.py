@@ -0,0 +1,295 @@
+"""
+Run scheduler module.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import heapq
+import itertools
+import pickle
+from enum import Enum
+from typing import Any, Callable
+
+from nefertem_core.run.pool import _ping
+from nefertem_core.utils.exceptions import RunError
+from nefertem_core.utils.pickle_utils import dumps
+
+
+def _call_pickled(fnc: Callable, *args) -> bytes:
+    """
+    Call a function in a worker process and return its result pickled
+    with the reducers registered by plugins.
+
+    Parameters
+    ----------
+    fnc : Callable
+        Function to call.
+    args : Any
+        Arguments passed to the function.
+
+    Returns
+    -------
+    bytes
+        Pickled result.
+    """
+    return dumps(fnc(*args))
+
+
+class Lane(Enum):
+    """
+    Enum class for the executor lanes a task can be dispatched to.
+    """
+
+    IO = "io"
+    THREAD = "thread"
+    PROCESS = "process"
+    SEQUENTIAL = "sequential"
+
+
+class Task:
+    """
+    Node of the execution graph.
+
+    Attributes
+    ----------
+    key : str
+        Unique identifier of the task.
+    fnc : Callable
+        Function executed by the task.
+    args : tuple
+        Arguments passed to the function.
+    lane : str
+        Lane where the task is executed.
+    priority : int
+        Priority of the task. Tasks with lower values are dispatched first.
+    callback : Callable
+        Function called in the scheduler thread with the task result.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        fnc: Callable,
+        args: tuple,
+        lane: str,
+        priority: int = 0,
+        callback: Callable | None = None,
+    ) -> None:
+        """
+        Constructor.
+        """
+        self.key = key
+        self.fnc = fnc
+        self.args = args
+        self.lane = lane
+        self.priority = priority
+        self.callback = callback
+
+        self.dependencies: set[str] = set()
+        self.dependents: list[str] = []
+
+
+class Scheduler:
+    """
+    Scheduler that executes a graph of tasks.
+
+    A task is dispatched as soon as all its dependencies are completed.
+    Every lane is backed by its own executor, and a lane never receives
+    more tasks than it has workers, so that the order of dispatch follows
+    the priority of the ready tasks instead of the executors internal queues.
+    Results of tasks executed by worker processes are pickled with the
+    reducers registered by plugins.
+    Tasks can be added while the graph is executed by the callbacks of
+    completed tasks, so a task can expand into further tasks.
+
+    Attributes
+    ----------
+    _capacity : dict
+        Number of workers for every lane.
+    _tasks : dict
+        Registered tasks.
+    _executors : dict
+        Executors provided by the caller by lane. They are not shut down
+        at the end of the execution.
+    _pending : dict
+        Number of uncompleted dependencies by task.
+    _completed : set
+        Keys of the completed tasks.
+    _ready : list
+        Heap of the tasks ready to be dispatched.
+    """
+
+    def __init__(
+        self,
+        capacity: dict[str, int],
+        executors: dict[str, concurrent.futures.Executor] | None = None,
+    ) -> None:
+        """
+        Constructor.
+        """
+        self._capacity = capacity
+        self._tasks: dict[str, Task] = {}
+        self._executors = executors if executors is not None else {}
+        self._pending: dict[str, int] = {}
+        self._completed: set[str] = set()
+        self._ready: list = []
+        self._counter = itertools.count()
+
+    def add_task(self, task: Task, depends_on: list[str] | None = None) -> None:
+        """
+        Register a task in the graph.
+
+        Parameters
+        ----------
+        task : Task
+            Task to register.
+        depends_on : list[str]
+            Keys of the tasks that must be completed before the task starts.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        RunError
+            If a task with the same key is already registered or a dependency is missing.
+        """
+        if task.key in self._tasks:
+            raise RunError(f"Task {task.key} already scheduled.")
+        for key in depends_on or []:
+            if key not in self._tasks:
+                raise RunError(f"Dependency {key} of task {task.key} not scheduled.")
+            task.dependencies.add(key)
+            if key not in self._completed:
+                self._tasks[key].dependents.append(task.key)
+        self._tasks[task.key] = task
+        self._pending[task.key] = len(task.dependencies - self._completed)
+        if self._pending[task.key] == 0:
+            self._push(task)
+
+    def _push(self, task: Task) -> None:
+        """
+        Add a task to the ready queue.
+
+        Parameters
+        ----------
+        task : Task
+            Task ready to be dispatched.
+
+        Returns
+        -------
+        None
+        """
+        heapq.heappush(self._ready, (task.priority, next(self._counter), task))
+
+    def run(self) -> None:
+        """
+        Execute the graph.
+
+        Returns
+        -------
+        None
+        """
+        executors = dict(self._executors)
+        try:
+            # Fork the worker processes before the threads of the other lanes
+            # are started, a process forked while a thread holds a lock can hang
+            if any(task.lane == Lane.PROCESS.value for task in self._tasks.values()):
+                self._get_executor(executors, Lane.PROCESS.value).submit(_ping).result()
+            self._run(executors)
+        finally:
+            for lane, executor in executors.items():
+                if lane not in self._executors:
+                    executor.shutdown(wait=True)
+
+    def _run(self, executors: dict) -> None:
+        """
+        Dispatch loop.
+
+        Parameters
+        ----------
+        executors : dict
+            Executors by lane, lazily populated.
+
+        Returns
+        -------
+        None
+        """
+        running = {}
+        busy = {lane.value: 0 for lane in Lane}
+
+        while self._ready or running:
+            deferred = []
+            while self._ready:
+                item = heapq.heappop(self._ready)
+                task = item[2]
+                if busy[task.lane] >= self._capacity.get(task.lane, 1):
+                    deferred.append(item)
+                    continue
+                executor = self._get_executor(executors, task.lane)
+                if task.lane == Lane.PROCESS.value:
+                    future = executor.submit(_call_pickled, task.fnc, *task.args)
+                else:
+                    future = executor.submit(task.fnc, *task.args)
+                running[future] = task
+                busy[task.lane] += 1
+            for item in deferred:
+                heapq.heappush(self._ready, item)
+
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                busy[task.lane] -= 1
+                self._completed.add(task.key)
+                result = future.result()
+                if task.lane == Lane.PROCESS.value:
+                    result = pickle.loads(result)
+                self._complete(task, result)
+                for key in task.dependents:
+                    self._pending[key] -= 1
+                    if self._pending[key] == 0:
+                        self._push(self._tasks[key])
+
+    @staticmethod
+    def _complete(task: Task, result: Any) -> None:
+        """
+        Call the task callback with the result of the execution.
+
+        Parameters
+        ----------
+        task : Task
+            Completed task.
+        result : Any
+            Task result.
+
+        Returns
+        -------
+        None
+        """
+        if task.callback is not None:
+            task.callback(result)
+
+    def _get_executor(self, executors: dict, lane: str) -> concurrent.futures.Executor:
+        """
+        Return the executor of a lane, creating it if needed.
+
+        Parameters
+        ----------
+        executors : dict
+            Executors by lane.
+        lane : str
+            Lane.
+
+        Returns
+        -------
+        concurrent.futures.Executor
+            Executor of the lane.
+        """
+        if lane not in executors:
+            workers = self._capacity.get(lane, 1)
+            if lane == Lane.PROCESS.value:
+                executors[lane] = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+            else:
+                executors[lane] = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        return executors[lane]
@@ -3,9 +3,10 @@ Abstract class for artifact store.
 """
 from __future__ import annotations
 
+import threading
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable
 
 from nefertem_core.utils.logger import LOGGER
 from nefertem_core.utils.utils import build_uuid
@@ -61,10 +62,36 @@ class InputStore(metaclass=ABCMeta):
 
         # Path registry
         self._cache = {}
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+        # Functions called at the end of a run
+        self._cleanups = {}
 
         # Logger
         self.logger = LOGGER
 
+    def __getstate__(self) -> dict:
+        """
+        Drop locks when the store is pickled, e.g. to be sent to
+        another process with a plugin. The path registry is kept,
+        so resources already fetched are not downloaded again.
+        Cleanup functions stay with the store of the main process.
+        """
+        state = self.__dict__.copy()
+        del state["_locks"]
+        del state["_locks_guard"]
+        state["_cleanups"] = {}
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore locks after unpickling.
+        """
+        self.__dict__.update(state)
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
     ############################
     # Read methods
     ############################
@@ -75,12 +102,36 @@ class InputStore(metaclass=ABCMeta):
         Return the temporary path where a resource it is stored.
         """
 
+    def fetch_buffer(self, src: str) -> BinaryIO:
+        """
+        Return a seekable binary file object to read a resource. By default
+        the resource is fetched and the local file opened, stores that can
+        read ranges of a resource override it to avoid the download.
+        """
+        return open(self.fetch_file(src), "rb")
+
+    def reads_ranges(self) -> bool:
+        """
+        Return whether fetch_buffer reads ranges of a resource without
+        fetching it, i.e. whether the store overrides it. Readers of other
+        stores read the fetched local file.
+        """
+        return type(self).fetch_buffer is not InputStore.fetch_buffer
+
     @abstractmethod
     def fetch_native(self, src: str) -> Any:
         """
         Return a native format path for a resource.
         """
 
+    def get_fingerprint(self, src: str) -> str | None:
+        """
+        Return a fingerprint of the content of a resource that changes when
+        the resource changes, without reading it. Return None if the store
+        can not provide one.
+        """
+        return None
+
     ############################
     # Cache methods
     ############################
@@ -98,8 +149,49 @@ class InputStore(metaclass=ABCMeta):
         if key not in self._cache:
             self._cache[key] = path
 
+    def _lock_resource(self, key: str) -> threading.Lock:
+        """
+        Method to return the lock of a resource. Holding it while fetching
+        ensures that a resource requested concurrently is downloaded once.
+        """
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _get_temp_path(self, filename: str) -> Path:
+        """
+        Method to return a path in the temporary download folder, creating the folder if needed.
+        """
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        return self.temp_dir / filename
+
+    def register_cleanup(self, key: str, fnc: Callable[[], None]) -> None:
+        """
+        Register a function called when the store is cleaned at the end of
+        a run, e.g. to release the connections opened by a reader. A function
+        registered again with the same key replaces the previous one.
+
+        Parameters
+        ----------
+        key : str
+            Key of the function.
+        fnc : Callable[[], None]
+            Function without arguments.
+
+        Returns
+        -------
+        None
+        """
+        self._cleanups[key] = fnc
+
     def clean_paths(self) -> None:
         """
-        Delete all temporary paths references from stores.
+        Delete all temporary paths references from stores
+        and call the registered cleanup functions.
         """
         self._cache = {}
+        cleanups, self._cleanups = self._cleanups, {}
+        for key, fnc in cleanups.items():
+            try:
+                fnc()
+            except Exception as ex:
+                self.logger.warning(f"Unable to clean up {key} of store {self.name}. Arguments: {str(ex.args)}")
@@ -47,6 +47,26 @@ class LocalInputStore(InputStore):
         """
         return Path(src)
 
+    def get_fingerprint(self, src: str) -> str | None:
+        """
+        Return a fingerprint of a file made of its modification time and size.
+
+        Parameters
+        ----------
+        src : str
+            The name of the file.
+
+        Returns
+        -------
+        str | None
+            The fingerprint of the file, None if the file can not be accessed.
+        """
+        try:
+            stat = Path(src).stat()
+        except OSError:
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
     def fetch_native(self, src: str) -> Path:
         """
         Return a native format path for a resource.
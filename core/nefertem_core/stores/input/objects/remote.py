@@ -62,15 +62,42 @@ class RemoteInputStore(InputStore):
             The location of the requested file.
         """
         key = f"{src}_file"
-        cached = self._get_resource(key)
-        if cached is not None:
-            return cached
-
-        self.logger.info(f"Fetching resource {src} from store {self.name}")
-        dst = self.temp_dir / self._get_filename(src)
-        filepath = self._download_file(src, dst)
-        self._register_resource(key, filepath)
-        return filepath
+        with self._lock_resource(key):
+            cached = self._get_resource(key)
+            if cached is not None:
+                return cached
+
+            self.logger.info(f"Fetching resource {src} from store {self.name}")
+            dst = self._get_temp_path(self._get_filename(src))
+            filepath = self._download_file(src, dst)
+            self._register_resource(key, filepath)
+            return filepath
+
+    def get_fingerprint(self, src: str) -> str | None:
+        """
+        Return a fingerprint of a remote file from the ETag or the
+        Last-Modified and Content-Length headers of a HEAD request.
+
+        Parameters
+        ----------
+        src : str
+            The URL of the resource.
+
+        Returns
+        -------
+        str | None
+            The fingerprint of the file, None if the server does not provide one.
+        """
+        try:
+            r = requests.head(src, timeout=60, **self._get_auth())
+            r.raise_for_status()
+        except requests.RequestException:
+            return None
+        if "ETag" in r.headers:
+            return r.headers["ETag"]
+        if "Last-Modified" in r.headers:
+            return f"{r.headers['Last-Modified']}-{r.headers.get('Content-Length')}"
+        return None
 
     def fetch_native(self, src: str) -> str:
         """
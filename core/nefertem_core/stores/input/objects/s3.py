@@ -4,11 +4,15 @@ Implementation of S3 artifact store.
 from __future__ import annotations
 
 # pylint: disable=unused-import
+import io
+import threading
 from pathlib import Path
 from typing import Type
 
 import boto3
 import botocore.client
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from nefertem_core.stores.input.objects._base import InputStore, StoreConfig
 from nefertem_core.utils.exceptions import StoreError
@@ -34,12 +38,91 @@ class S3StoreConfig(StoreConfig):
     bucket_name: str
     """S3 bucket name."""
 
+    max_concurrency: int = 10
+    """Number of concurrent ranged requests used to download a large object, by default 10."""
+
+    max_concurrent_files: int = 8
+    """Number of objects downloaded concurrently by a run, to size the connection pool, by default 8."""
+
+    multipart_threshold: int = 8 * 1024**2
+    """Size in bytes above which an object is downloaded with ranged requests, by default 8 MB."""
+
+    multipart_chunksize: int = 8 * 1024**2
+    """Size in bytes of every ranged request, by default 8 MB."""
+
+    read_buffer_size: int = 1024**2
+    """Size in bytes of every ranged request sent by the buffers returned by fetch_buffer, by default 1 MB."""
+
+
+class S3File(io.RawIOBase):
+    """
+    Seekable read-only file object over an S3 object.
+
+    Every read is served by a ranged GET request, so readers that seek,
+    e.g. to the footer and the column chunks of a Parquet file, transfer
+    only the bytes they need, and sequential readers stream the object
+    without storing it. Wrap it in an io.BufferedReader to send requests
+    of a fixed size.
+    """
+
+    def __init__(self, client: S3Client, bucket: str, key: str) -> None:
+        """
+        Constructor.
+        """
+        super().__init__()
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._size = client.head_object(Bucket=bucket, Key=key)["ContentLength"]
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Move the position in the object.
+        """
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence {whence}.")
+        if pos < 0:
+            raise ValueError("Negative seek position.")
+        self._pos = pos
+        return self._pos
+
+    def readinto(self, buffer: bytearray) -> int:
+        """
+        Read bytes from the current position with a ranged request.
+        """
+        if self._pos >= self._size or not len(buffer):
+            return 0
+        end = min(self._pos + len(buffer), self._size) - 1
+        response = self._client.get_object(Bucket=self._bucket, Key=self._key, Range=f"bytes={self._pos}-{end}")
+        data = response["Body"].read()
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
 
 class S3InputStore(InputStore):
     """
     S3 artifact store object.
 
     Allows the client to interact with S3 based storages.
+    The store keeps a single client, shared by all the downloads, and
+    checks the access to the bucket once until its paths are cleaned.
 
     """
 
@@ -49,6 +132,26 @@ class S3InputStore(InputStore):
         """
         super().__init__(name, store_type, temp_dir)
         self.config = config
+        self._client = None
+        self._access_checked = False
+        self._client_guard = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """
+        Drop the client when the store is pickled, another
+        process builds its own client on first use.
+        """
+        state = super().__getstate__()
+        state["_client"] = None
+        del state["_client_guard"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore the client lock after unpickling.
+        """
+        super().__setstate__(state)
+        self._client_guard = threading.Lock()
 
     ############################
     # Read methods
@@ -69,15 +172,58 @@ class S3InputStore(InputStore):
             The location of the requested file.
         """
         key = f"{src}_file"
-        cached = self._get_resource(key)
+        with self._lock_resource(key):
+            cached = self._get_resource(key)
+            if cached is not None:
+                return cached
+
+            self.logger.info(f"Fetching resource {src} from store {self.name}")
+            dst = self._get_key_path(src)
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            filepath = self._download_file(src, str(dst))
+            self._register_resource(key, filepath)
+            return filepath
+
+    def fetch_buffer(self, src: str) -> io.BufferedReader:
+        """
+        Return a seekable file object that reads the resource with ranged
+        requests, without downloading it.
+
+        Parameters
+        ----------
+        src : str
+            Key of the resource.
+
+        Returns
+        -------
+        io.BufferedReader
+            File object over the S3 object.
+        """
+        cached = self._get_resource(f"{src}_file")
         if cached is not None:
-            return cached
+            return open(cached, "rb")
+        client, bucket = self._check_factory()
+        return io.BufferedReader(S3File(client, bucket, src), buffer_size=self.config.read_buffer_size)
+
+    def get_fingerprint(self, src: str) -> str | None:
+        """
+        Return the ETag of an object.
 
-        self.logger.info(f"Fetching resource {src} from store {self.name}")
-        dst = self.temp_dir / src.split("/")[-1]
-        filepath = self._download_file(src, dst)
-        self._register_resource(key, filepath)
-        return filepath
+        Parameters
+        ----------
+        src : str
+            Key of the resource.
+
+        Returns
+        -------
+        str | None
+            The ETag of the object, None if the object can not be accessed.
+        """
+        try:
+            client, bucket = self._check_factory()
+            return client.head_object(Bucket=bucket, Key=src)["ETag"]
+        except (ClientError, StoreError):
+            return None
 
     def fetch_native(self, src: str) -> str:
         """
@@ -95,6 +241,14 @@ class S3InputStore(InputStore):
         """
         return self._get_presinged_url(src)
 
+    def clean_paths(self) -> None:
+        """
+        Delete all temporary paths references from the store. Access
+        to the bucket is checked again by the next run.
+        """
+        super().clean_paths()
+        self._access_checked = False
+
     ############################
     # Private helper methods
     ############################
@@ -110,36 +264,88 @@ class S3InputStore(InputStore):
         """
         return self.config.bucket_name
 
+    def _get_key_path(self, src: str) -> Path:
+        """
+        Return the path where an object is downloaded. The key folders are
+        kept, objects of partitioned datasets share their names.
+
+        Parameters
+        ----------
+        src : str
+            Key of the object.
+
+        Returns
+        -------
+        Path
+            Path in the temporary download folder.
+
+        Raises
+        ------
+        StoreError
+            If the key points outside the temporary download folder.
+        """
+        root = self._get_temp_path("").resolve()
+        dst = (root / src.strip("/")).resolve()
+        if root not in dst.parents:
+            raise StoreError(f"Invalid key {src}, it points outside the download folder.")
+        return dst
+
     def _get_client(self) -> S3Client:
         """
-        Get an S3 client object.
+        Get the S3 client object of the store, creating it on first use.
+        Its connection pool is sized for all the concurrent requests
+        of the store.
 
         Returns
         -------
         S3Client
             Returns a client object that interacts with the S3 storage service.
         """
-        cfg = {
-            "endpoint_url": self.config.endpoint_url,
-            "aws_access_key_id": self.config.aws_access_key_id,
-            "aws_secret_access_key": self.config.aws_secret_access_key,
-        }
-        return boto3.client("s3", **cfg)
+        if self._client is None:
+            connections = self.config.max_concurrency * self.config.max_concurrent_files
+            cfg = {
+                "endpoint_url": self.config.endpoint_url,
+                "aws_access_key_id": self.config.aws_access_key_id,
+                "aws_secret_access_key": self.config.aws_secret_access_key,
+                "config": Config(max_pool_connections=max(connections, 10)),
+            }
+            self._client = boto3.session.Session().client("s3", **cfg)
+        return self._client
 
     def _check_factory(self) -> tuple[S3Client, str]:
         """
-        Check if the S3 bucket is accessible by sending a head_bucket request.
+        Return the S3 client and the bucket name. Access to the bucket is
+        checked by sending a head_bucket request the first time only.
 
         Returns
         -------
         tuple[S3Client, str]
             A tuple containing the S3 client object and the name of the S3 bucket.
         """
-        client = self._get_client()
-        bucket = self._get_bucket()
-        self._check_access_to_storage(client, bucket)
+        with self._client_guard:
+            client = self._get_client()
+            bucket = self._get_bucket()
+            if not self._access_checked:
+                self._check_access_to_storage(client, bucket)
+                self._access_checked = True
         return client, bucket
 
+    def _get_transfer_config(self) -> TransferConfig:
+        """
+        Return the configuration of the downloads. Objects larger than
+        the threshold are downloaded with concurrent ranged requests.
+
+        Returns
+        -------
+        TransferConfig
+            Transfer configuration.
+        """
+        return TransferConfig(
+            multipart_threshold=self.config.multipart_threshold,
+            multipart_chunksize=self.config.multipart_chunksize,
+            max_concurrency=self.config.max_concurrency,
+        )
+
     @staticmethod
     def _check_access_to_storage(client: S3Client, bucket: str) -> None:
         """
@@ -172,9 +378,8 @@ class S3InputStore(InputStore):
 
     def _download_file(self, key: str, dst: str) -> Path:
         """
-        Download a file from S3 based storage. The function checks if the bucket is accessible
-        and if the destination directory exists. If the destination directory does not exist,
-        it will be created.
+        Download a file from S3 based storage. Large files are downloaded
+        with concurrent ranged requests.
 
         Parameters
         ----------
@@ -189,7 +394,7 @@ class S3InputStore(InputStore):
             The path of the downloaded file.
         """
         client, bucket = self._check_factory()
-        client.download_file(bucket, key, dst)
+        client.download_file(bucket, key, dst, Config=self._get_transfer_config())
         return Path(dst)
 
     def _get_presinged_url(self, src: str) -> str:
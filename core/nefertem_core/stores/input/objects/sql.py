@@ -3,12 +3,21 @@ Implementation of SQL artifact store.
 """
 from __future__ import annotations
 
+import datetime
+import decimal
 import re
+import threading
 from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlencode
 
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import sqlalchemy
 from nefertem_core.stores.input.objects._base import InputStore, StoreConfig
 from nefertem_core.utils.exceptions import StoreError
+from nefertem_core.utils.utils import build_hash
 
 
 class SQLStoreConfig(StoreConfig):
@@ -34,12 +43,75 @@ class SQLStoreConfig(StoreConfig):
     database: str
     """SQL database name."""
 
+    batch_size: int = 100_000
+    """Number of rows read at a time from the database and written as a Parquet row group, by default 100000."""
+
+
+# Arrow types of the Python types of SQL columns
+ARROW_TYPES = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    bytes: pa.binary(),
+    datetime.date: pa.date32(),
+    datetime.time: pa.time64("us"),
+    datetime.timedelta: pa.duration("us"),
+}
+
+# Comparison operators accepted by the filters of a path
+OPERATORS = ("=", "!=", "<>", "<=", ">=", "<", ">")
+
+FILTER_PATTERN = r"^\s*(?P<column>[^\s<>=!]+)\s*(?P<operator><>|!=|<=|>=|=|<|>)\s*(?P<value>.*?)\s*$"
+
+
+def build_sql_path(path: str, columns: list[str] | None = None, filters: list[tuple] | None = None) -> str:
+    """
+    Add to the path of a table the columns to read and filters on its rows,
+    so that the store exports only them.
+
+    Parameters
+    ----------
+    path : str
+        Path of the table, sql://<database>/<table>.
+    columns : list[str]
+        Columns to read, by default all.
+    filters : list[tuple]
+        Conditions (column, operator, value) the rows to read must all
+        satisfy, by default none. Operators are =, !=, <>, <, <=, >, >=.
+
+    Returns
+    -------
+    str
+        Path sql://<database>/<table>?columns=<columns>&where=<filter>&where=...
+
+    Raises
+    ------
+    ValueError
+        If an operator is not supported.
+    """
+    params = {}
+    if columns:
+        params["columns"] = ",".join(columns)
+    if filters:
+        for _, operator, _ in filters:
+            if operator not in OPERATORS:
+                raise ValueError(f"Invalid operator {operator}. Must be one of {', '.join(OPERATORS)}")
+        params["where"] = [f"{column} {operator} {value}" for column, operator, value in filters]
+    if not params:
+        return path
+    return f"{path}?{urlencode(params, doseq=True)}"
+
 
 class SQLInputStore(InputStore):
     """
     SQL artifact store object.
 
     Allows the client to interact with SQL based storages.
+    Tables are exported to Parquet in batches of rows, so the memory
+    used does not depend on the size of the table. The Parquet schema
+    follows the types of the columns of the table. A path can select
+    columns and filter rows, see build_sql_path.
 
     """
 
@@ -50,6 +122,27 @@ class SQLInputStore(InputStore):
         super().__init__(name, store_type, temp_dir)
         self.config = config
 
+        # Tables and views of the database, read once
+        self._tables = None
+        self._engine = None
+        self._catalog_guard = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """
+        Drop the engine when the store is pickled.
+        """
+        state = super().__getstate__()
+        state["_engine"] = None
+        del state["_catalog_guard"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore the catalog lock after unpickling.
+        """
+        super().__setstate__(state)
+        self._catalog_guard = threading.Lock()
+
     def persist_artifact(self, *args) -> None:
         """
         Persist an artfact.
@@ -76,16 +169,23 @@ class SQLInputStore(InputStore):
             The location of the requested file.
         """
         key = f"{src}_file"
-        cached = self._get_resource(key)
-        if cached is not None:
-            return cached
-
-        self.logger.info(f"Fetching resource {src} from store {self.name}")
-        table = self._get_table_name(src)
-        dst = self.temp_dir / f"{table}.parquet"
-        filepath = self._download_table(table, dst)
-        self._register_resource(key, filepath)
-        return filepath
+        with self._lock_resource(key):
+            cached = self._get_resource(key)
+            if cached is not None:
+                return cached
+
+            self.logger.info(f"Fetching resource {src} from store {self.name}")
+            parsed = self._parse_path(src)
+            table = parsed["table"]
+            columns = parsed["columns"]
+            filters = parsed["filters"]
+            filename = table
+            if columns is not None or filters is not None:
+                filename = f"{table}_{build_hash([columns, filters])[:12]}"
+            dst = self._get_temp_path(f"{filename}.parquet")
+            filepath = self._download_table(table, dst, columns, filters)
+            self._register_resource(key, filepath)
+            return filepath
 
     def fetch_native(self, *args) -> str:
         """
@@ -98,6 +198,16 @@ class SQLInputStore(InputStore):
         """
         return self._get_connection_string()
 
+    def clean_paths(self) -> None:
+        """
+        Delete all temporary paths references from the store
+        and close the connections of its engine.
+        """
+        super().clean_paths()
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+
     ############################
     # Private helper methods
     ############################
@@ -112,10 +222,23 @@ class SQLInputStore(InputStore):
             The connection string.
         """
         return (
-            f"{self.config.driver}//{self.config.user}:{self.config.password}@"
+            f"{self.config.driver}://{self.config.user}:{self.config.password}@"
             f"{self.config.host}:{self.config.port}/{self.config.database}"
         )
 
+    def _get_engine(self) -> sqlalchemy.engine.Engine:
+        """
+        Get the engine of the store, creating it on first use.
+
+        Returns
+        -------
+        sqlalchemy.engine.Engine
+            The engine.
+        """
+        if self._engine is None:
+            self._engine = sqlalchemy.create_engine(self._get_connection_string())
+        return self._engine
+
     @staticmethod
     def _parse_path(path: str) -> dict:
         """
@@ -129,13 +252,32 @@ class SQLInputStore(InputStore):
         Returns
         -------
         dict
-            A dictionary containing the components of the path.
+            A dictionary containing the database, the table, the columns
+            and the filters (column, operator, value) of the path.
+
+        Raises
+        ------
+        ValueError
+            If the path or one of its filters is not valid.
         """
-        pattern = r"^sql://(?P<database>.+)/(?P<table>.+)$"
+        pattern = r"^sql://(?P<database>.+)/(?P<table>[^/?]+)(\?(?P<params>.*))?$"
         match = re.match(pattern, path)
         if match is None:
             raise ValueError("Invalid SQL path. Must be sql://<database>/<table>")
-        return match.groupdict()
+        params = parse_qs(match.group("params") or "")
+        columns = params.get("columns")
+        filters = []
+        for condition in params.get("where", []):
+            parsed = re.match(FILTER_PATTERN, condition)
+            if parsed is None:
+                raise ValueError(f"Invalid filter {condition}. Must be <column> <operator> <value>")
+            filters.append((parsed.group("column"), parsed.group("operator"), parsed.group("value")))
+        return {
+            "database": match.group("database"),
+            "table": match.group("table"),
+            "columns": columns[0].split(",") if columns else None,
+            "filters": filters or None,
+        }
 
     def _get_table_name(self, uri: str) -> str:
         """
@@ -168,14 +310,24 @@ class SQLInputStore(InputStore):
 
         Returns
         -------
-        list
+        pl.DataFrame
             The query results.
         """
-        pl.read_database(query, self._get_connection_string(), engine="adbc")
-
-    def _download_table(self, table: str, dst: str) -> Path:
+        with self._get_engine().connect() as conn:
+            return pl.read_database(query, connection=conn)
+
+    def _download_table(
+        self,
+        table: str,
+        dst: str,
+        columns: list[str] | None = None,
+        filters: list[tuple] | None = None,
+    ) -> Path:
         """
-        Download a table from SQL based storage.
+        Download a table from SQL based storage. Rows are read with a
+        server-side cursor and written as a row group every batch_size rows.
+        The query is built from the reflected table, so names are quoted
+        and the values of the filters are bound parameters.
 
         Parameters
         ----------
@@ -183,20 +335,177 @@ class SQLInputStore(InputStore):
             The origin table.
         dst : str
             The destination path.
+        columns : list[str]
+            Columns to read, by default all.
+        filters : list[tuple]
+            Conditions (column, operator, value) on the rows to read, by default none.
 
         Returns
         -------
         Path
             The destination of the file on local filesystem.
+
+        Raises
+        ------
+        StoreError
+            If the table can not be read or a value does not match the type of its column.
         """
         self._verify_table(table)
-        query = f"select * from {table}"
-        self._execute_query(query).write_parquet(dst)
+        writer = None
+        try:
+            sql_table = sqlalchemy.Table(table, sqlalchemy.MetaData(), autoload_with=self._get_engine())
+            query = self._build_query(sql_table, columns, filters)
+            sql_columns = list(query.selected_columns)
+            schema = pa.schema([(col.name, self._get_arrow_type(col.type)) for col in sql_columns])
+            writer = pq.ParquetWriter(dst, schema)
+            with self._get_engine().connect() as conn:
+                result = conn.execution_options(stream_results=True).execute(query)
+                for rows in result.partitions(self.config.batch_size):
+                    values = list(zip(*rows))
+                    arrays = [self._to_arrow(values[idx], field, table) for idx, field in enumerate(schema)]
+                    writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+        except (sqlalchemy.exc.SQLAlchemyError, KeyError) as ex:
+            raise StoreError(f"Unable to read table {table}. Arguments: {str(ex.args)}")
+        finally:
+            if writer is not None:
+                writer.close()
         return Path(dst)
 
+    @staticmethod
+    def _build_query(
+        table: sqlalchemy.Table,
+        columns: list[str] | None = None,
+        filters: list[tuple] | None = None,
+    ) -> sqlalchemy.sql.Select:
+        """
+        Build the query that reads the columns and rows of a table.
+
+        Parameters
+        ----------
+        table : sqlalchemy.Table
+            Reflected table.
+        columns : list[str]
+            Columns to read, by default all.
+        filters : list[tuple]
+            Conditions (column, operator, value) on the rows to read, by default none.
+
+        Returns
+        -------
+        sqlalchemy.sql.Select
+            Select query.
+
+        Raises
+        ------
+        KeyError
+            If a column is not in the table.
+        """
+        selected = [table.c[col] for col in columns] if columns else list(table.c)
+        query = sqlalchemy.select(*selected)
+        for column, operator, value in filters or []:
+            col = table.c[column]
+            param = sqlalchemy.bindparam(None, SQLInputStore._parse_value(value, col.type), type_=col.type)
+            query = query.where(col.op("!=" if operator == "<>" else operator)(param))
+        return query
+
+    @staticmethod
+    def _parse_value(value: str, sql_type: sqlalchemy.types.TypeEngine) -> Any:
+        """
+        Convert the value of a filter to the Python type of its column.
+
+        Parameters
+        ----------
+        value : str
+            Value, optionally in single quotes.
+        sql_type : sqlalchemy.types.TypeEngine
+            Type of the column.
+
+        Returns
+        -------
+        Any
+            Converted value.
+        """
+        if len(value) > 1 and value[0] == value[-1] == "'":
+            value = value[1:-1]
+        try:
+            python_type = sql_type.python_type
+        except NotImplementedError:
+            return value
+        if python_type in (int, float, decimal.Decimal):
+            return python_type(value)
+        if python_type is bool:
+            return value.lower() in ("true", "1")
+        if python_type in (datetime.datetime, datetime.date, datetime.time):
+            return python_type.fromisoformat(value)
+        return value
+
+    @staticmethod
+    def _get_arrow_type(sql_type: sqlalchemy.types.TypeEngine) -> pa.DataType:
+        """
+        Return the Arrow type of a SQL column. Columns of types without
+        an Arrow equivalent are written as text.
+
+        Parameters
+        ----------
+        sql_type : sqlalchemy.types.TypeEngine
+            Type of the column.
+
+        Returns
+        -------
+        pa.DataType
+            Arrow type.
+        """
+        try:
+            python_type = sql_type.python_type
+        except NotImplementedError:
+            return pa.string()
+        if python_type is datetime.datetime:
+            return pa.timestamp("us", tz="UTC" if getattr(sql_type, "timezone", False) else None)
+        if python_type is decimal.Decimal:
+            precision = getattr(sql_type, "precision", None)
+            scale = getattr(sql_type, "scale", None)
+            if precision is not None:
+                return pa.decimal128(precision, scale or 0)
+            return pa.decimal128(38, 10)
+        return ARROW_TYPES.get(python_type, pa.string())
+
+    @staticmethod
+    def _to_arrow(values: tuple, field: pa.Field, table: str) -> pa.Array:
+        """
+        Convert the values of a column to Arrow. Values are not coerced,
+        a value that does not match the type of its column, or that would
+        be truncated, raises an error.
+
+        Parameters
+        ----------
+        values : tuple
+            Values of the column.
+        field : pa.Field
+            Arrow field of the column.
+        table : str
+            Name of the table.
+
+        Returns
+        -------
+        pa.Array
+            Arrow array.
+
+        Raises
+        ------
+        StoreError
+            If a value does not match the type of the column.
+        """
+        if pa.types.is_string(field.type):
+            values = [value if value is None or isinstance(value, str) else str(value) for value in values]
+        try:
+            # Values are converted as they are, then cast to the column type without loss
+            return pa.array(values).cast(field.type, safe=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, OverflowError) as ex:
+            raise StoreError(f"Invalid value in column {field.name} of table {table}. Arguments: {str(ex.args)}")
+
     def _verify_table(self, table: str) -> None:
         """
-        Verify if table exists.
+        Verify if table exists. The tables of the database are read once,
+        and read again only if the table is not found.
 
         Parameters
         ----------
@@ -207,10 +516,26 @@ class SQLInputStore(InputStore):
         -------
         None
         """
-        query = """
-        SELECT TABLE_NAME as table
-        FROM INFORMATION_SCHEMA.TABLES
+        if table in self._get_tables() or table in self._get_tables(refresh=True):
+            return
+        raise StoreError(f"Table {table} not in db.")
+
+    def _get_tables(self, refresh: bool = False) -> set[str]:
+        """
+        Return the tables and the views of the database.
+
+        Parameters
+        ----------
+        refresh : bool
+            If True, read them again from the database.
+
+        Returns
+        -------
+        set[str]
+            Names of tables and views.
         """
-        res = self._execute_query(query)
-        if table not in res.to_series().to_list():
-            raise StoreError(f"Table {table} not in db.")
+        with self._catalog_guard:
+            if self._tables is None or refresh:
+                inspector = sqlalchemy.inspect(self._get_engine())
+                self._tables = set(inspector.get_table_names()) | set(inspector.get_view_names())
+            return self._tables
@@ -8,6 +8,7 @@ NEFERTEM_VERSION: str = "2.0.0"
 # Data readers type
 FILE_READER: str = "file_reader"
 NATIVE_READER: str = "native_readerr"
+ARROW_READER: str = "arrow_reader"
 
 # Generics
 DUMMY: str = "_dummy"
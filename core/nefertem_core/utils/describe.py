@@ -0,0 +1,287 @@
+"""
+Description cache module.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+from nefertem_core.utils.logger import LOGGER
+from nefertem_core.utils.utils import build_hash, build_uuid
+
+# Folder of the descriptions shared by processes and runs, set by the client.
+# Without a folder, descriptions are only kept in memory.
+DESCRIBE_PATH: Path | None = None
+
+# Maximum number of descriptions kept in memory by a process
+MAX_DESCRIPTIONS = 1024
+
+# Maximum size in bytes of the sidecars and time in seconds a sidecar is kept without being used
+MAX_SIZE = 64 * 1024**2
+MAX_AGE = 7 * 24 * 60 * 60
+
+# Frictionless detector arguments, with bigger buffer/sample we should avoid error encoding detection
+BUFFER_SIZE = 20000
+SAMPLE_SIZE = 1250
+
+# Descriptions computed or loaded by this process, least recently used first
+_descriptions: OrderedDict[str, dict] = OrderedDict()
+_lock = threading.Lock()
+
+
+def set_describe_path(path: str | Path | None) -> None:
+    """
+    Set the folder where descriptions are stored, shared by the
+    processes and the runs that use it.
+
+    Parameters
+    ----------
+    path : str | Path | None
+        Folder of the descriptions, None to keep them only in memory.
+
+    Returns
+    -------
+    None
+    """
+    global DESCRIBE_PATH
+    DESCRIBE_PATH = Path(path) if path is not None else None
+
+
+def describe_resource(pth: str) -> dict:
+    """
+    Describe a resource using frictionless.
+
+    With bigger buffer/sample we should avoid error encoding detection.
+    The description is cached until the file changes. Frictionless is
+    a dependency of the plugins that describe files, not of the core.
+
+    Parameters
+    ----------
+    pth: str
+        Path to resource.
+
+    Returns
+    -------
+    dict
+        Resource description.
+    """
+    import frictionless
+
+    return cached_describe(
+        pth,
+        f"frictionless=={frictionless.__version__}:resource:{BUFFER_SIZE}:{SAMPLE_SIZE}",
+        lambda path: frictionless.Resource.describe(
+            source=path,
+            detector=frictionless.Detector(buffer_size=BUFFER_SIZE, sample_size=SAMPLE_SIZE),
+        ).to_dict(),
+    )
+
+
+def describe_buffer(buffer: BinaryIO, source: str | None = None) -> dict:
+    """
+    Describe a CSV file object using frictionless on its first bytes.
+    The file object is rewound, so it can be read from the start.
+    If the content of the file is identified, e.g. by the store, the
+    path and the ETag of an object, the description is cached until
+    the content changes.
+
+    Parameters
+    ----------
+    buffer: BinaryIO
+        Seekable file object.
+    source: str
+        Identifier of the content of the file, None to not cache the description.
+
+    Returns
+    -------
+    dict
+        Resource description.
+    """
+    import frictionless
+
+    def describe() -> dict:
+        sample = buffer.read(BUFFER_SIZE)
+        buffer.seek(0)
+        return frictionless.Resource.describe(
+            source=sample,
+            format="csv",
+            detector=frictionless.Detector(buffer_size=BUFFER_SIZE, sample_size=SAMPLE_SIZE),
+        ).to_dict()
+
+    if source is None:
+        return describe()
+    kind = f"frictionless=={frictionless.__version__}:buffer:{BUFFER_SIZE}:{SAMPLE_SIZE}"
+    return _get_description(build_hash({"source": source, "kind": kind}), describe)
+
+
+def cached_describe(path: str | Path, kind: str, describe: Callable[[str], dict]) -> dict:
+    """
+    Return the description of a local file, e.g. its dialect, encoding
+    or schema, computing it only if the file changed since it was last
+    described. A file is identified by its path, modification time and
+    size. The most recently used descriptions are kept in memory,
+    shared by the readers and plugins of a process, and every
+    description in a JSON sidecar in DESCRIBE_PATH, if set, shared
+    by processes and runs.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to a local file.
+    kind : str
+        Kind of description, identifying the describe function, its
+        arguments and the version of the library that computes it.
+    describe : Callable[[str], dict]
+        Function that describes the file given its path.
+
+    Returns
+    -------
+    dict
+        File description.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return describe(str(path))
+    key = build_hash(
+        {
+            "path": str(Path(path).resolve()),
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "kind": kind,
+        }
+    )
+    return _get_description(key, lambda: describe(str(path)))
+
+
+def _get_description(key: str, describe: Callable[[], dict]) -> dict:
+    """
+    Return a description from memory or from its sidecar, computing
+    and storing it if missing.
+
+    Parameters
+    ----------
+    key : str
+        Description key.
+    describe : Callable[[], dict]
+        Function that computes the description.
+
+    Returns
+    -------
+    dict
+        Description.
+    """
+    with _lock:
+        description = _descriptions.get(key)
+    if description is None:
+        description = _read_sidecar(key)
+    if description is None:
+        description = describe()
+        _write_sidecar(key, description)
+    with _lock:
+        _descriptions[key] = description
+        _descriptions.move_to_end(key)
+        while len(_descriptions) > MAX_DESCRIPTIONS:
+            _descriptions.popitem(last=False)
+    return deepcopy(description)
+
+
+def evict_descriptions(max_size: int = MAX_SIZE, max_age: int = MAX_AGE) -> None:
+    """
+    Remove the sidecars unused for longer than max_age, then the least
+    recently used ones until the sidecars fit in max_size.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum size in bytes of the sidecars.
+    max_age : int
+        Maximum time in seconds a sidecar is kept without being used.
+
+    Returns
+    -------
+    None
+    """
+    if DESCRIBE_PATH is None or not DESCRIBE_PATH.exists():
+        return
+    now = time.time()
+    entries = []
+    for src in DESCRIBE_PATH.glob("*.json"):
+        try:
+            stat = src.stat()
+        except OSError:
+            continue
+        if now - stat.st_mtime > max_age:
+            src.unlink(missing_ok=True)
+        else:
+            entries.append((stat.st_mtime, stat.st_size, src))
+    size = sum(entry[1] for entry in entries)
+    for _, entry_size, src in sorted(entries):
+        if size <= max_size:
+            break
+        src.unlink(missing_ok=True)
+        size -= entry_size
+
+
+def _read_sidecar(key: str) -> dict | None:
+    """
+    Read a description from its sidecar and mark it as used.
+
+    Parameters
+    ----------
+    key : str
+        Description key.
+
+    Returns
+    -------
+    dict | None
+        File description, None if not stored.
+    """
+    if DESCRIBE_PATH is None:
+        return None
+    src = DESCRIBE_PATH / f"{key}.json"
+    try:
+        with open(src, encoding="utf-8") as file:
+            description = json.load(file)
+        os.utime(src)
+        return description
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as ex:
+        LOGGER.warning(f"Unable to read description {key}. Arguments: {str(ex.args)}")
+        return None
+
+
+def _write_sidecar(key: str, description: dict) -> None:
+    """
+    Write a description in its sidecar.
+
+    Parameters
+    ----------
+    key : str
+        Description key.
+    description : dict
+        File description.
+
+    Returns
+    -------
+    None
+    """
+    if DESCRIBE_PATH is None:
+        return
+    dst = DESCRIBE_PATH / f"{key}.json"
+    tmp = DESCRIBE_PATH / f"{key}.{build_uuid()}.tmp"
+    try:
+        DESCRIBE_PATH.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as file:
+            json.dump(description, file, default=str)
+        os.replace(tmp, dst)
+    except Exception as ex:
+        LOGGER.warning(f"Unable to store description {key}. Arguments: {str(ex.args)}")
+        tmp.unlink(missing_ok=True)
@@ -0,0 +1,83 @@
+"""
+Pickle utils module.
+
+Some framework objects can not be pickled as they are, e.g. frictionless
+metadata objects lose their content. Plugins register a reducer for
+those classes, used only to pickle the results exchanged with worker
+processes, written by the stream registry and kept by the result cache,
+so the pickling of the classes outside nefertem is not modified.
+"""
+from __future__ import annotations
+
+import copyreg
+import io
+import pickle
+from collections import ChainMap
+from typing import IO, Any, Callable
+
+REDUCERS: dict[type, Callable] = {}
+
+
+def register_reducer(cls: type, reducer: Callable) -> None:
+    """
+    Register the function that reduces the objects of a class
+    when they are pickled by nefertem.
+
+    Parameters
+    ----------
+    cls : type
+        Class of the objects to reduce.
+    reducer : Callable
+        Function that returns a (callable, arguments) tuple
+        to rebuild an object, as for copyreg.pickle.
+
+    Returns
+    -------
+    None
+    """
+    REDUCERS[cls] = reducer
+
+
+class _Pickler(pickle.Pickler):
+    """
+    Pickler that uses the registered reducers before the global ones.
+    """
+
+    dispatch_table = ChainMap(REDUCERS, copyreg.dispatch_table)
+
+
+def dump(obj: Any, file: IO[bytes]) -> None:
+    """
+    Pickle an object on a file.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to pickle.
+    file : IO[bytes]
+        Binary file.
+
+    Returns
+    -------
+    None
+    """
+    _Pickler(file, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Pickle an object.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to pickle.
+
+    Returns
+    -------
+    bytes
+        Pickled object.
+    """
+    buffer = io.BytesIO()
+    dump(obj, buffer)
+    return buffer.getvalue()
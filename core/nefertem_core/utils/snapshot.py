@@ -0,0 +1,199 @@
+"""
+Reference snapshot module.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+import typing
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from nefertem_core.utils.logger import LOGGER
+from nefertem_core.utils.utils import build_hash, build_uuid, listify
+
+if typing.TYPE_CHECKING:
+    from nefertem_core.stores.input.objects._base import InputStore
+
+# Folder of the snapshots shared by processes and runs, set by the client.
+# Without a folder, snapshots are only kept in memory.
+SNAPSHOT_PATH: Path | None = None
+
+# Snapshots kept in memory by a process
+SNAPSHOT_ITEMS = 4
+
+# Seconds a stored snapshot is kept without being used
+SNAPSHOT_AGE = 604800
+
+# Snapshots loaded by this process, least recently used first
+_snapshots: OrderedDict[str, pd.DataFrame] = OrderedDict()
+_locks: dict[str, threading.Lock] = {}
+_lock = threading.Lock()
+
+
+def set_snapshot_path(path: str | Path | None) -> None:
+    """
+    Set the folder where snapshots are stored, shared by the processes
+    and the runs that use it.
+
+    Parameters
+    ----------
+    path : str | Path | None
+        Folder of the snapshots, None to keep them only in memory.
+
+    Returns
+    -------
+    None
+    """
+    global SNAPSHOT_PATH
+    SNAPSHOT_PATH = Path(path) if path is not None else None
+
+
+def cached_snapshot(
+    store: InputStore,
+    src: str | list[str],
+    read: Callable[[], pd.DataFrame],
+    persist: bool = False,
+) -> pd.DataFrame:
+    """
+    Return the DataFrame of a resource, e.g. the reference dataset compared
+    with many current datasets, reading it only if its content changed since
+    it was last read. The resource is identified by the fingerprints of its
+    files. Snapshots are kept in memory, shared by the plugins executed by a
+    process, and optionally stored as Parquet files in SNAPSHOT_PATH, if set,
+    shared by processes and runs. The DataFrame returned is shared and must not be modified.
+
+    Parameters
+    ----------
+    store : InputStore
+        Store where the resource is located.
+    src : str | list[str]
+        Resource path or list of resource paths.
+    read : Callable[[], pd.DataFrame]
+        Function that reads the resource.
+    persist : bool
+        Whether to store the snapshot on disk.
+
+    Returns
+    -------
+    pd.DataFrame
+        Resource DataFrame.
+    """
+    key = get_snapshot_key(store, src)
+    if key is None:
+        return read()
+
+    with _lock:
+        key_lock = _locks.setdefault(key, threading.Lock())
+
+    # Plugins that need the same snapshot wait for the first one to read it
+    with key_lock:
+        with _lock:
+            data = _snapshots.get(key)
+            if data is not None:
+                _snapshots.move_to_end(key)
+                return data
+        data = _read_snapshot(key) if persist else None
+        if data is None:
+            data = read()
+            if persist:
+                _write_snapshot(key, data)
+        with _lock:
+            _snapshots[key] = data
+            while len(_snapshots) > SNAPSHOT_ITEMS:
+                _snapshots.popitem(last=False)
+    return data
+
+
+def get_snapshot_key(store: InputStore, src: str | list[str]) -> str | None:
+    """
+    Return the key of the snapshot of a resource.
+
+    Parameters
+    ----------
+    store : InputStore
+        Store where the resource is located.
+    src : str | list[str]
+        Resource path or list of resource paths.
+
+    Returns
+    -------
+    str | None
+        Snapshot key, None if the content of a file can not be fingerprinted.
+    """
+    fingerprints = []
+    for path in listify(src):
+        fingerprint = store.get_fingerprint(path)
+        if fingerprint is None:
+            return None
+        fingerprints.append([store.store_type, path, fingerprint])
+    return build_hash({"inputs": fingerprints, "pandas": pd.__version__})
+
+
+def _read_snapshot(key: str) -> pd.DataFrame | None:
+    """
+    Read a stored snapshot.
+
+    Parameters
+    ----------
+    key : str
+        Snapshot key.
+
+    Returns
+    -------
+    pd.DataFrame | None
+        Resource DataFrame, None if not stored.
+    """
+    if SNAPSHOT_PATH is None:
+        return None
+    src = SNAPSHOT_PATH / f"{key}.parquet"
+    try:
+        data = pd.read_parquet(src)
+        os.utime(src)
+        return data
+    except FileNotFoundError:
+        return None
+    except Exception as ex:
+        LOGGER.warning(f"Unable to read snapshot {key}. Arguments: {str(ex.args)}")
+        return None
+
+
+def _write_snapshot(key: str, data: pd.DataFrame) -> None:
+    """
+    Store a snapshot, then remove the snapshots unused for longer
+    than SNAPSHOT_AGE.
+
+    Parameters
+    ----------
+    key : str
+        Snapshot key.
+    data : pd.DataFrame
+        Resource DataFrame.
+
+    Returns
+    -------
+    None
+    """
+    if SNAPSHOT_PATH is None:
+        return
+    dst = SNAPSHOT_PATH / f"{key}.parquet"
+    tmp = SNAPSHOT_PATH / f"{key}.{build_uuid()}.tmp"
+    try:
+        SNAPSHOT_PATH.mkdir(parents=True, exist_ok=True)
+        data.to_parquet(tmp)
+        os.replace(tmp, dst)
+    except Exception as ex:
+        LOGGER.warning(f"Unable to store snapshot {key}. Arguments: {str(ex.args)}")
+        tmp.unlink(missing_ok=True)
+
+    now = time.time()
+    for src in SNAPSHOT_PATH.glob("*.parquet"):
+        try:
+            if now - src.stat().st_mtime > SNAPSHOT_AGE:
+                src.unlink(missing_ok=True)
+        except OSError:
+            continue
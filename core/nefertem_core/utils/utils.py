@@ -4,6 +4,8 @@ Common generic utils.
 from __future__ import annotations
 
 import functools
+import hashlib
+import json
 import operator
 from datetime import datetime
 from typing import Any
@@ -29,6 +31,25 @@ def build_uuid(uuid: str | None = None) -> str:
     return str(uuid4())
 
 
+def build_hash(obj: Any) -> str:
+    """
+    Create a stable hash of a JSON serializable object.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to hash. Values that are not JSON serializable are hashed
+        by their string representation.
+
+    Returns
+    -------
+    str
+        The hash.
+    """
+    dump = json.dumps(obj, sort_keys=True, default=str)
+    return hashlib.sha256(dump.encode()).hexdigest()
+
+
 def flatten_list(list_of_list: list[list[Any]]) -> list[Any]:
     """
     Flatten a list of list.
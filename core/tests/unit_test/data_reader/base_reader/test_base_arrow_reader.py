@@ -0,0 +1,66 @@
+import pyarrow as pa
+import pytest
+from nefertem_core.readers.objects.arrow import get_dataset_format, to_pandas, unify_schemas
+from nefertem_core.utils.commons import ARROW_READER
+
+
+def test_fetch_data(reader, data_path_csv):
+    table = reader.fetch_data([data_path_csv, data_path_csv])
+    single = reader.fetch_data(data_path_csv)
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 2 * single.num_rows
+    assert table.column_names == single.column_names
+
+
+def test_fetch_data_mismatched(reader, tmp_path):
+    # Later partitions with values of other types than the first one
+    paths = []
+    for idx, rows in enumerate(("1,a\n2,b", "2.5,c", "text,d")):
+        path = tmp_path / f"part_{idx}.csv"
+        path.write_text(f"col1,col2\n{rows}\n")
+        paths.append(str(path))
+
+    table = reader.fetch_data(paths[:2])
+    assert table.schema.field("col1").type == pa.float64()
+    assert table.column("col1").to_pylist() == [1, 2, 2.5]
+
+    table = reader.fetch_data(paths)
+    assert table.schema.field("col1").type == pa.string()
+    assert table.column("col1").to_pylist() == ["1", "2", "2.5", "text"]
+    assert table.column("col2").to_pylist() == ["a", "b", "c", "d"]
+
+
+def test_unify_schemas():
+    first = pa.schema([("a", pa.int64()), ("b", pa.null())])
+    second = pa.schema([("a", pa.string()), ("b", pa.bool_()), ("c", pa.int64())])
+    assert unify_schemas([first, first]) == first
+    assert unify_schemas([first, second]) == pa.schema([("a", pa.string()), ("b", pa.bool_()), ("c", pa.int64())])
+
+
+def test_fetch_data_parquet(reader, data_path_parquet):
+    table = reader.fetch_data([data_path_parquet, data_path_parquet], columns=["col1"])
+    assert table.column_names == ["col1"]
+    df = to_pandas(table)
+    assert list(df.columns) == ["col1"]
+
+
+def test_fetch_data_mixed(reader, data_path_csv, data_path_parquet):
+    with pytest.raises(ValueError):
+        reader.fetch_data([data_path_csv, data_path_parquet])
+
+
+def test_get_dataset_format():
+    assert get_dataset_format(["a.csv", "b.CSV"]) == "csv"
+    assert get_dataset_format(["a.parquet"]) == "parquet"
+    assert get_dataset_format(["a.csv", "b.parquet"]) is None
+    assert get_dataset_format(["a.xlsx"]) is None
+
+
+@pytest.fixture
+def store_cfg(local_store_cfg):
+    return local_store_cfg
+
+
+@pytest.fixture
+def data_reader():
+    return ARROW_READER
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+from nefertem_core.plugins.utils import ResultType
+from nefertem_core.resources.data_resource import DataResource
+from nefertem_core.run.cache import ResultCache
+from nefertem_core.stores.builder import StoreBuilder
+from nefertem_profiling_arrow.builder import ProfilingBuilderArrow
+from nefertem_profiling_arrow.reader import ArrowBatchReader
+from tests.unit_test.run.utils_run_tests import build_handler
+
+NEFERTEM = ResultType.NEFERTEM.value
+ROWS = 100
+
+
+def build(store, paths, **exec_args) -> list:
+    resource = DataResource(path=paths, name="data", store="local")
+    plugins = ProfilingBuilderArrow([store], {"seed": 42, **exec_args}).build([resource])
+
+    # Partitions run in threads, so the files read are recorded
+    for plugin in plugins:
+        plugin.exec_multiprocess = False
+        plugin.exec_multithread = True
+    return plugins
+
+
+def run(tmp_path, name, cache, plugins):
+    handler = build_handler(plugins, tmp_path / name, cache=cache, parallel=True)
+    [profile] = handler.get_item(NEFERTEM, handler.run())
+    return profile.object
+
+
+def whole(store, paths):
+    # Profile of the resource read as a whole
+    [plugin] = build(store, paths)
+    plugin.exec_partition = False
+    return plugin.execute()[NEFERTEM].artifact.object
+
+
+class TestCachedPartitions:
+    def test_merged(self, tmp_path, cache, store, files, read):
+        plugins = build(store, files[:3])
+        assert plugins[0].exec_partition
+        profile = run(tmp_path, "first", cache, plugins)
+        assert sorted(read) == sorted(files[:3])
+
+        expected = whole(store, files[:3])
+        assert profile.stats == expected.stats
+        assert profile.fields == expected.fields
+        assert profile.stats["n"] == 3 * ROWS
+
+    def test_new_file(self, tmp_path, cache, store, files, read):
+        run(tmp_path, "first", cache, build(store, files[:3]))
+        read.clear()
+
+        # Only the new file is read, the other files come from the cache
+        profile = run(tmp_path, "second", cache, build(store, files))
+        assert read == [files[3]]
+
+        expected = whole(store, files)
+        assert profile.stats == expected.stats
+        assert profile.fields == expected.fields
+        assert profile.stats["n"] == 4 * ROWS
+
+    def test_changed_file(self, tmp_path, cache, store, files, read):
+        run(tmp_path, "first", cache, build(store, files[:3]))
+        read.clear()
+        frame(3).to_parquet(files[1])
+        profile = run(tmp_path, "second", cache, build(store, files[:3]))
+        assert read == [files[1]]
+        assert profile.fields == whole(store, files[:3]).fields
+
+    def test_keep_state(self, tmp_path, cache, store, files, read):
+        profile = run(tmp_path, "first", cache, build(store, files[:3], keep_state=True))
+        assert profile.state["n"] == 3 * ROWS
+        assert sorted(profile.state["columns"]) == ["code", "id", "value"]
+
+
+def frame(idx) -> pd.DataFrame:
+    rng = np.random.default_rng(idx)
+    return pd.DataFrame(
+        {
+            "id": np.arange(idx * ROWS, (idx + 1) * ROWS),
+            "value": rng.normal(idx, 1, ROWS).round(2),
+            "code": rng.choice(["a", "b", "c"], ROWS),
+        }
+    )
+
+
+@pytest.fixture
+def files(tmp_path) -> list:
+    paths = []
+    for idx in range(4):
+        path = tmp_path / f"part_{idx}.parquet"
+        frame(idx).to_parquet(path)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def read(monkeypatch) -> list:
+    # Files read by the plugins
+    paths = []
+    fetch_batches = ArrowBatchReader.fetch_batches
+
+    def recording(self, src, batch_rows=65_536):
+        paths.extend([src] if isinstance(src, str) else src)
+        return fetch_batches(self, src, batch_rows)
+
+    monkeypatch.setattr(ArrowBatchReader, "fetch_batches", recording)
+    return paths
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(tmp_path / "cache", 1024**3, 600)
+
+
+@pytest.fixture
+def store(tmp_path):
+    builder = StoreBuilder()
+    builder.build_input_store(str(tmp_path / "tmp"), {"name": "local", "store_type": "local"})
+    return builder.get_input_store("local")
@@ -0,0 +1,256 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from nefertem_profiling_arrow.statistics import (
+    ColumnStatistics,
+    FrequentItems,
+    HyperLogLog,
+    Moments,
+    QuantileSketch,
+    TableStatistics,
+)
+
+ROWS = 5000
+BATCH_ROWS = 1024
+QUANTILES = [0.25, 0.5, 0.75]
+
+
+def compute(table: pa.Table, **kwargs) -> TableStatistics:
+    stats = TableStatistics(seed=42, **kwargs)
+    for batch in table.to_batches(BATCH_ROWS):
+        stats.update(batch)
+    return stats
+
+
+def roundtrip(stats):
+    # Store the state as JSON and read it back
+    return type(stats).from_state(json.loads(json.dumps(stats.to_state())))
+
+
+class TestMoments:
+    def test_pandas(self, df):
+        values = df["value"].dropna()
+        moments = Moments()
+        for start in range(0, len(values), 700):
+            moments.update(values.to_numpy()[start : start + 700])
+        assert moments.count == len(values)
+        assert moments.mean == pytest.approx(values.mean(), rel=1e-12)
+        assert moments.variance() == pytest.approx(values.var(), rel=1e-12)
+
+    def test_merge(self, df):
+        values = df["value"].dropna().to_numpy()
+        first, second = Moments(), Moments()
+        first.update(values[:1000])
+        second.update(values[1000:])
+        first.merge(roundtrip(second))
+        first.merge(Moments())
+        assert first.count == len(values)
+        assert first.variance() == pytest.approx(np.var(values, ddof=1), rel=1e-12)
+
+    def test_few_values(self):
+        moments = Moments()
+        moments.update(np.array([3.0]))
+        assert moments.mean == 3.0
+        assert moments.variance() is None
+
+
+class TestFrequentItems:
+    def test_pandas(self, df):
+        frequent = FrequentItems()
+        for start in range(0, ROWS, BATCH_ROWS):
+            frequent.update(df["code"].iloc[start : start + BATCH_ROWS].dropna())
+        counts = df["code"].value_counts()
+        assert frequent.exact
+        assert frequent.top(3) == counts.head(3).to_dict()
+        assert frequent.n_unique() == int((counts == 1).sum())
+
+    def test_capacity(self):
+        frequent = FrequentItems(capacity=10)
+        frequent.update(pd.Series(["a"] * 50 + [f"v{idx}" for idx in range(100)]))
+        assert not frequent.exact
+        assert len(frequent.counts) == 10
+        assert frequent.top(1) == {"a": 50}
+        assert frequent.n_unique() is None
+
+    def test_merge(self):
+        first, second = FrequentItems(), FrequentItems()
+        first.update(pd.Series([1, 1, 2]))
+        second.update(pd.Series([2, 3]))
+        first.merge(roundtrip(second))
+        assert first.counts.sort_index().to_dict() == {"1": 2, "2": 2, "3": 1}
+
+
+class TestHyperLogLog:
+    def test_estimate(self):
+        values = pd.Series(np.arange(50_000) % 20_000)
+        hll = HyperLogLog()
+        hll.update(pd.util.hash_pandas_object(values, index=False).to_numpy())
+        assert hll.estimate() == pytest.approx(20_000, rel=0.03)
+
+    def test_small(self):
+        hll = HyperLogLog()
+        hll.update(pd.util.hash_pandas_object(pd.Series(range(100)), index=False).to_numpy())
+        assert hll.estimate() == pytest.approx(100, abs=2)
+
+    def test_merge(self):
+        hashes = pd.util.hash_pandas_object(pd.Series(range(10_000)), index=False).to_numpy()
+        whole, first, second = HyperLogLog(), HyperLogLog(), HyperLogLog()
+        whole.update(hashes)
+        first.update(hashes[:6000])
+        second.update(hashes[4000:])
+        first.merge(roundtrip(second))
+        np.testing.assert_array_equal(first.registers, whole.registers)
+
+
+class TestQuantileSketch:
+    def test_exact(self):
+        # Below its capacity the sketch keeps every value
+        values = np.random.default_rng(0).normal(size=100)
+        sketch = QuantileSketch(size=200, seed=42)
+        sketch.update(values)
+        assert sketch.quantiles(QUANTILES) == np.quantile(values, QUANTILES, method="inverted_cdf").tolist()
+
+    def test_approximate(self):
+        values = np.random.default_rng(0).permutation(np.arange(100_000, dtype=np.float64))
+        sketch = QuantileSketch(seed=42)
+        for start in range(0, len(values), BATCH_ROWS):
+            sketch.update(values[start : start + BATCH_ROWS])
+        assert sum(len(level) for level in sketch.levels) < 3 * sketch.size
+        for q, value in zip(QUANTILES, sketch.quantiles(QUANTILES)):
+            assert value == pytest.approx(q * len(values), abs=0.02 * len(values))
+
+    def test_merge(self):
+        values = np.arange(20_000, dtype=np.float64)
+        first, second = QuantileSketch(seed=42), QuantileSketch(seed=42)
+        first.update(values[:5000])
+        second.update(values[5000:])
+        first.merge(roundtrip(second))
+        assert first.quantiles([0.5])[0] == pytest.approx(10_000, abs=400)
+
+    def test_empty(self):
+        assert QuantileSketch().quantiles(QUANTILES) == [None, None, None]
+
+
+class TestColumnStatistics:
+    def test_numeric(self, df, table):
+        var = compute(table).to_dict(QUANTILES, 3)["variables"]["value"]
+        values = df["value"]
+        assert var["type"] == "Numeric"
+        assert (var["n"], var["count"], var["n_missing"]) == (ROWS, values.count(), values.isna().sum())
+        assert var["p_missing"] == pytest.approx(values.isna().mean())
+        assert var["n_distinct"] == values.nunique()
+        assert var["n_unique"] == int((values.value_counts() == 1).sum())
+        assert not var["is_unique"] and var["exact_distinct"]
+        assert (var["min"], var["max"]) == (values.min(), values.max())
+        assert var["mean"] == pytest.approx(values.mean(), rel=1e-12)
+        assert var["variance"] == pytest.approx(values.var(), rel=1e-12)
+        assert var["std"] == pytest.approx(values.std(), rel=1e-12)
+        for q in QUANTILES:
+            assert var[f"{q:.0%}"] == pytest.approx(values.quantile(q), abs=0.05 * (values.max() - values.min()))
+
+    def test_unique(self, df, table):
+        var = compute(table, capacity=ROWS).to_dict(QUANTILES, 3)["variables"]["id"]
+        assert var["n_distinct"] == var["n_unique"] == ROWS
+        assert var["is_unique"] and var["p_distinct"] == 1
+        assert (var["min"], var["max"]) == (0, ROWS - 1)
+        assert var["mean"] == df["id"].mean()
+
+    def test_categorical(self, df, table):
+        var = compute(table).to_dict(QUANTILES, 3)["variables"]["code"]
+        assert var["type"] == "Categorical"
+        assert var["top"] == df["code"].value_counts().head(3).to_dict()
+        assert "min" not in var and "mean" not in var
+
+    def test_dates(self, df, table):
+        var = compute(table).to_dict(QUANTILES, 3)["variables"]["date"]
+        assert var["type"] == "DateTime"
+        assert var["min"] == df["date"].min().isoformat()
+        assert var["max"] == df["date"].max().isoformat()
+        assert var["n_distinct"] == df["date"].nunique()
+
+    def test_estimated(self, df, table):
+        # Distinct values are estimated when there are more than the counts kept
+        var = compute(table).to_dict(QUANTILES, 3)["variables"]["id"]
+        assert not var["exact_distinct"]
+        assert var["n_distinct"] == pytest.approx(ROWS, rel=0.03)
+        assert var["n_unique"] is None and var["is_unique"]
+
+    def test_not_hashable(self):
+        stats = ColumnStatistics("items", pa.list_(pa.int64()))
+        stats.update(pa.array([[1], None, [2, 3]]))
+        var = roundtrip(stats).to_dict(QUANTILES, 3)
+        assert var == {
+            "type": "Unsupported",
+            "hashable": False,
+            "n": 3,
+            "count": 2,
+            "n_missing": 1,
+            "p_missing": 1 / 3,
+            "memory_size": stats.memory_size,
+        }
+
+
+class TestTableStatistics:
+    def test_table(self, df, table):
+        stats = compute(table).to_dict(QUANTILES, 3)["table"]
+        assert stats["n"] == ROWS
+        assert stats["n_var"] == 5
+        assert stats["n_cells_missing"] == df.isna().sum().sum()
+        assert stats["n_vars_with_missing"] == 2
+        assert stats["p_cells_missing"] == pytest.approx(df.isna().sum().sum() / df.size)
+        assert stats["types"] == {"Numeric": 2, "Categorical": 1, "DateTime": 1, "Boolean": 1}
+
+    def test_from_state(self, table):
+        stats = compute(table)
+        restored = roundtrip(stats)
+        assert json.dumps(restored.to_state()) == json.dumps(stats.to_state())
+        assert restored.to_dict(QUANTILES, 3) == stats.to_dict(QUANTILES, 3)
+
+    def test_merge(self, table):
+        # Merged partitions have the statistics of the whole table
+        whole = compute(table).to_dict(QUANTILES, 3)
+        merged = compute(table.slice(0, 2000))
+        merged.merge(roundtrip(compute(table.slice(2000))))
+        result = merged.to_dict(QUANTILES, 3)
+        assert result["table"] == whole["table"]
+        for name, var in whole["variables"].items():
+            other = result["variables"][name]
+            for key in ("mean", "variance", "std"):
+                if key in var:
+                    assert other.pop(key) == pytest.approx(var.pop(key), rel=1e-12)
+            for q in QUANTILES:
+                if f"{q:.0%}" in var:
+                    assert other.pop(f"{q:.0%}") == pytest.approx(var.pop(f"{q:.0%}"), rel=0.05, abs=1)
+            assert other == var
+
+    def test_merge_new_column(self, table):
+        merged = compute(table.select(["id"]))
+        merged.merge(compute(table.select(["code"])))
+        assert list(merged.columns) == ["id", "code"]
+        assert merged.n == 2 * ROWS
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    value = rng.normal(50, 10, ROWS).round(1)
+    value[rng.random(ROWS) < 0.1] = np.nan
+    code = rng.choice(["a", "b", "c", "d", "e"], ROWS, p=[0.4, 0.3, 0.15, 0.1, 0.05]).astype(object)
+    code[rng.random(ROWS) < 0.05] = None
+    return pd.DataFrame(
+        {
+            "id": np.arange(ROWS),
+            "value": value,
+            "code": code,
+            "date": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, ROWS), unit="D"),
+            "flag": rng.random(ROWS) < 0.5,
+        }
+    )
+
+
+@pytest.fixture
+def table(df) -> pa.Table:
+    return pa.Table.from_pandas(df, preserve_index=False)
@@ -0,0 +1,104 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("ydata_profiling")
+
+from nefertem_profiling_ydata_profiling import utils  # noqa: E402
+from nefertem_profiling_ydata_profiling.plugin import ProfilingPluginYdataProfiling  # noqa: E402
+from nefertem_profiling_ydata_profiling.utils import sample_batches  # noqa: E402
+
+ROWS = 1000
+BATCH_ROWS = 128
+
+
+def batches(read: list | None = None):
+    # Batches indexed from 0, like the row groups of a Parquet file
+    for start in range(0, ROWS, BATCH_ROWS):
+        if read is not None:
+            read.append(start)
+        ids = range(start, min(start + BATCH_ROWS, ROWS))
+        yield pd.DataFrame({"id": ids, "group": ["a" if idx % 4 else "b" for idx in ids]})
+
+
+class TestSampleBatches:
+    def test_reservoir(self):
+        sample, rows = sample_batches(batches(), 100, seed=42)
+        assert rows == ROWS
+        assert len(sample) == 100
+        assert sample["id"].is_unique
+
+        # Rows keep their position in the resource, in order
+        assert sample.index.tolist() == sample["id"].tolist()
+        assert sample.index.is_monotonic_increasing
+        assert list(sample.columns) == ["id", "group"]
+
+    def test_seed(self):
+        first, _ = sample_batches(batches(), 100, seed=42)
+        pd.testing.assert_frame_equal(first, sample_batches(batches(), 100, seed=42)[0])
+        assert not first.equals(sample_batches(batches(), 100, seed=7)[0])
+
+    def test_head(self):
+        read = []
+        sample, rows = sample_batches(batches(read), 300, "head")
+        assert rows == 300
+        assert sample["id"].tolist() == sample.index.tolist() == list(range(300))
+
+        # Reading stops when the sample is full
+        assert read == [0, 128, 256]
+
+    def test_stratified(self):
+        sample, rows = sample_batches(batches(), 100, "stratified", "group", seed=42)
+        assert rows == ROWS
+        assert sample["group"].value_counts().to_dict() == {"a": 75, "b": 25}
+        assert sample.index.tolist() == sample["id"].tolist()
+        assert sample.index.is_monotonic_increasing
+
+    def test_stratified_bounded(self, monkeypatch):
+        # The rows kept between batches are trimmed to the quotas of the values
+        kept = []
+        concat = pd.concat
+
+        def recording(frames, *args, **kwargs):
+            kept.append(len(frames[0]))
+            return concat(frames, *args, **kwargs)
+
+        monkeypatch.setattr(utils.pd, "concat", recording)
+        sample_batches(batches(), 100, "stratified", "group", seed=42)
+        assert max(kept) <= 100
+
+    def test_stratified_sorted(self):
+        def sorted_batches():
+            for batch in batches():
+                yield batch.assign(group=["a" if idx < 750 else "b" for idx in batch["id"]])
+
+        sample, _ = sample_batches(sorted_batches(), 100, "stratified", "group", seed=42)
+        assert sample["group"].value_counts().to_dict() == {"a": 75, "b": 25}
+
+    def test_stratified_too_many_values(self):
+        with pytest.raises(ValueError, match="more values"):
+            sample_batches(batches(), 100, "stratified", "id")
+
+    def test_larger_than_resource(self):
+        sample, rows = sample_batches(batches(), 2 * ROWS, seed=42)
+        assert rows == ROWS
+        assert sample["id"].tolist() == sample.index.tolist() == list(range(ROWS))
+
+    def test_empty(self):
+        sample, rows = sample_batches(iter([]), 100)
+        assert rows == 0
+        assert sample.empty
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            sample_batches(batches(), 100, "systematic")
+        with pytest.raises(ValueError):
+            sample_batches(batches(), 100, "stratified")
+
+    def test_setup(self):
+        # Invalid arguments fail when the plugin is built, not when it is executed
+        plugin = ProfilingPluginYdataProfiling()
+        with pytest.raises(ValueError):
+            plugin.setup(None, None, {"sample_size": 100, "sample_method": "systematic"})
+        with pytest.raises(ValueError):
+            plugin.setup(None, None, {"sample_size": 100, "sample_method": "stratified"})
+        plugin.setup(None, None, {"sample_method": "systematic"})
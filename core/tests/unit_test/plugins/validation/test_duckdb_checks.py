@@ -0,0 +1,133 @@
+import pandas as pd
+import pytest
+from nefertem_core.resources.data_resource import DataResource
+from nefertem_core.stores.builder import StoreBuilder
+from nefertem_validation_duckdb import plugin as duckdb_plugin
+from nefertem_validation_duckdb.builder import ValidationBuilderDuckDB
+from nefertem_validation_duckdb.reader import PandasDataFrameDuckDBReader
+
+ROWS = 250
+
+
+class RecordingReader(PandasDataFrameDuckDBReader):
+    """
+    Reader that records the queries it executes.
+    """
+
+    def __init__(self, store) -> None:
+        super().__init__(store)
+        self.queries = []
+
+    def read_duckdb(self, src, query, cursor=None):
+        self.queries.append(query)
+        return super().read_duckdb(src, query, cursor)
+
+
+def build_constraint(query, expect="minimum", value=0, check="rows") -> dict:
+    return {
+        "type": "duckdb",
+        "name": "c",
+        "title": "c",
+        "resources": ["data"],
+        "weight": 5,
+        "query": query,
+        "expect": expect,
+        "value": value,
+        "check": check,
+    }
+
+
+def validate(store, data, constraint, **exec_args) -> tuple:
+    resource = DataResource(path=data, name="data", store="local")
+    [plugin] = ValidationBuilderDuckDB([store], exec_args).build([resource], [constraint], "full")
+    plugin.data_reader = RecordingReader(None)
+    result = plugin.validate()
+    assert result.errors is None
+    return result.artifact, plugin.data_reader.queries
+
+
+class TestHeadCount:
+    def test_head(self, store, data):
+        # Existence and short results are not counted
+        report, queries = validate(store, data, build_constraint("select * from data where id < 10", "non-empty"))
+        assert report.valid
+        assert len(report.result["id"]) == 10
+        assert len(queries) == 1 and "LIMIT 100" in queries[0]
+
+        report, queries = validate(store, data, build_constraint("select * from data where id < 10", "exact", 10))
+        assert report.valid
+        assert len(queries) == 1
+
+    def test_count(self, store, data):
+        report, queries = validate(store, data, build_constraint("select * from data", "exact", ROWS))
+        assert report.valid
+        assert len(report.result["id"]) == 100
+        assert len(queries) == 2 and "COUNT(*)" in queries[1]
+
+        report, _ = validate(store, data, build_constraint("select * from data", "maximum", ROWS - 1))
+        assert not report.valid
+        assert report.error == f"Maximum value {ROWS - 1}, instead got {ROWS}."
+
+    def test_value(self, store, data):
+        report, queries = validate(
+            store, data, build_constraint("select max(id) from data;", "exact", ROWS - 1, "value")
+        )
+        assert report.valid
+        assert len(queries) == 1
+
+    def test_empty(self, store, data):
+        report, queries = validate(store, data, build_constraint("select * from data where id < 0", "empty"))
+        assert report.valid
+        assert report.result == {"id": {}, "value": {}}
+        assert len(queries) == 1
+
+    def test_shared_connection(self, store, data):
+        constraint = build_constraint("select * from data", "range", f"[{ROWS}, {ROWS}]")
+        report, queries = validate(store, data, constraint, shared_connection=True)
+        assert report.valid
+        assert len(queries) == 2
+
+    @pytest.mark.parametrize(
+        "query, expect, value, check",
+        [
+            ("select * from data order by id -- sorted", "exact", ROWS, "rows"),
+            ("select * from data where id < 5 -- few", "non-empty", None, "rows"),
+            ("select count(*) from data -- total", "exact", ROWS, "value"),
+            ("select 1; select * from data", "exact", ROWS, "rows"),
+        ],
+    )
+    def test_not_wrapped(self, store, data, query, expect, value, check):
+        # The query can not be a subquery, so it is executed as it is
+        report, queries = validate(store, data, build_constraint(query, expect, value, check))
+        assert report.valid
+        assert queries[1:] == [query]
+        if check == "rows":
+            assert len(next(iter(report.result.values()))) == min(100, ROWS if expect == "exact" else 5)
+
+    def test_count_not_wrapped(self, store, data, monkeypatch):
+        monkeypatch.setattr(duckdb_plugin, "build_count_query", lambda query: "SELECT COUNT(*) FROM (")
+        report, queries = validate(store, data, build_constraint("select * from data", "exact", ROWS))
+        assert report.valid
+        assert queries[1:] == ["SELECT COUNT(*) FROM (", "select * from data"]
+
+    def test_invalid_query(self, store, data):
+        resource = DataResource(path=data, name="data", store="local")
+        constraint = build_constraint("select * from missing", "empty")
+        [plugin] = ValidationBuilderDuckDB([store], {}).build([resource], [constraint], "full")
+        assert plugin.validate().errors is not None
+
+
+@pytest.fixture
+def store(tmp_path):
+    builder = StoreBuilder()
+    builder.build_input_store(str(tmp_path / "tmp"), {"name": "local", "store_type": "local"})
+    store = builder.get_input_store("local")
+    yield store
+    store.clean_paths()
+
+
+@pytest.fixture
+def data(tmp_path):
+    path = tmp_path / "data.parquet"
+    pd.DataFrame({"id": range(ROWS), "value": [idx / 2 for idx in range(ROWS)]}).to_parquet(path)
+    return str(path)
@@ -0,0 +1,235 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pandas as pd
+import pytest
+from nefertem_core.resources.data_resource import DataResource
+from nefertem_core.stores.builder import StoreBuilder
+from nefertem_core.utils import describe
+from nefertem_validation_duckdb import reader as duckdb_reader
+from nefertem_validation_duckdb.builder import CACHE_TABLE, CONNECTIONS, SCHEMAS, ValidationBuilderDuckDB
+
+ROWS = 50
+
+
+def build_constraint(resource, query, expect="exact", value=ROWS, check="rows", name="c") -> dict:
+    return {
+        "type": "duckdb",
+        "name": name,
+        "title": name,
+        "resources": [resource],
+        "weight": 5,
+        "query": query,
+        "expect": expect,
+        "value": value,
+        "check": check,
+    }
+
+
+def build(store, resources, constraints, **exec_args) -> tuple:
+    builder = ValidationBuilderDuckDB([store], exec_args)
+    plugins = builder.build(resources, constraints, "full")
+    return builder, plugins
+
+
+def validate(plugins) -> list:
+    results = [plugin.validate() for plugin in plugins]
+    assert [res.errors for res in results] == [None] * len(results)
+    return [res.artifact for res in results]
+
+
+def relations(db, schema=None) -> dict:
+    # Tables and views of a schema of the database, by name
+    query = "SELECT table_name, table_type FROM information_schema.tables"
+    with duckdb.connect(str(db), read_only=True) as conn:
+        if schema is None:
+            return dict(conn.execute(query).fetchall())
+        return dict(conn.execute(f"{query} WHERE table_schema = ?", [schema]).fetchall())
+
+
+class TestRegister:
+    @pytest.mark.parametrize("materialize, kind", [(False, "VIEW"), (True, "BASE TABLE")])
+    def test_modes(self, store, files, materialize, kind):
+        resources = [DataResource(path=files[fmt], name=fmt, store="local") for fmt in ("csv", "parquet")]
+        constraints = [
+            build_constraint("csv", "select * from csv", name="csv"),
+            build_constraint("parquet", "select max(id) from parquet", "exact", ROWS - 1, "value", name="parquet"),
+            build_constraint("csv", "select * from csv where value = 'b;c'", "exact", 1, name="sep"),
+        ]
+        builder, plugins = build(store, resources, constraints, materialize=materialize)
+        assert [report.valid for report in validate(plugins)] == [True, True, True]
+        assert relations(builder.tmp_db, builder.schema) == {"csv": kind, "parquet": kind}
+
+    def test_multiple_files(self, store, tmp_path):
+        # Files of a resource are read together, matching columns by name
+        paths = [tmp_path / "a.csv", tmp_path / "b.csv"]
+        paths[0].write_text("id,value\n1,a\n2,b\n")
+        paths[1].write_text("value,id\nc,3\n")
+        resource = DataResource(path=[str(path) for path in paths], name="data", store="local")
+        constraint = build_constraint("data", "select * from data where id = 3 and value = 'c'", "exact", 1)
+        builder, plugins = build(store, [resource], [constraint])
+        assert validate(plugins)[0].valid
+        assert relations(builder.tmp_db) == {"data": "VIEW"}
+
+    def test_pandas(self, store, files):
+        # Files that DuckDB can not read together are read by pandas
+        resource = DataResource(path=[files["csv"], files["parquet"]], name="mixed", store="local")
+        constraint = build_constraint("mixed", "select * from mixed where value = 'b;c'", "exact", 2)
+        builder, plugins = build(store, [resource], [constraint])
+        assert validate(plugins)[0].valid
+        assert relations(builder.tmp_db) == {"mixed": "BASE TABLE"}
+
+    def test_only_used(self, store, files):
+        resources = [DataResource(path=files[fmt], name=fmt, store="local") for fmt in ("csv", "parquet")]
+        builder, _ = build(store, resources, [build_constraint("csv", "select * from csv")])
+        assert relations(builder.tmp_db) == {"csv": "VIEW"}
+
+
+class TestCache:
+    def test_reused(self, store, files, tmp_path, monkeypatch):
+        cache_dir = str(tmp_path / "cache")
+        resource = DataResource(path=files["csv"], name="csv", store="local")
+        constraint = build_constraint("csv", "select * from csv")
+        builder, plugins = build(store, [resource], [constraint], cache_dir=cache_dir, materialize=True)
+        assert validate(plugins)[0].valid
+        tables = [name for name in relations(builder.tmp_db) if name.startswith("cache_")]
+        assert len(tables) == 1
+
+        # Unchanged files are not read again
+        monkeypatch.setattr(store, "fetch_file", lambda src: pytest.fail("file fetched"))
+        _, plugins = build(store, [resource], [constraint], cache_dir=cache_dir, materialize=True)
+        assert validate(plugins)[0].valid
+        assert [name for name in relations(builder.tmp_db) if name.startswith("cache_")] == tables
+
+    def test_changed(self, store, files, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        resource = DataResource(path=files["csv"], name="csv", store="local")
+        build(store, [resource], [build_constraint("csv", "select * from csv")], cache_dir=cache_dir, materialize=True)
+        pd.DataFrame({"id": [1], "value": ["a"]}).to_csv(files["csv"], index=False, sep=";")
+        builder, plugins = build(
+            store,
+            [resource],
+            [build_constraint("csv", "select * from csv", value=1)],
+            cache_dir=cache_dir,
+            materialize=True,
+        )
+        assert validate(plugins)[0].valid
+        assert len([name for name in relations(builder.tmp_db) if name.startswith("cache_")]) == 2
+
+    def test_evict(self, store, files, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        resources = [DataResource(path=files[fmt], name=fmt, store="local") for fmt in ("csv", "parquet")]
+        for resource in resources:
+            constraint = build_constraint(resource.name, f"select * from {resource.name}")
+            build(store, [resource], [constraint], cache_dir=cache_dir, materialize=True)
+
+        # The table of the resource used by the run is kept
+        constraint = build_constraint("csv", "select * from csv")
+        builder, plugins = build(
+            store, [resources[0]], [constraint], cache_dir=cache_dir, cache_size=0, materialize=True
+        )
+        assert validate(plugins)[0].valid
+        with duckdb.connect(str(builder.tmp_db), read_only=True) as conn:
+            keys = conn.execute(f"SELECT key FROM {CACHE_TABLE}").fetchall()
+        assert [name for name in relations(builder.tmp_db) if name.startswith("cache_")] == [f"cache_{keys[0][0]}"]
+        assert len(keys) == 1
+
+
+class TestRunSchema:
+    @pytest.mark.parametrize("materialize", [False, True])
+    def test_same_name(self, store, tmp_path, materialize):
+        # Runs sharing the persistent db register resources with the same name
+        cache_dir = str(tmp_path / "cache")
+        builds = []
+        for rows in (ROWS, 10):
+            path = tmp_path / f"data_{rows}.csv"
+            pd.DataFrame({"id": range(rows)}).to_csv(path, index=False)
+            resource = DataResource(path=str(path), name="data", store="local")
+            constraint = build_constraint("data", "select * from data", value=rows)
+            builds.append(build(store, [resource], [constraint], cache_dir=cache_dir, materialize=materialize))
+        assert builds[0][0].schema != builds[1][0].schema
+        assert [validate(plugins)[0].valid for _, plugins in builds] == [True, True]
+
+        # Schemas of the runs are dropped at the end of the run, cached tables are kept
+        db = builds[0][0].tmp_db
+        assert len(SCHEMAS[str(db)]) == 2
+        store.clean_paths()
+        assert str(db) not in SCHEMAS
+        tables = relations(db)
+        assert "data" not in tables
+        assert len([name for name in tables if name.startswith("cache_")]) == (2 if materialize else 0)
+
+    def test_temporary_db(self, store, files):
+        # Schemas of a temporary db are removed with the db
+        resource = DataResource(path=files["csv"], name="csv", store="local")
+        builder, plugins = build(store, [resource], [build_constraint("csv", "select * from csv")])
+        assert validate(plugins)[0].valid
+        assert str(builder.tmp_db) not in SCHEMAS
+
+
+class TestSharedConnection:
+    def test_closed(self, store, files, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        resource = DataResource(path=files["csv"], name="csv", store="local")
+        constraints = [build_constraint("csv", "select * from csv", name=f"c{idx}") for idx in range(3)]
+        _, plugins = build(store, [resource], constraints, cache_dir=cache_dir, shared_connection=True, threads=2)
+        assert all(plugin.exec_multithread for plugin in plugins)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = list(pool.map(lambda plugin: plugin.validate(), plugins))
+        assert [res.artifact.valid for res in results] == [True, True, True]
+
+        # The next run can write in the persistent db once the run cleaned the store
+        store.clean_paths()
+        builder, plugins = build(store, [resource], constraints[:1], cache_dir=cache_dir, materialize=True)
+        assert validate(plugins)[0].valid
+
+    def test_not_executed(self, store, files, monkeypatch):
+        # Plugins not executed do not keep the connection open
+        connections = []
+        connect = duckdb.connect
+        monkeypatch.setattr(
+            duckdb, "connect", lambda *args, **kwargs: connections.append(connect(*args, **kwargs)) or connections[-1]
+        )
+        resource = DataResource(path=files["csv"], name="csv", store="local")
+        builder, _ = build(store, [resource], [build_constraint("csv", "select * from csv")], shared_connection=True)
+        shared = connections[-1]
+        assert shared.execute(f"select count(*) from {builder.schema}.csv").fetchone() == (ROWS,)
+        store.clean_paths()
+        with pytest.raises(duckdb.ConnectionException):
+            shared.execute("select 1")
+
+    def test_no_constraints(self, store, files):
+        resource = DataResource(path=files["csv"], name="csv", store="local")
+        builder, plugins = build(store, [resource], [], shared_connection=True)
+        assert plugins == []
+        assert str(builder.tmp_db) not in CONNECTIONS
+
+
+class TestReader:
+    def test_local_csv(self, store, files, tmp_path, monkeypatch):
+        # Fetched files are described once by path, not sniffed from the buffer at every read
+        monkeypatch.setattr(describe, "DESCRIBE_PATH", tmp_path / "describe")
+        monkeypatch.setattr(duckdb_reader, "describe_buffer", lambda *args: pytest.fail("described from the buffer"))
+        assert not store.reads_ranges()
+        reader = duckdb_reader.PandasDataFrameDuckDBReader(store)
+        assert reader.fetch_data(files["csv"])["value"].iloc[-1] == "b;c"
+        assert reader.fetch_data(files["csv"], columns=["id"])["id"].sum() == sum(range(ROWS))
+        assert len(list((tmp_path / "describe").glob("*.json"))) == 1
+
+
+@pytest.fixture
+def store(tmp_path):
+    builder = StoreBuilder()
+    builder.build_input_store(str(tmp_path / "tmp"), {"name": "local", "store_type": "local"})
+    store = builder.get_input_store("local")
+    yield store
+    store.clean_paths()
+
+
+@pytest.fixture
+def files(tmp_path):
+    df = pd.DataFrame({"id": range(ROWS), "value": ["a"] * (ROWS - 1) + ["b;c"]})
+    paths = {"csv": tmp_path / "data.csv", "parquet": tmp_path / "data.parquet"}
+    df.to_csv(paths["csv"], index=False, sep=";")
+    df.to_parquet(paths["parquet"])
+    return {fmt: str(path) for fmt, path in paths.items()}
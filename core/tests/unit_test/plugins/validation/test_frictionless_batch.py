@@ -0,0 +1,143 @@
+import pytest
+from nefertem_core.plugins.utils import ResultType
+from nefertem_core.resources.data_resource import DataResource
+from nefertem_core.stores.builder import StoreBuilder
+from nefertem_validation_frictionless.builder import ValidationBuilderFrictionless
+from nefertem_validation_frictionless.plugin import ValidationPluginFrictionless, ValidationPluginFrictionlessBatch
+
+ROWS = 2000
+
+FRAMEWORK = ResultType.FRAMEWORK.value
+NEFERTEM = ResultType.NEFERTEM.value
+RENDERED = ResultType.RENDERED.value
+
+# Field constraints of the same resource, validated together
+CONSTRAINTS = [
+    ("noisy", "number", "minimum", 0),
+    ("value", "integer", "maximum", 100),
+    ("value", "integer", "minimum", 0),
+    ("code", "string", "pattern", "[a-z]+"),
+    ("id", "integer", "type", None),
+]
+
+
+def build_constraint(field, field_type, constraint, value, name=None) -> dict:
+    return {
+        "type": "frictionless",
+        "name": name or f"{field}_{constraint}",
+        "title": "c",
+        "resources": ["data"],
+        "weight": 5,
+        "field": field,
+        "field_type": field_type,
+        "constraint": constraint,
+        "value": value,
+    }
+
+
+def build(store, path, constraints, **exec_args) -> list:
+    resources = [DataResource(path=path, name="data", store="local")]
+    return ValidationBuilderFrictionless([store], exec_args).build(resources, constraints, "full")
+
+
+def execute(plugin) -> dict:
+    # Execute a plugin, by chunks if it is partitioned
+    partitions = plugin.partition() if plugin.exec_partition else []
+    if not partitions:
+        return plugin.execute()
+    return plugin.merge_partitions([part.execute_partition() for part in partitions])
+
+
+def summary(result) -> list:
+    # Errors and validity of every constraint, without plugin ids and timings
+    framework = [res.artifact.to_dict()["tasks"][0] for res in result[FRAMEWORK]]
+    return [
+        (
+            [(err["type"], err.get("rowNumber"), err.get("fieldName")) for err in task["errors"]],
+            task["stats"]["errors"],
+            task["warnings"],
+            res.artifact.object.valid,
+            res.artifact.object.errors,
+            rendered.artifact[0].object["valid"],
+        )
+        for task, res, rendered in zip(framework, result[NEFERTEM], result[RENDERED])
+    ]
+
+
+def singles(store, path, constraints, **exec_args) -> list:
+    plugins = build(store, path, constraints, batch=False, **exec_args)
+    return ValidationPluginFrictionless._merge([execute(plugin) for plugin in plugins])
+
+
+class TestBatch:
+    @pytest.mark.parametrize("exec_args", [{}, {"limit_errors": 5}, {"limit_errors": 0}])
+    def test_same_results(self, store, data, exec_args):
+        constraints = [build_constraint(*args) for args in CONSTRAINTS]
+        [batch] = build(store, data, constraints, **exec_args)
+        assert isinstance(batch, ValidationPluginFrictionlessBatch)
+        result = batch.execute()
+        assert summary(result) == summary(singles(store, data, constraints, **exec_args))
+        assert [res.artifact.object.valid for res in result[NEFERTEM]] == [False, False, False, False, True]
+        assert result[ResultType.LIBRARY.value] == batch.get_framework()
+
+    def test_own_limit(self, store, data, monkeypatch):
+        # The errors of a field do not use up the errors reported for the others
+        constraints = [build_constraint(*args) for args in CONSTRAINTS[:3]]
+        [batch] = build(store, data, constraints, limit_errors=5)
+        monkeypatch.setattr(ValidationPluginFrictionless, "validate", lambda self: pytest.fail("validated alone"))
+        noisy, maximum, minimum = summary(batch.execute())
+        assert len(noisy[0]) == 5 and noisy[2] == ["reached error limit: 5"]
+        assert [err[1] for err in maximum[0]] == [1502, 1902]
+        assert [err[1] for err in minimum[0]] == [1802]
+        assert maximum[2] == minimum[2] == []
+
+    @pytest.mark.parametrize("exec_args", [{}, {"limit_errors": 5}])
+    def test_chunks(self, store, data, exec_args):
+        constraints = [build_constraint(*args) for args in CONSTRAINTS[:3]]
+        [batch] = build(store, data, constraints, chunk_size=4096, **exec_args)
+        assert len(batch.partition()) > 1
+        assert summary(execute(batch)) == summary(batch.execute())
+
+    def test_fails(self, store, data):
+        # Plugins of the constraints are executed when the batch validation fails
+        constraints = [build_constraint(*args) for args in CONSTRAINTS[1:3]]
+        [batch] = build(store, data, constraints)
+        batch.resource = DataResource(path="missing.csv", name="data", store="local")
+        result = batch.execute()
+        assert [res.artifact.valid for res in result[FRAMEWORK]] == [False, False]
+        assert len(result[RENDERED]) == 2
+
+    def test_render(self, store, data):
+        constraints = [build_constraint(*args) for args in CONSTRAINTS[1:3]]
+        [batch] = build(store, data, constraints)
+        lib_result = batch.validate()
+        rendered = batch.render_nefertem([lib_result, lib_result])
+        assert [res.artifact.object.constraint["name"] for res in rendered] == ["value_maximum", "value_minimum"]
+        assert len(batch.render_artifact([lib_result, lib_result])) == 2
+
+
+# Frictionless reads only relative paths
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def store(workdir):
+    builder = StoreBuilder()
+    builder.build_input_store("tmp", {"name": "local", "store_type": "local"})
+    return builder.get_input_store("local")
+
+
+@pytest.fixture
+def data(workdir):
+    # Every row has an error on noisy, a few rows on value and code
+    lines = ["id,noisy,value,code"]
+    for idx in range(ROWS):
+        value = 200 if idx in (1500, 1900) else -1 if idx == 1800 else idx % 100
+        code = "A1" if idx in (10, 1999) else "abc"
+        lines.append(f"{idx},-1,{value},{code}")
+    path = workdir / "data.csv"
+    path.write_text("\n".join(lines) + "\n")
+    return "data.csv"
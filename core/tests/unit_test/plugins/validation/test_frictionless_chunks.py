@@ -0,0 +1,127 @@
+import csv
+import random
+from pathlib import Path
+
+import pytest
+from nefertem_core.readers.builder import build_reader
+from nefertem_core.resources.data_resource import DataResource
+from nefertem_core.stores.builder import StoreBuilder
+from nefertem_core.utils.commons import FILE_READER
+from nefertem_validation_frictionless.constraints import ConstraintFrictionless
+from nefertem_validation_frictionless.plugin import ValidationPluginFrictionless
+
+ROWS = 5000
+CHUNK_SIZE = 10000
+
+
+def validate(plugin):
+    """
+    Validate a resource, by chunks if the plugin is partitioned.
+    """
+    partitions = plugin.partition() if plugin.exec_partition else []
+    if not partitions:
+        return plugin.validate().artifact.to_dict(), 0
+    result = plugin.merge_reports([part.validate() for part in partitions])
+    return result.artifact.to_dict(), len(partitions)
+
+
+class TestChunkedValidation:
+    def test_quoted_newlines(self, build_plugin, multiline_csv):
+        # A header and values with line breaks inside quotes
+        report, _ = validate(build_plugin(multiline_csv, None))
+        chunked, n_chunks = validate(build_plugin(multiline_csv, CHUNK_SIZE))
+        assert n_chunks > 1
+        assert report["valid"] and chunked["valid"]
+        assert chunked["stats"]["errors"] == report["stats"]["errors"] == 0
+        assert chunked["tasks"][0]["stats"]["rows"] == report["tasks"][0]["stats"]["rows"] == ROWS
+
+    def test_error_rows(self, build_plugin, multiline_csv_errors):
+        report, _ = validate(build_plugin(multiline_csv_errors, None))
+        chunked, n_chunks = validate(build_plugin(multiline_csv_errors, CHUNK_SIZE))
+        assert n_chunks > 1
+        assert not chunked["valid"]
+        rows = [err["rowNumber"] for err in report["tasks"][0]["errors"]]
+        assert [err["rowNumber"] for err in chunked["tasks"][0]["errors"]] == rows
+        assert chunked["stats"]["errors"] == report["stats"]["errors"] == len(rows)
+
+    def test_records_not_cut(self, multiline_csv):
+        options = {"encoding": "utf-8", "dialect": {}}
+        offsets = ValidationPluginFrictionless._split_records(multiline_csv, CHUNK_SIZE, options)
+        with open(multiline_csv, "rb") as file:
+            content = file.read()
+        assert offsets[-1][1] == len(content)
+        for start, end in offsets:
+            # Every chunk is made of whole records
+            chunk = content[start:end].decode()
+            assert chunk.count('"') % 2 == 0
+            assert chunk.endswith("\n")
+
+    def test_not_split(self, build_plugin, multiline_csv):
+        # Smaller than a chunk
+        assert build_plugin(multiline_csv, 10 * 1024 * 1024).partition() == []
+
+        # Encoding not ASCII compatible
+        path = Path("utf16.csv")
+        path.write_text("id,value\n" + "".join(f"{i},{i}\n" for i in range(2000)), encoding="utf-16")
+        options = {"encoding": "utf-16", "dialect": {}}
+        assert ValidationPluginFrictionless._split_records(str(path), 100, options) == []
+
+
+def write_csv(path, errors=()):
+    """
+    Write a CSV file with a two lines header and quoted values with line breaks.
+    """
+    rng = random.Random(42)
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["id", "notes\nfirst, second", "value"])
+        for i in range(ROWS):
+            notes = 'line a\nline b, "quoted"\n' * rng.randint(0, 3)
+            writer.writerow([i, notes, -1 if i in errors else rng.random()])
+    return str(path)
+
+
+# Frictionless reads only relative paths
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def multiline_csv(workdir):
+    return write_csv("multiline.csv")
+
+
+@pytest.fixture
+def multiline_csv_errors(workdir):
+    return write_csv("multiline_errors.csv", errors={3, 1500, 2999, 4999})
+
+
+@pytest.fixture
+def store(workdir):
+    builder = StoreBuilder()
+    builder.build_input_store("tmp", {"name": "local", "store_type": "local"})
+    return builder.get_input_store("local")
+
+
+@pytest.fixture
+def build_plugin(store):
+    def _build(path, chunk_size):
+        resource = DataResource(path=path, name="multiline", store="local")
+        constraint = ConstraintFrictionless(
+            type="frictionless",
+            name="minimum",
+            title="minimum",
+            resources=["multiline"],
+            weight=5,
+            field="value",
+            field_type="number",
+            constraint="minimum",
+            value=0,
+        )
+        plugin = ValidationPluginFrictionless()
+        plugin.setup(build_reader(FILE_READER, store), resource, constraint, "full", {}, chunk_size)
+        return plugin
+
+    return _build
@@ -0,0 +1,322 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import sqlalchemy
+from nefertem_core.plugins.utils import ResultType
+from nefertem_core.resources.data_resource import DataResource
+from nefertem_core.run.handler import RunHandler
+from nefertem_core.run.scheduler import Lane
+from nefertem_core.stores.input.objects.sql import SQLInputStore, SQLStoreConfig
+from nefertem_validation_sqlalchemy import plugin as sql_plugin
+from nefertem_validation_sqlalchemy import reader as sql_reader
+from nefertem_validation_sqlalchemy.builder import ValidationBuilderSqlAlchemy
+from nefertem_validation_sqlalchemy.constraint import ConstraintSqlAlchemy
+from nefertem_validation_sqlalchemy.plugin import ValidationPluginSqlAlchemy, ValidationPluginSqlAlchemyBatch
+from nefertem_validation_sqlalchemy.reader import PandasDataFrameSQLReader
+from tests.unit_test.run.utils_run_tests import build_handler
+
+ROWS = 250
+
+FRAMEWORK = ResultType.FRAMEWORK.value
+NEFERTEM = ResultType.NEFERTEM.value
+RENDERED = ResultType.RENDERED.value
+
+# Rows constraints: long and short results, emptiness and a query that can not be wrapped
+BATCH = [
+    ("select * from data", "exact", ROWS),
+    ("select * from data where id < 10", "minimum", 20),
+    ("select * from data where id < 0", "empty", None),
+    ("select * from data where id > 100", "range", "[100, 200]"),
+    ("select * from data order by id -- sorted", "maximum", 300),
+    ("select id from data where id < 120", "non-empty", None),
+]
+
+
+class SQLiteStore(SQLInputStore):
+    """
+    SQL store of a SQLite database.
+    """
+
+    def _get_connection_string(self) -> str:
+        return f"sqlite:///{self.config.database}"
+
+
+class RecordingReader(PandasDataFrameSQLReader):
+    """
+    Reader that records the queries it executes.
+    """
+
+    def __init__(self, store) -> None:
+        super().__init__(store)
+        self.queries = []
+
+    def fetch_data(self, src, query):
+        self.queries.append(str(query))
+        return super().fetch_data(src, query)
+
+
+def build_constraint(query, expect="minimum", value=0, check="rows", name="data") -> ConstraintSqlAlchemy:
+    return ConstraintSqlAlchemy(
+        type="sqlalchemy",
+        name=name,
+        title=name,
+        resources=["data"],
+        weight=5,
+        query=query,
+        expect=expect,
+        value=value,
+        check=check,
+    )
+
+
+def validate(store, constraint):
+    reader = RecordingReader(store)
+    plugin = ValidationPluginSqlAlchemy()
+    plugin.setup(reader, constraint, "full")
+    result = plugin.validate()
+    assert result.errors is None
+    return result.artifact, reader.queries
+
+
+def build_batch(store, constraints):
+    reader = RecordingReader(store)
+    plugins = []
+    for const in constraints:
+        plugin = ValidationPluginSqlAlchemy()
+        plugin.setup(reader, const, "full")
+        plugins.append(plugin)
+    batch = ValidationPluginSqlAlchemyBatch()
+    batch.setup(reader, plugins, "full")
+    return batch, reader.queries
+
+
+def rendered(result):
+    # Content of the results of every constraint, without plugin ids
+    return [
+        (
+            [report.to_dict() for report in [res.artifact for res in result[FRAMEWORK]]],
+            [res.artifact.object.valid for res in result[NEFERTEM]],
+            [[item.object for item in res.artifact] for res in result[RENDERED]],
+        )
+    ]
+
+
+def read_in_worker(store):
+    # Read from a worker process and return the engines it keeps
+    reader = PandasDataFrameSQLReader(store)
+    count = reader.fetch_data("data", "select count(*) from data").iloc[0, 0]
+    return int(count), len(sql_reader.ENGINES)
+
+
+class TestEngines:
+    def test_shared_and_disposed(self, store):
+        conn_str = store.fetch_native()
+        first, second = PandasDataFrameSQLReader(store), PandasDataFrameSQLReader(store)
+        assert first.fetch_data("data", "select count(*) from data").iloc[0, 0] == ROWS
+        engine = sql_reader.ENGINES[conn_str]
+        second.fetch_data("data", "select * from data")
+        assert sql_reader.ENGINES[conn_str] is engine
+        pool = engine.pool
+
+        # The engine is disposed when the run cleans the store
+        store.clean_paths()
+        assert conn_str not in sql_reader.ENGINES
+        assert engine.pool is not pool
+
+        # The next run opens a new engine
+        first.fetch_data("data", "select 1")
+        assert sql_reader.ENGINES[conn_str] is not engine
+        store.clean_paths()
+        assert not sql_reader.ENGINES
+
+    def test_threads_share_engine(self, store, tmp_path, monkeypatch):
+        engines = []
+        create_engine = sql_reader.create_engine
+
+        def counting(*args, **kwargs):
+            engines.append(create_engine(*args, **kwargs))
+            return engines[-1]
+
+        monkeypatch.setattr(sql_reader, "create_engine", counting)
+        constraints = [
+            build_constraint(f"select * from data where id < {idx * 10}", "non-empty", name=f"c{idx}").dict()
+            for idx in range(1, 5)
+        ]
+        resources = [DataResource(path="sql://db/data", name="data", store="sql")]
+        plugins = ValidationBuilderSqlAlchemy([store], {"batch": False}, 2).build(resources, constraints, "full")
+        assert {RunHandler._get_lane(plugin) for plugin in plugins} == {Lane.THREAD.value}
+
+        # Every constraint of a parallel run reads through one engine
+        handler = build_handler(plugins, tmp_path, parallel=True, num_worker=2)
+        reports = handler.get_item(NEFERTEM, handler.run())
+        assert [report.object.valid for report in reports] == [True] * 4
+        assert len(engines) == 1
+
+    def test_worker_process(self, store):
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(read_in_worker, store).result() == (ROWS, 0)
+            assert pool.submit(read_in_worker, store).result() == (ROWS, 0)
+        assert not sql_reader.ENGINES
+
+
+class TestHeadCount:
+    def test_head(self, store):
+        # Existence and short results are not counted
+        report, queries = validate(store, build_constraint("select * from data where id < 10", "non-empty"))
+        assert report.valid
+        assert len(report.result["id"]) == 10
+        assert len(queries) == 1 and "LIMIT" in queries[0]
+
+        report, queries = validate(store, build_constraint("select * from data where id < 10", "exact", 10))
+        assert report.valid
+        assert len(queries) == 1
+
+    def test_count(self, store):
+        report, queries = validate(store, build_constraint("select * from data", "exact", ROWS))
+        assert report.valid
+        assert len(report.result["id"]) == 100
+        assert len(queries) == 2 and "count" in queries[1]
+
+        report, _ = validate(store, build_constraint("select * from data", "maximum", ROWS - 1))
+        assert not report.valid
+        assert report.error == f"Maximum value {ROWS - 1}, instead got {ROWS}."
+
+    def test_value(self, store):
+        report, queries = validate(store, build_constraint("select max(id) from data", "exact", ROWS - 1, "value"))
+        assert report.valid
+        assert len(queries) == 1
+
+    @pytest.mark.parametrize(
+        "query, expect, value, check",
+        [
+            ("select * from data order by id -- sorted", "exact", ROWS, "rows"),
+            ("select * from data where id < 5 -- few", "non-empty", None, "rows"),
+            ("select count(*) from data -- total", "exact", ROWS, "value"),
+        ],
+    )
+    def test_not_wrapped(self, store, query, expect, value, check):
+        # The trailing comment hides the end of the subquery, the query is executed as it is
+        report, queries = validate(store, build_constraint(query, expect, value, check))
+        assert report.valid
+        assert queries[1:] == [query]
+        if check == "rows":
+            assert len(next(iter(report.result.values()))) == min(100, ROWS if expect == "exact" else 5)
+
+    def test_count_not_wrapped(self, store, monkeypatch):
+        monkeypatch.setattr(sql_plugin, "build_count_query", lambda query: "select count(*) from (")
+        report, queries = validate(store, build_constraint("select * from data", "exact", ROWS))
+        assert report.valid
+        assert queries[1:] == ["select count(*) from (", "select * from data"]
+
+
+class TestBatch:
+    def test_same_results(self, store):
+        constraints = [build_constraint(*args, name=f"c{idx}") for idx, args in enumerate(BATCH)]
+        batch, queries = build_batch(store, constraints)
+        batched = batch.execute()
+        batch_queries = list(queries)
+        singles = ValidationPluginSqlAlchemy._merge([plugin.execute() for plugin in batch.plugins])
+        assert rendered(batched) == rendered(singles)
+        assert [res.artifact.valid for res in batched[FRAMEWORK]] == [True, False, True, True, True, True]
+        assert len(batched[RENDERED]) == len(BATCH)
+        assert batched[ResultType.LIBRARY.value] == batch.get_framework()
+
+        # One head query for every constraint, long results counted together
+        counts = [query for query in batch_queries if "count" in query]
+        assert len(counts) == 1
+        assert counts[0].count("count(*)") == 2
+
+    def test_not_counted(self, store):
+        # Emptiness and short results are checked on the heads, without a count query
+        constraints = [
+            build_constraint("select * from data where id < 10", "minimum", 20, name="short"),
+            build_constraint("select * from data", "empty", name="empty"),
+            build_constraint("select * from data", "non-empty", name="non-empty"),
+        ]
+        batch, queries = build_batch(store, constraints)
+        result = batch.execute()
+        assert [res.artifact.valid for res in result[FRAMEWORK]] == [False, False, True]
+        assert len(queries) == len(constraints)
+        assert not [query for query in queries if "count" in query.lower()]
+
+    def test_batch_query(self):
+        constraints = [build_constraint("select * from data", "exact", ROWS, name=f"c{idx}") for idx in range(2)]
+        query = str(sql_plugin.build_batch_query(constraints))
+        assert query.count("count(*)") == 2
+        assert "EXISTS" not in query.upper()
+
+    def test_count_fails(self, store, monkeypatch):
+        monkeypatch.setattr(sql_plugin, "build_batch_query", lambda constraints: "select count(*) from (")
+        constraints = [build_constraint("select * from data", "exact", ROWS, name=f"c{idx}") for idx in range(2)]
+        batch, queries = build_batch(store, constraints)
+        result = batch.execute()
+        assert [res.artifact.valid for res in result[FRAMEWORK]] == [True, True]
+        assert len([query for query in queries if "count" in query]) == 3
+
+    def test_query_fails(self, store):
+        constraints = [
+            build_constraint("select * from data", "exact", ROWS, name="valid"),
+            build_constraint("select * from missing", "empty", name="invalid"),
+        ]
+        batch, _ = build_batch(store, constraints)
+        result = batch.execute()
+        assert result[FRAMEWORK][0].artifact.valid
+        assert result[FRAMEWORK][1].errors is not None
+        assert [res.artifact.object.valid for res in result[NEFERTEM]] == [True, False]
+
+    @pytest.mark.parametrize("exec_args, n_plugins", [({}, 2), ({"batch": False}, 4)])
+    def test_builder(self, store, exec_args, n_plugins):
+        constraints = [
+            {
+                "type": "sqlalchemy",
+                "name": f"c{idx}",
+                "title": "c",
+                "resources": ["data"],
+                "weight": 1,
+                "query": "select * from data",
+                "expect": "non-empty",
+                "check": check,
+            }
+            for idx, check in enumerate(("rows", "rows", "rows", "value"))
+        ]
+        resources = [DataResource(path="sql://db/data", name="data", store="sql")]
+        plugins = ValidationBuilderSqlAlchemy([store], exec_args).build(resources, constraints, "full")
+        assert len(plugins) == n_plugins
+        if not exec_args:
+            assert [len(plugin.plugins) for plugin in plugins if hasattr(plugin, "plugins")] == [3]
+
+
+class TestCleanup:
+    def test_cleanup(self, store):
+        calls = []
+        store.register_cleanup("a", lambda: calls.append("a"))
+        store.register_cleanup("a", lambda: calls.append("a2"))
+        store.register_cleanup("b", lambda: 1 / 0)
+        store.register_cleanup("c", lambda: calls.append("c"))
+
+        # Cleanup functions stay with the store of the main process
+        assert pickle.loads(pickle.dumps(store))._cleanups == {}
+
+        # A failing function does not stop the others
+        store.clean_paths()
+        assert calls == ["a2", "c"]
+        store.clean_paths()
+        assert calls == ["a2", "c"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "db.sqlite"
+    engine = sqlalchemy.create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("create table data (id integer, value real)"))
+        conn.execute(
+            sqlalchemy.text("insert into data values (:id, :value)"),
+            [{"id": idx, "value": idx / 2} for idx in range(ROWS)],
+        )
+    engine.dispose()
+    config = SQLStoreConfig(driver="sqlite", host="", port=0, user="", password="", database=str(path))
+    store = SQLiteStore("sql", "sql", str(tmp_path / "tmp"), config)
+    yield store
+    store.clean_paths()
@@ -0,0 +1,183 @@
+import os
+import time
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from nefertem_core.client.client import Client
+from nefertem_core.plugins.utils import ExecutionStatus, RenderTuple, Result, ResultType
+from nefertem_core.run.cache import ResultCache
+from nefertem_core.stores.builder import StoreBuilder
+from nefertem_core.utils import describe, snapshot
+from tests.unit_test.run.utils_run_tests import build_handler, build_plugin
+
+FINISHED = ExecutionStatus.FINISHED.value
+ERROR = ExecutionStatus.ERROR.value
+NEFERTEM = ResultType.NEFERTEM.value
+FRAMEWORK = ResultType.FRAMEWORK.value
+RENDERED = ResultType.RENDERED.value
+
+
+class NoFingerprintStore:
+    """
+    Store whose content can not be fingerprinted, as SQL stores.
+    """
+
+    name = "sql"
+    store_type = "sql"
+
+    def get_fingerprint(self, src: str) -> None:
+        return None
+
+
+class TestKey:
+    def test_inputs(self, cache, store, data):
+        plugin = build_plugin("a", inputs=[(store, data)])
+        key = cache.get_key(plugin)
+        assert key == cache.get_key(build_plugin("a", inputs=[(store, data)]))
+        assert key != cache.get_key(build_plugin("b", inputs=[(store, data)]))
+        assert key != cache.get_key(plugin, partition=True)
+
+        # Same path, different content
+        Path(data).write_text("a,b\n1,2\n3,4\n")
+        assert cache.get_key(plugin) != key
+
+        # Same size, different modification time
+        key = cache.get_key(plugin)
+        stat = os.stat(data)
+        os.utime(data, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.get_key(plugin) != key
+
+    def test_not_cached(self, cache, store, data):
+        assert cache.get_key(build_plugin("a")) is None
+        plugin = build_plugin("a", inputs=[(store, data), (NoFingerprintStore(), "table")])
+        assert cache.get_key(plugin) is None
+
+
+class TestGetSet:
+    def test_round_trip(self, cache, tmp_path):
+        rendered = tmp_path / "report.html"
+        rendered.write_text("<html/>")
+        result = build_result(RenderTuple(str(rendered), "report.html"))
+        cache.set("key", result)
+
+        # Rendered files are kept in the cache
+        rendered.unlink()
+        cached = cache.get("key")
+        assert cached[NEFERTEM].artifact == "a"
+        [item] = cached[RENDERED].artifact
+        assert item.filename == "report.html"
+        assert item.object.getvalue() == b"<html/>"
+        assert cache.get("missing") is None
+
+    def test_errors_not_cached(self, cache):
+        cache.set("key", build_result(status=ERROR))
+        cache.set("part", Result(ERROR, 0, ["error"], None))
+        assert cache.get("key") is None
+        assert cache.get("part") is None
+
+    def test_expired(self, cache):
+        cache.set("key", Result(FINISHED, 0, None, "a"))
+        assert cache.get("key").artifact == "a"
+        age(cache, "key", 3600)
+        assert cache.get("key") is None
+
+
+class TestEvict:
+    def test_age(self, cache):
+        for key in ("old", "new"):
+            cache.set(key, Result(FINISHED, 0, None, key))
+        age(cache, "old", 3600)
+        cache.evict()
+        assert sorted(src.stem for src in cache.path.glob("*.pickle")) == ["new"]
+
+    def test_size(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache", 0, 3600)
+        for idx, key in enumerate(("a", "b", "c")):
+            cache.set(key, Result(FINISHED, 0, None, "x" * 1000))
+            age(cache, key, 30 - idx * 10)
+        size = (cache.path / "a.pickle").stat().st_size
+        cache.max_size = 2 * size
+
+        # A result read is the most recently used one
+        cache.get("a")
+        cache.evict()
+        assert sorted(src.stem for src in cache.path.glob("*.pickle")) == ["a", "c"]
+
+
+class TestRunCache:
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_reused(self, tmp_path, cache, store, data, parallel):
+        plugins = [build_plugin("a", inputs=[(store, data)])]
+        build_handler(plugins, tmp_path / "first", cache=cache, parallel=parallel).run()
+
+        # Same work on the same inputs: the cached result is used
+        plugins[:] = [build_plugin("a", inputs=[(store, data)], fail=True)]
+        handler = build_handler(plugins, tmp_path / "second", cache=cache, parallel=parallel)
+        assert handler.get_item(NEFERTEM, handler.run()) == ["a"]
+
+        # Changed inputs: the plugin is executed again
+        Path(data).write_text("a,b\n1,2\n3,4\n")
+        handler = build_handler(plugins, tmp_path / "third", cache=cache, parallel=parallel)
+        with pytest.raises(ValueError, match="a failed"):
+            handler.run()
+
+
+class TestClientCache:
+    def test_path(self, tmp_path):
+        client = Client.__new__(Client)
+        client._tmp_dir = "./ntruns/tmp"
+        cache = client._setup_cache({"max_size": 1024}, str(tmp_path / "out"))
+        assert cache.path == tmp_path / "out" / ".cache"
+        assert cache.max_size == 1024
+
+        # Without an output path the cache is next to the temporary directory
+        assert client._setup_cache({}).path == Path("./ntruns/.cache")
+        assert client._setup_cache(None) is None
+
+    def test_folders(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(describe, "DESCRIBE_PATH", None)
+        monkeypatch.setattr(snapshot, "SNAPSHOT_PATH", None)
+        client = Client.__new__(Client)
+        client._tmp_dir = str(tmp_path / "ntruns" / "tmp")
+        client._setup_folders(str(tmp_path / "out"))
+        assert describe.DESCRIBE_PATH == tmp_path / "out" / ".describe"
+        assert snapshot.SNAPSHOT_PATH == tmp_path / "out" / ".snapshot"
+        client._setup_folders()
+        assert describe.DESCRIBE_PATH == tmp_path / "ntruns" / ".describe"
+        assert snapshot.SNAPSHOT_PATH == tmp_path / "ntruns" / ".snapshot"
+
+
+def build_result(rendered=None, status=FINISHED) -> dict:
+    return {
+        FRAMEWORK: Result(status, 0, None, {"name": "a"}),
+        NEFERTEM: Result(status, 0, None, "a"),
+        RENDERED: Result(status, 0, None, [rendered or RenderTuple(BytesIO(b"a"), "a.txt")]),
+        ResultType.LIBRARY.value: {"libraryName": "dummy", "libraryVersion": "1.0"},
+    }
+
+
+def age(cache, key, seconds):
+    # Set the last use of a cached result some seconds ago
+    src = cache.path / f"{key}.pickle"
+    last_use = time.time() - seconds
+    os.utime(src, (last_use, last_use))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(tmp_path / "cache", 1024**3, 600)
+
+
+@pytest.fixture
+def store(tmp_path):
+    builder = StoreBuilder()
+    builder.build_input_store(str(tmp_path / "tmp"), {"name": "local", "store_type": "local"})
+    return builder.get_input_store("local")
+
+
+@pytest.fixture
+def data(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    return str(path)
@@ -0,0 +1,97 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from nefertem_core.plugins.utils import ResultType
+from nefertem_core.stores.input.objects.local import LocalInputStore, LocalStoreConfig
+from nefertem_core.stores.input.objects.remote import RemoteInputStore, RemoteStoreConfig
+from tests.unit_test.run.utils_run_tests import build_handler, build_plugin
+
+NEFERTEM = ResultType.NEFERTEM.value
+
+
+class CountingStore(LocalInputStore):
+    """
+    Local store that counts the fetches of every path.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.fetched = {}
+        self.running = 0
+        self.max_running = 0
+        self.count_lock = threading.Lock()
+
+    def fetch_file(self, src: str):
+        with self.count_lock:
+            self.fetched[src] = self.fetched.get(src, 0) + 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.05)
+        with self.count_lock:
+            self.running -= 1
+        return super().fetch_file(src)
+
+
+class TestFetchOnce:
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_shared_inputs(self, tmp_path, parallel):
+        store = CountingStore("local", "local", str(tmp_path / "store"), LocalStoreConfig())
+        paths = []
+        for idx in range(6):
+            path = tmp_path / f"data_{idx}.csv"
+            path.write_text("a,b\n1,2\n")
+            paths.append(str(path))
+
+        # Every plugin reads three of the six files
+        plugins = [
+            build_plugin(f"p{idx}", inputs=[(store, paths[(idx + off) % 6]) for off in range(3)]) for idx in range(8)
+        ]
+        handler = build_handler(plugins, tmp_path, parallel=parallel, num_worker=4, num_fetch_worker=2)
+        keys = handler.run()
+        assert handler.get_item(NEFERTEM, keys) == [f"p{idx}" for idx in range(8)]
+        assert store.fetched == {path: 1 for path in paths}
+        assert store.max_running <= 2
+
+    def test_concurrent_fetch_file(self, tmp_path, http_server):
+        # Concurrent requests of the same file download it once
+        root, requests, base_url = http_server
+        (root / "data.csv").write_text("a,b\n1,2\n")
+        store = RemoteInputStore("remote", "http", str(tmp_path / "store"), RemoteStoreConfig())
+        url = f"{base_url}/data.csv"
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            paths = list(pool.map(lambda _: store.fetch_file(url), range(8)))
+        assert len(set(paths)) == 1
+        assert paths[0].read_text() == "a,b\n1,2\n"
+        assert requests.count(("GET", "/data.csv")) == 1
+
+
+@pytest.fixture
+def http_server(tmp_path):
+    """
+    HTTP server of a folder that records the requests it receives.
+    """
+    root = tmp_path / "www"
+    root.mkdir()
+    requests = []
+
+    class Handler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, directory=str(root), **kwargs)
+
+        def do_GET(self) -> None:
+            requests.append(("GET", self.path))
+            time.sleep(0.05)
+            super().do_GET()
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield root, requests, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
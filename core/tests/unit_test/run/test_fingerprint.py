@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+from nefertem_core.plugins.utils import ResultType
+from nefertem_validation_frictionless.constraints import ConstraintFrictionless
+from tests.unit_test.run.utils_run_tests import DummyPlugin, build_handler, build_plugin
+
+NEFERTEM = ResultType.NEFERTEM.value
+
+
+class CountingPlugin(DummyPlugin):
+    """
+    Plugin that counts its executions.
+    """
+
+    executions = []
+    lock = threading.Lock()
+
+    def execute(self) -> dict:
+        with self.lock:
+            self.executions.append(self.resource)
+        return super().execute()
+
+
+def build_counting(name, **kwargs) -> CountingPlugin:
+    plugin = CountingPlugin()
+    plugin.setup(name, **kwargs)
+    return plugin
+
+
+def build_constraint(value, **kwargs) -> ConstraintFrictionless:
+    return ConstraintFrictionless(
+        type="frictionless",
+        name="minimum",
+        title="minimum",
+        resources=["res"],
+        weight=5,
+        field="value",
+        field_type="number",
+        constraint="minimum",
+        value=value,
+        **kwargs,
+    )
+
+
+class TestFingerprint:
+    def test_model_ids(self):
+        # Ids given to models when they are built are not part of the key
+        first, second = build_plugin("a"), build_plugin("a")
+        first.constraint = build_constraint(0)
+        second.constraint = build_constraint(0)
+        assert first.constraint.id != second.constraint.id
+        assert first.fingerprint() == second.fingerprint()
+
+    def test_work_attributes(self):
+        base = build_plugin("a")
+        base.constraint = build_constraint(0)
+        other_value = build_plugin("a")
+        other_value.constraint = build_constraint(1)
+        other_resource = build_plugin("b")
+        other_resource.constraint = build_constraint(0)
+        other_class = build_counting("a")
+        other_class.constraint = build_constraint(0)
+        keys = [plugin.fingerprint() for plugin in (base, other_value, other_resource, other_class)]
+        assert len(set(keys)) == 4
+
+
+class TestWorkOnce:
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        CountingPlugin.executions.clear()
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_duplicates(self, tmp_path, parallel):
+        plugins = [build_counting("a"), build_counting("b"), build_counting("a")]
+        handler = build_handler(plugins, tmp_path, parallel=parallel)
+        keys = handler.run()
+        assert keys == [plugins[0].fingerprint(), plugins[1].fingerprint()]
+        assert sorted(CountingPlugin.executions) == ["a", "b"]
+
+    def test_delta(self, tmp_path):
+        # A new call executes only the plugins not executed in the run
+        plugins = [build_counting("a"), build_counting("b")]
+        handler = build_handler(plugins, tmp_path)
+        first = handler.run(["a", "b"])
+        plugins[:] = [build_counting("b"), build_counting("c")]
+        second = handler.run(["b", "c"])
+        assert CountingPlugin.executions == ["a", "b", "c"]
+        assert handler.get_item(NEFERTEM, first) == ["a", "b"]
+        assert handler.get_item(NEFERTEM, second) == ["b", "c"]
+        assert handler.get_item(NEFERTEM) == ["a", "b", "c"]
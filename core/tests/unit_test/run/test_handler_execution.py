@@ -0,0 +1,165 @@
+import shutil
+import time
+
+import pytest
+from nefertem_core.plugins.plugin import Plugin
+from nefertem_core.plugins.utils import ResultType
+from nefertem_core.stores.builder import StoreBuilder
+from nefertem_core.utils.exceptions import RunError
+from tests.unit_test.run.utils_run_tests import DummyBuilder, DummyPlugin, build_handler, build_plugin
+
+NEFERTEM = ResultType.NEFERTEM.value
+FRAMEWORK = ResultType.FRAMEWORK.value
+RENDERED = ResultType.RENDERED.value
+
+
+class WaitingPlugin(DummyPlugin):
+    """
+    Plugin that completes once the result of another plugin is registered.
+    """
+
+    def execute(self) -> dict:
+        deadline = time.time() + 5
+        while time.time() < deadline and not self.handler.get_item(NEFERTEM, [self.waited]):
+            time.sleep(0.01)
+        self.resource = f"{self.resource}:{bool(self.handler.get_item(NEFERTEM, [self.waited]))}"
+        return super().execute()
+
+
+class CountingBuilder(DummyBuilder):
+    """
+    Builder that records the arguments it builds plugins for.
+    """
+
+    def __init__(self, plugins) -> None:
+        super().__init__(plugins)
+        self.calls = []
+
+    def build(self, *args, **kwargs):
+        self.calls.append(args)
+        return [build_plugin(name) for name in args[0]]
+
+
+class UnmergedPlugin(DummyPlugin):
+    """
+    Plugin that splits its work without merging the results.
+    """
+
+    merge_partitions = Plugin.merge_partitions
+
+
+class TestRegistration:
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_build_order(self, tmp_path, parallel):
+        # Plugins complete in reverse order
+        plugins = [build_plugin(name, delay=delay) for name, delay in (("a", 0.3), ("b", 0.15), ("c", 0))]
+        handler = build_handler(plugins, tmp_path, parallel=parallel, num_worker=3)
+        keys = handler.run()
+        assert handler.get_item(NEFERTEM) == ["a", "b", "c"]
+        assert handler.get_item(NEFERTEM, keys[::-1]) == ["c", "b", "a"]
+        assert [obj.filename for obj in handler.get_item(RENDERED, keys[1:2])] == ["b.json", "b.txt"]
+
+    def test_register_on_completion(self, tmp_path):
+        # A result is registered while the plugins built before it are running
+        fast = build_plugin("fast")
+        slow = WaitingPlugin()
+        slow.setup("slow")
+        plugins = [slow, fast]
+        handler = build_handler(plugins, tmp_path, parallel=True, num_worker=2)
+        slow.handler = handler
+        slow.waited = fast.fingerprint()
+        handler.run()
+        assert handler.get_item(NEFERTEM) == ["slow:True", "fast"]
+
+    def test_inputs(self, tmp_path, store):
+        # Plugins start once their inputs are fetched
+        path = tmp_path / "data.csv"
+        path.write_text("a,b\n1,2\n")
+        inputs = [(store, str(path))]
+        plugins = [build_plugin("a", inputs=inputs, delay=0.1), build_plugin("b", inputs=inputs)]
+        handler = build_handler(plugins, tmp_path, parallel=True, num_worker=2)
+        keys = handler.run()
+        assert handler.get_item(NEFERTEM, keys) == ["a", "b"]
+
+    def test_work_executed_once(self, tmp_path):
+        plugins = [build_plugin("a"), build_plugin("a"), build_plugin("b")]
+        handler = build_handler(plugins, tmp_path, parallel=True)
+        keys = handler.run()
+        assert len(keys) == 2
+        assert handler.get_item(NEFERTEM) == ["a", "b"]
+        handler.run()
+        assert handler.get_item(NEFERTEM) == ["a", "b"]
+
+    def test_built_once(self, tmp_path):
+        # Builders build plugins once for the same arguments
+        builders = []
+        handler = build_handler([], tmp_path, parallel=True)
+        handler._get_builder = lambda: builders.append(CountingBuilder([])) or builders
+        keys = handler.run(["a", "b"], "full")
+        assert handler.run(["a", "b"], "full") == keys
+        assert len(builders) == 1
+        assert builders[0].calls == [(["a", "b"], "full")]
+
+        assert handler.run(["a", "c"], "full") != keys
+        assert builders[0].calls[1:] == [(["a", "c"], "full")]
+        assert handler.get_item(NEFERTEM) == ["a", "b", "c"]
+
+
+class TestGraphExecution:
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_error_propagation(self, tmp_path, parallel):
+        plugins = [build_plugin("a"), build_plugin("b", fail=True)]
+        handler = build_handler(plugins, tmp_path, parallel=parallel)
+        with pytest.raises(ValueError, match="b failed"):
+            handler.run()
+
+    def test_lanes(self, tmp_path):
+        plugins = [
+            build_plugin("process", lane="process", lossy=True),
+            build_plugin("thread", lane="thread"),
+            build_plugin("sequential", lane="sequential"),
+        ]
+        handler = build_handler(plugins, tmp_path, parallel=True, num_worker=2)
+        handler.run()
+        assert handler.get_item(NEFERTEM) == ["process", "thread", "sequential"]
+        assert handler.get_item(FRAMEWORK)[0].content == "process"
+
+    def test_partitions(self, tmp_path):
+        plugins = [build_plugin("a", parts=3, lane="process"), build_plugin("b")]
+        handler = build_handler(plugins, tmp_path, parallel=True, num_worker=2)
+        handler.run()
+        assert handler.get_item(FRAMEWORK) == [{"name": "a", "parts": ["a:0", "a:1", "a:2"]}, {"name": "b"}]
+
+    def test_partitions_not_supported(self, tmp_path):
+        plugin = UnmergedPlugin()
+        plugin.setup("a", parts=2)
+        handler = build_handler([plugin], tmp_path, parallel=True)
+        with pytest.raises(RunError, match=f"UnmergedPlugin {plugin.id} does not support the merge"):
+            handler.run()
+        with pytest.raises(RunError, match="does not support the execution"):
+            Plugin.execute_partition(plugin)
+
+
+class TestStreamRegistry:
+    def test_framework_after_run(self, tmp_path):
+        plugins = [build_plugin("a", lane="process", lossy=True), build_plugin("b")]
+        handler = build_handler(plugins, tmp_path, parallel=True, num_worker=2, registry="stream")
+        handler.run()
+
+        # The temporary folder of the client is removed when the run ends
+        shutil.rmtree(tmp_path / "tmp", ignore_errors=True)
+        frameworks = handler.get_item(FRAMEWORK)
+        assert frameworks[0].content == "a"
+        assert frameworks[1] == {"name": "b"}
+        assert list((tmp_path / "run" / "registry").glob("*.pickle"))
+        rendered = handler.get_item(RENDERED)
+        assert [obj.filename for obj in rendered] == ["a.json", "a.txt", "b.json", "b.txt"]
+        assert all((tmp_path / "run" / "registry") in obj.object.parents for obj in rendered)
+        assert handler.get_item(NEFERTEM) == ["a", "b"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    builder = StoreBuilder()
+    builder.build_input_store(str(tmp_path / "tmp"), {"name": "local", "store_type": "local"})
+    return builder.get_input_store("local")
@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+from nefertem_core.plugins.utils import ExecutionStatus, Result, ResultType
+from nefertem_core.run.pool import WorkerPool
+from nefertem_core.utils.exceptions import RunError
+from tests.unit_test.run.utils_run_tests import DummyPlugin, build_handler
+
+
+class PidPlugin(DummyPlugin):
+    """
+    Plugin that returns the process where it is executed.
+    """
+
+    def execute(self) -> dict:
+        return self.render(Result(ExecutionStatus.FINISHED.value, 0, None, os.getpid()))
+
+
+def get_pid():
+    return os.getpid()
+
+
+def is_imported(module):
+    return module in sys.modules
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(2, ["colorsys", "not_a_module"])
+    yield pool
+    pool.shutdown()
+
+
+class TestWorkerPool:
+    def test_start(self, pool):
+        with pytest.raises(RunError):
+            pool.get_executor()
+        pool.start()
+        executor = pool.get_executor()
+
+        # Starting again keeps the same workers
+        pool.start()
+        assert pool.get_executor() is executor
+        assert executor.submit(get_pid).result() != os.getpid()
+
+    def test_warmup(self, pool):
+        # Modules are imported once by every worker, missing ones are skipped
+        pool.start()
+        assert all(pool.get_executor().map(is_imported, ["colorsys"] * 4))
+
+    def test_shutdown(self, pool):
+        pool.start()
+        pool.shutdown()
+        with pytest.raises(RunError):
+            pool.get_executor()
+        pool.shutdown()
+
+    def test_shared_by_runs(self, pool, tmp_path):
+        # Runs use the workers of the pool and do not stop them
+        pool.start()
+        workers = set(pool.get_executor()._processes)
+        for idx in range(2):
+            plugin = PidPlugin()
+            plugin.setup(f"plugin{idx}", lane="process")
+            handler = build_handler([plugin], tmp_path, pool=pool, parallel=True)
+            handler.run()
+            assert handler.get_item(ResultType.FRAMEWORK.value)[0] in workers
+        assert set(pool.get_executor()._processes) == workers
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+import pytest
+from nefertem_core.plugins.utils import RenderTuple, ResultType
+from nefertem_core.run.registry import ResultRegistry, StreamRegistry, build_registry
+from tests.unit_test.run.utils_run_tests import build_plugin
+
+FRAMEWORK = ResultType.FRAMEWORK.value
+NEFERTEM = ResultType.NEFERTEM.value
+RENDERED = ResultType.RENDERED.value
+LIBRARY = ResultType.LIBRARY.value
+
+
+def register(registry, *names):
+    for name in names:
+        plugin = build_plugin(name)
+        registry.register(plugin.execute(), name)
+
+
+def test_build_registry(tmp_path):
+    assert type(build_registry("memory", tmp_path)) is ResultRegistry
+    assert isinstance(build_registry("stream", tmp_path), StreamRegistry)
+
+
+class TestResultRegistry:
+    def test_get_item(self):
+        registry = ResultRegistry()
+        register(registry, "a", "b", "c")
+        assert registry.get_item(NEFERTEM) == ["a", "b", "c"]
+        assert registry.get_item(NEFERTEM, ["c", "a"]) == ["c", "a"]
+        assert registry.get_item(FRAMEWORK, ["b"]) == [{"name": "b"}]
+        assert [obj.filename for obj in registry.get_item(RENDERED, ["a"])] == ["a.json", "a.txt"]
+
+        # Libraries are registered once
+        assert registry.get_item(LIBRARY) == [{"framework_name": "dummy", "framework_version": "1.0"}]
+        assert registry.get_item("unknown") == []
+
+
+class TestStreamRegistry:
+    @pytest.fixture
+    def registry(self, tmp_path):
+        return StreamRegistry(tmp_path / "registry")
+
+    def test_framework(self, registry, tmp_path):
+        register(registry, "a")
+        registry.register({FRAMEWORK: build_plugin("b", lossy=True).execute()[FRAMEWORK]}, "b")
+
+        # Only paths are kept in memory
+        paths = [obj for _, obj in registry._items[FRAMEWORK]]
+        assert all(isinstance(obj, Path) and obj.exists() for obj in paths)
+        frameworks = registry.get_item(FRAMEWORK)
+        assert frameworks[0] == {"name": "a"}
+        assert frameworks[1].content == "b"
+
+    def test_rendered(self, registry, tmp_path):
+        registry.register({RENDERED: build_plugin("a").execute()[RENDERED]}, "a")
+        obj = RenderTuple(tmp_path / "file.csv", "file.csv")
+        result = build_plugin("b").execute()[RENDERED]
+        result.artifact = [obj]
+        registry.register({RENDERED: result}, "b")
+
+        json_file, text_file, path = registry.get_item(RENDERED)
+        assert json.loads(json_file.object.read_text()) == {"name": "a"}
+        assert text_file.object.read_bytes() == b"a"
+        assert (tmp_path / "registry") in json_file.object.parents
+        assert text_file.filename == "a.txt"
+
+        # Paths are left where they are
+        assert path == obj
+
+    def test_nefertem(self, registry):
+        # Nefertem reports stay in memory
+        register(registry, "a", "b")
+        assert registry._items[NEFERTEM] == [("a", "a"), ("b", "b")]
+        assert registry.get_item(NEFERTEM, ["b", "a"]) == ["b", "a"]
@@ -0,0 +1,160 @@
+import concurrent.futures
+import os
+import threading
+import time
+
+import pytest
+from nefertem_core.run.scheduler import Lane, Scheduler, Task
+from nefertem_core.utils.exceptions import RunError
+from tests.unit_test.run.utils_run_tests import Lossy
+
+IO = Lane.IO.value
+THREAD = Lane.THREAD.value
+PROCESS = Lane.PROCESS.value
+SEQUENTIAL = Lane.SEQUENTIAL.value
+
+
+def get_pid(*args):
+    return os.getpid()
+
+
+def get_lossy(content):
+    return Lossy(content)
+
+
+def fail(*args):
+    raise ValueError("task failed")
+
+
+class Recorder:
+    """
+    Record the tasks executed and the maximum number of concurrent tasks.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.order = []
+        self.running = 0
+        self.max_running = 0
+
+    def task(self, name, delay=0.0):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(delay)
+        with self.lock:
+            self.running -= 1
+            self.order.append(name)
+        return name
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+class TestScheduler:
+    def test_dependencies(self, recorder):
+        scheduler = Scheduler({IO: 2, THREAD: 2})
+        results = {}
+        scheduler.add_task(Task("fetch:a", recorder.task, ("fetch:a", 0.1), IO))
+        scheduler.add_task(Task("fetch:b", recorder.task, ("fetch:b",), IO))
+        for name, deps in (("a", ["fetch:a"]), ("b", ["fetch:b"]), ("ab", ["fetch:a", "fetch:b"])):
+            task = Task(name, recorder.task, (name,), THREAD, callback=lambda res: results.setdefault(res, res))
+            scheduler.add_task(task, deps)
+        scheduler.run()
+
+        order = recorder.order
+        assert order.index("b") > order.index("fetch:b")
+        assert order.index("a") > order.index("fetch:a")
+        assert order.index("ab") > max(order.index("fetch:a"), order.index("fetch:b"))
+        # A plugin starts while another input is still fetched
+        assert order.index("b") < order.index("fetch:a")
+        assert set(results) == {"a", "b", "ab"}
+
+    def test_lane_capacity(self, recorder):
+        scheduler = Scheduler({IO: 1, THREAD: 3})
+        for idx in range(4):
+            scheduler.add_task(Task(f"io:{idx}", recorder.task, (f"io:{idx}", 0.02), IO))
+        scheduler.run()
+        assert recorder.max_running == 1
+
+        recorder = Recorder()
+        scheduler = Scheduler({IO: 1, THREAD: 3})
+        for idx in range(6):
+            scheduler.add_task(Task(f"thread:{idx}", recorder.task, (f"thread:{idx}", 0.05), THREAD))
+        scheduler.run()
+        assert recorder.max_running == 3
+
+    def test_lanes_overlap(self, recorder):
+        # Tasks of different lanes run at the same time
+        scheduler = Scheduler({IO: 1, THREAD: 1, SEQUENTIAL: 1})
+        for lane in (IO, THREAD, SEQUENTIAL):
+            scheduler.add_task(Task(lane, recorder.task, (lane, 0.1), lane))
+        scheduler.run()
+        assert recorder.max_running == 3
+
+    def test_priority(self, recorder):
+        scheduler = Scheduler({IO: 1})
+        for idx, priority in enumerate((3, 1, 2, 0)):
+            scheduler.add_task(Task(str(idx), recorder.task, (str(idx),), IO, priority=priority))
+        scheduler.run()
+        assert recorder.order == ["3", "1", "2", "0"]
+
+    def test_expand(self, recorder):
+        # Callbacks add tasks while the graph is executed
+        scheduler = Scheduler({THREAD: 2})
+
+        def expand(parts):
+            keys = []
+            for part in parts:
+                scheduler.add_task(Task(part, recorder.task, (part,), THREAD))
+                keys.append(part)
+            scheduler.add_task(Task("merge", recorder.task, ("merge",), THREAD), keys)
+
+        scheduler.add_task(Task("split", lambda: ["p0", "p1", "p2"], (), THREAD, callback=expand))
+        scheduler.run()
+        assert recorder.order[-1] == "merge"
+        assert sorted(recorder.order[:-1]) == ["p0", "p1", "p2"]
+
+    def test_process_lane(self):
+        results = []
+        scheduler = Scheduler({PROCESS: 2})
+        scheduler.add_task(Task("pid", get_pid, (), PROCESS, callback=results.append))
+        scheduler.add_task(Task("lossy", get_lossy, ("content",), PROCESS, callback=results.append))
+        scheduler.run()
+        pid = next(res for res in results if isinstance(res, int))
+        lossy = next(res for res in results if isinstance(res, Lossy))
+        assert pid != os.getpid()
+        # Results are pickled with the reducers registered by plugins
+        assert lossy.content == "content"
+
+    def test_error_propagation(self, recorder):
+        scheduler = Scheduler({THREAD: 1, PROCESS: 1})
+        scheduler.add_task(Task("fail", fail, (), THREAD))
+        scheduler.add_task(Task("after", recorder.task, ("after",), THREAD), ["fail"])
+        with pytest.raises(ValueError, match="task failed"):
+            scheduler.run()
+        assert "after" not in recorder.order
+
+        scheduler = Scheduler({PROCESS: 1})
+        scheduler.add_task(Task("fail", fail, (), PROCESS))
+        with pytest.raises(ValueError, match="task failed"):
+            scheduler.run()
+
+    def test_add_task_errors(self):
+        scheduler = Scheduler({THREAD: 1})
+        scheduler.add_task(Task("a", get_pid, (), THREAD))
+        with pytest.raises(RunError):
+            scheduler.add_task(Task("a", get_pid, (), THREAD))
+        with pytest.raises(RunError):
+            scheduler.add_task(Task("b", get_pid, (), THREAD), ["missing"])
+
+    def test_shared_executors(self):
+        # Executors given by the caller are not shut down
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        scheduler = Scheduler({THREAD: 1}, {THREAD: executor})
+        scheduler.add_task(Task("a", get_pid, (), THREAD))
+        scheduler.run()
+        assert executor.submit(get_pid).result() == os.getpid()
+        executor.shutdown()
@@ -0,0 +1,131 @@
+import time
+
+from nefertem_core.plugins.plugin import Plugin
+from nefertem_core.plugins.utils import ExecutionStatus, RenderTuple, Result, ResultType
+from nefertem_core.run.config import RunConfig
+from nefertem_core.run.handler import RunHandler
+from nefertem_core.utils.io_utils import write_bytesio
+from nefertem_core.utils.pickle_utils import register_reducer
+
+FINISHED = ExecutionStatus.FINISHED.value
+
+
+class Lossy:
+    """
+    Object that loses its content when pickled as it is,
+    as frictionless metadata objects.
+    """
+
+    def __init__(self, content) -> None:
+        self.content = content
+
+    def __getstate__(self) -> dict:
+        return {}
+
+    def __setstate__(self, state: dict) -> None:
+        self.content = None
+
+
+register_reducer(Lossy, lambda obj: (Lossy, (obj.content,)))
+
+
+class DummyBuilder:
+    """
+    Builder that returns the plugins it is given.
+    """
+
+    def __init__(self, plugins) -> None:
+        self.plugins = plugins
+
+    def build(self, *args, **kwargs):
+        return self.plugins
+
+
+class DummyPlugin(Plugin):
+    """
+    Plugin that returns its name after a delay, without a framework.
+    """
+
+    def setup(self, name, inputs=None, delay=0.0, lane="thread", parts=0, fail=False, lossy=False) -> None:
+        self.resource = name
+        self.lossy = lossy
+        self.inputs = inputs or []
+        self.delay = delay
+        self.fail = fail
+        self.parts = parts
+        self.partition_id = None
+        self.exec_partition = parts > 0
+        self.exec_multiprocess = lane == "process"
+        self.exec_multithread = lane == "thread"
+
+    def get_inputs(self):
+        return self.inputs
+
+    def execute(self) -> dict:
+        time.sleep(self.delay)
+        if self.fail:
+            raise ValueError(f"{self.resource} failed")
+        artifact = Lossy(self.resource) if self.lossy else {"name": self.resource}
+        return self.render(Result(FINISHED, self.delay, None, artifact))
+
+    def partition(self):
+        partitions = []
+        for idx in range(self.parts):
+            part = DummyPlugin()
+            part.setup(f"{self.resource}:{idx}", self.inputs, self.delay)
+            part.partition_id = idx
+            partitions.append(part)
+        return partitions
+
+    def execute_partition(self) -> Result:
+        time.sleep(self.delay)
+        return Result(FINISHED, self.delay, None, {"name": self.resource})
+
+    def merge_partitions(self, results) -> dict:
+        names = [res.artifact["name"] for res in results]
+        return self.render(Result(FINISHED, 0, None, {"name": self.resource, "parts": names}))
+
+    def render(self, result: Result) -> dict:
+        return {
+            ResultType.FRAMEWORK.value: result,
+            ResultType.NEFERTEM.value: self.render_nefertem(result),
+            ResultType.RENDERED.value: self.render_artifact(result),
+            ResultType.LIBRARY.value: self.get_framework(),
+        }
+
+    def render_nefertem(self, result: Result) -> Result:
+        return Result(FINISHED, result.duration, None, self.resource)
+
+    def render_artifact(self, result: Result) -> Result:
+        rendered = [
+            RenderTuple({"name": self.resource}, f"{self.resource}.json"),
+            RenderTuple(write_bytesio(self.resource), f"{self.resource}.txt"),
+        ]
+        return Result(FINISHED, result.duration, None, rendered)
+
+    @staticmethod
+    def framework_name() -> str:
+        return "dummy"
+
+    @staticmethod
+    def framework_version() -> str:
+        return "1.0"
+
+
+def build_plugin(name, **kwargs) -> DummyPlugin:
+    plugin = DummyPlugin()
+    plugin.setup(name, **kwargs)
+    return plugin
+
+
+def build_config(**kwargs) -> RunConfig:
+    return RunConfig(operation="validation", exec_config=[], **kwargs)
+
+
+def build_handler(plugins, tmp_path, cache=None, pool=None, **kwargs) -> RunHandler:
+    """
+    Build a run handler that executes the given plugins.
+    """
+    handler = RunHandler(build_config(**kwargs), str(tmp_path / "tmp"), pool, cache, tmp_path / "run")
+    handler._get_builder = lambda: [DummyBuilder(plugins)]
+    return handler
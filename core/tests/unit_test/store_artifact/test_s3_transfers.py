@@ -0,0 +1,165 @@
+import concurrent.futures
+import io
+import pickle
+import threading
+
+import boto3
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from moto import mock_s3
+from nefertem_core.stores.builder import StoreBuilder
+from nefertem_core.stores.input.objects.s3 import S3InputStore, S3StoreConfig
+from nefertem_core.utils.exceptions import StoreError
+
+BUCKET = "test"
+ENDPOINT = "http://localhost:9000"
+MB = 1024**2
+
+
+class TestPooledClient:
+    def test_one_client(self, store, requests):
+        store.fetch_file("a/data.csv")
+        client = store._get_client()
+        store.fetch_file("b/data.csv")
+        store.get_fingerprint("a/data.csv")
+        assert store._get_client() is client
+        assert requests.count("HeadBucket") == 1
+
+        # Access is checked again by the next run
+        store.clean_paths()
+        store.fetch_file("a/data.csv")
+        assert requests.count("HeadBucket") == 2
+
+    def test_pickle(self, store):
+        store.fetch_file("a/data.csv")
+        state = pickle.loads(pickle.dumps(store))
+        assert state._client is None
+        assert state._get_client() is not store._get_client()
+
+    def test_folders(self, store, requests):
+        keys = [f"{folder}/data.csv" for folder in ("a", "b", "c")]
+        with concurrent.futures.ThreadPoolExecutor(3) as pool:
+            paths = list(pool.map(store.fetch_file, keys))
+
+        # Objects with the same name in different folders are kept apart
+        assert len(set(paths)) == 3
+        assert [open(path).read() for path in paths] == [f"id\n{folder}\n" for folder in ("a", "b", "c")]
+        assert [store.fetch_file(key) for key in keys] == paths
+        assert requests.count("GetObject") == 3
+        assert requests.count("HeadBucket") == 1
+
+    @pytest.mark.parametrize("key", ["../data.csv", "a/../../data.csv", "/a/../../../data.csv"])
+    def test_outside_folder(self, store, s3, requests, key):
+        with pytest.raises(StoreError, match="outside the download folder"):
+            store.fetch_file(key)
+        assert requests.count("GetObject") == 0
+
+    def test_ranged_download(self, store, s3, requests):
+        content = bytes(range(256)) * (12 * MB // 256)
+        s3.put_object(Bucket=BUCKET, Key="large.bin", Body=content)
+        path = store.fetch_file("large.bin")
+        assert open(path, "rb").read() == content
+        assert requests.count("GetObject") == 12 * MB // (5 * MB) + 1
+
+
+class TestBuffer:
+    def test_read_seek(self, store, s3):
+        content = bytes(range(256)) * 100
+        s3.put_object(Bucket=BUCKET, Key="data.bin", Body=content)
+        with store.fetch_buffer("data.bin") as buffer:
+            assert buffer.read(10) == content[:10]
+            buffer.seek(-5, io.SEEK_END)
+            assert buffer.read() == content[-5:]
+            buffer.seek(1000)
+            assert buffer.read(300) == content[1000:1300]
+            assert buffer.read(10**6) == content[1300:]
+            assert buffer.read() == b""
+
+    def test_parquet_columns(self, store, s3, requests, tmp_path):
+        # Reading a column transfers only the footer and its column chunks
+        df = pd.DataFrame({"small": range(200_000), "large": [f"value {i}" * 5 for i in range(200_000)]})
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, compression=None)
+        s3.put_object(Bucket=BUCKET, Key="data.parquet", Body=buffer.getvalue())
+
+        with store.fetch_buffer("data.parquet") as file:
+            table = pq.read_table(file, columns=["small"])
+        assert table.column("small").to_pylist() == list(range(200_000))
+        assert 0 < requests.transferred < len(buffer.getvalue()) / 2
+        assert not list((tmp_path / "tmp").rglob("*.parquet"))
+
+    def test_reads_ranges(self, store, tmp_path):
+        builder = StoreBuilder()
+        builder.build_input_store(str(tmp_path / "tmp"), {"name": "local", "store_type": "local"})
+        assert store.reads_ranges()
+        assert not builder.get_input_store("local").reads_ranges()
+
+    def test_csv(self, store, requests):
+        with store.fetch_buffer("a/data.csv") as file:
+            assert pd.read_csv(file)["id"].tolist() == ["a"]
+        assert requests.count("GetObject") == 1
+
+        # Fetched files are read from the temporary directory
+        store.fetch_file("b/data.csv")
+        calls = requests.count("GetObject")
+        with store.fetch_buffer("b/data.csv") as file:
+            assert file.read() == b"id\nb\n"
+        assert requests.count("GetObject") == calls
+
+
+class Requests(list):
+    """
+    Names of the requests sent by a client and bytes received.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.transferred = 0
+        self.lock = threading.Lock()
+
+    def before(self, model, **kwargs) -> None:
+        with self.lock:
+            self.append(model.name)
+
+    def after(self, http_response, parsed, model, **kwargs) -> None:
+        if model.name == "GetObject":
+            with self.lock:
+                self.transferred += int(parsed.get("ContentLength", 0))
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("MOTO_S3_CUSTOM_ENDPOINTS", ENDPOINT)
+    with mock_s3():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        for folder in ("a", "b", "c"):
+            client.put_object(Bucket=BUCKET, Key=f"{folder}/data.csv", Body=f"id\n{folder}\n".encode())
+        yield client
+
+
+@pytest.fixture
+def store(s3, tmp_path):
+    config = S3StoreConfig(
+        endpoint_url=ENDPOINT,
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        bucket_name=BUCKET,
+        multipart_threshold=5 * MB,
+        multipart_chunksize=5 * MB,
+        read_buffer_size=64 * 1024,
+    )
+    return S3InputStore("s3", "s3", str(tmp_path / "tmp"), config)
+
+
+@pytest.fixture
+def requests(store):
+    recorded = Requests()
+    events = store._get_client().meta.events
+    events.register("before-call.s3", recorded.before)
+    events.register("after-call.s3", recorded.after)
+    return recorded
@@ -0,0 +1,139 @@
+import datetime
+import decimal
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import sqlalchemy
+from nefertem_core.stores.input.objects.sql import SQLInputStore, SQLStoreConfig, build_sql_path
+from nefertem_core.utils.exceptions import StoreError
+
+ROWS = 2500
+
+
+class TestExport:
+    def test_batches(self, store):
+        path = store.fetch_file("sql://db/data")
+        parquet = pq.ParquetFile(path)
+        assert parquet.metadata.num_row_groups == 3
+        assert parquet.schema_arrow == pa.schema(
+            [
+                ("id", pa.int64()),
+                ("name", pa.string()),
+                ("score", pa.float64()),
+                ("price", pa.decimal128(10, 2)),
+                ("day", pa.date32()),
+                ("created", pa.timestamp("us")),
+                ("active", pa.bool_()),
+            ]
+        )
+        table = parquet.read()
+        assert table.num_rows == ROWS
+        assert table.slice(2001, 1).to_pylist() == [
+            {
+                "id": 2001,
+                "name": "name 2001",
+                "score": 1000.5,
+                "price": decimal.Decimal("20.01"),
+                "day": datetime.date(2020, 1, 2),
+                "created": datetime.datetime(2020, 1, 1, 12, 30),
+                "active": False,
+            }
+        ]
+
+    def test_types_from_table(self, store):
+        # Values of the first batch are all null
+        path = store.fetch_file("sql://db/data?columns=id,score")
+        scores = pq.read_table(path).column("score").to_pylist()
+        assert scores[:1000] == [None] * 1000
+        assert scores[1000] == 500.0
+
+    def test_invalid_value(self, store, engine):
+        # A value that does not match its column type is not nulled or truncated
+        with engine.begin() as conn:
+            conn.execute(sqlalchemy.text("update data set id = 1.5 where id = 2400"))
+        with pytest.raises(StoreError, match="column id"):
+            store.fetch_file("sql://db/data")
+
+    def test_empty(self, store):
+        path = store.fetch_file(build_sql_path("sql://db/data", ["id", "name"], [("id", "<", -1)]))
+        table = pq.read_table(path)
+        assert table.num_rows == 0
+        assert table.schema == pa.schema([("id", pa.int64()), ("name", pa.string())])
+
+
+class TestFilters:
+    def test_filters(self, store):
+        path = store.fetch_file(build_sql_path("sql://db/data", ["id"], [("id", ">=", 10), ("id", "<", 13)]))
+        assert pq.read_table(path).column("id").to_pylist() == [10, 11, 12]
+        path = store.fetch_file(build_sql_path("sql://db/data", ["id"], [("name", "=", "'name 7'")]))
+        assert pq.read_table(path).column("id").to_pylist() == [7]
+
+    def test_values_bound(self, store, engine):
+        values = ["0 or 1 = 1", "x'; drop table data; --"]
+        for value in values:
+            path = store.fetch_file(build_sql_path("sql://db/data", ["id"], [("name", "=", value)]))
+            assert pq.read_table(path).num_rows == 0
+        assert "data" in sqlalchemy.inspect(engine).get_table_names()
+
+    def test_invalid(self, store):
+        with pytest.raises(StoreError):
+            store.fetch_file(build_sql_path("sql://db/data", ["id"], [("missing", "=", 1)]))
+        with pytest.raises(StoreError):
+            store.fetch_file("sql://db/data?columns=id;drop")
+        with pytest.raises(ValueError):
+            store.fetch_file("sql://db/data?where=id")
+        with pytest.raises(ValueError):
+            build_sql_path("sql://db/data", filters=[("id", "like", 1)])
+
+    def test_parse_path(self):
+        path = build_sql_path("sql://db/data", ["a", "b"], [("a", ">", 0), ("b", "<>", "'x y'")])
+        assert SQLInputStore._parse_path(path) == {
+            "database": "db",
+            "table": "data",
+            "columns": ["a", "b"],
+            "filters": [("a", ">", "0"), ("b", "<>", "'x y'")],
+        }
+        assert SQLInputStore._parse_path("sql://db/data")["filters"] is None
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    metadata = sqlalchemy.MetaData()
+    table = sqlalchemy.Table(
+        "data",
+        metadata,
+        sqlalchemy.Column("id", sqlalchemy.Integer),
+        sqlalchemy.Column("name", sqlalchemy.String(20)),
+        sqlalchemy.Column("score", sqlalchemy.Float),
+        sqlalchemy.Column("price", sqlalchemy.Numeric(10, 2)),
+        sqlalchemy.Column("day", sqlalchemy.Date),
+        sqlalchemy.Column("created", sqlalchemy.DateTime),
+        sqlalchemy.Column("active", sqlalchemy.Boolean),
+    )
+    metadata.create_all(engine)
+    rows = [
+        {
+            "id": idx,
+            "name": f"name {idx}",
+            "score": idx / 2 if idx >= 1000 else None,
+            "price": decimal.Decimal(idx) / 100,
+            "day": datetime.date(2020, 1, 1 + idx % 2),
+            "created": datetime.datetime(2020, 1, 1, 12, 30),
+            "active": idx % 2 == 0,
+        }
+        for idx in range(ROWS)
+    ]
+    with engine.begin() as conn:
+        conn.execute(table.insert(), rows)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def store(engine, tmp_path):
+    config = SQLStoreConfig(driver="sqlite", host="", port=0, user="", password="", database="db", batch_size=1000)
+    store = SQLInputStore("sql", "sql", str(tmp_path / "tmp"), config)
+    store._engine = engine
+    return store
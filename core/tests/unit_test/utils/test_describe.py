@@ -0,0 +1,117 @@
+import io
+import os
+import time
+
+import pytest
+from nefertem_core.utils import describe
+
+
+class TestCachedDescribe:
+    def test_cached(self, data):
+        calls = []
+        first = describe.cached_describe(data, "kind", lambda path: calls.append(path) or {"a": [1]})
+        first["a"].append(2)
+        assert describe.cached_describe(data, "kind", lambda path: calls.append(path) or {}) == {"a": [1]}
+        assert len(calls) == 1
+
+        # Another kind or a changed file are described again
+        describe.cached_describe(data, "other", lambda path: calls.append(path) or {})
+        data.write_text("a;b\n1;2\n3;4\n")
+        describe.cached_describe(data, "kind", lambda path: calls.append(path) or {})
+        assert len(calls) == 3
+
+    def test_sidecar(self, data):
+        describe.cached_describe(data, "kind", lambda path: {"a": 1})
+        describe._descriptions.clear()
+        assert describe.cached_describe(data, "kind", lambda path: pytest.fail("described again")) == {"a": 1}
+
+    def test_memory_bound(self, data, monkeypatch):
+        monkeypatch.setattr(describe, "MAX_DESCRIPTIONS", 2)
+        for kind in ("a", "b", "c"):
+            describe.cached_describe(data, kind, lambda path: {"kind": kind})
+        assert len(describe._descriptions) == 2
+
+        # The least recently used description is read again from its sidecar
+        assert describe.cached_describe(data, "a", lambda path: {}) == {"kind": "a"}
+        assert len(describe._descriptions) == 2
+
+    def test_memory_only(self, data, tmp_path):
+        describe.set_describe_path(None)
+        assert describe.cached_describe(data, "kind", lambda path: {"a": 1}) == {"a": 1}
+        describe.evict_descriptions()
+        assert not (tmp_path / "describe").exists()
+        describe._descriptions.clear()
+        assert describe.cached_describe(data, "kind", lambda path: {"a": 2}) == {"a": 2}
+
+
+class TestEvict:
+    def test_age(self, data):
+        for kind in ("old", "new"):
+            describe.cached_describe(data, kind, lambda path: {"kind": kind})
+        [old] = [src for src in sidecars() if "old" in src.read_text()]
+        age(old, 3600)
+        describe.evict_descriptions(max_age=600)
+        assert [src.read_text() for src in sidecars()] == ['{"kind": "new"}']
+
+    def test_size(self, data):
+        for idx, kind in enumerate(("a", "b", "c")):
+            describe.cached_describe(data, kind, lambda path: {"kind": kind})
+            age(next(src for src in sidecars() if kind in src.read_text()), 30 - idx * 10)
+        size = sidecars()[0].stat().st_size
+
+        # A description read is the most recently used one
+        describe._descriptions.clear()
+        describe.cached_describe(data, "a", lambda path: {})
+        describe.evict_descriptions(max_size=2 * size)
+        assert sorted(src.read_text() for src in sidecars()) == ['{"kind": "a"}', '{"kind": "c"}']
+
+    def test_missing(self):
+        describe.evict_descriptions()
+
+
+class TestDescribe:
+    def test_resource(self, data):
+        res = describe.describe_resource(str(data))
+        assert res["format"] == "csv"
+        assert res["dialect"]["csv"]["delimiter"] == ";"
+        assert len(sidecars()) == 1
+
+    def test_buffer(self, data):
+        buffer = io.BytesIO(data.read_bytes())
+        res = describe.describe_buffer(buffer)
+        assert res["dialect"]["csv"]["delimiter"] == ";"
+        assert buffer.tell() == 0
+        assert len(sidecars()) == 0
+
+    def test_buffer_cached(self, data):
+        # Buffers of the same content are described once
+        res = describe.describe_buffer(io.BytesIO(data.read_bytes()), "s3:store:data.csv:etag")
+        buffer = io.BytesIO(b"a,b\n1,2\n")
+        assert describe.describe_buffer(buffer, "s3:store:data.csv:etag") == res
+        assert buffer.tell() == 0
+        assert len(sidecars()) == 1
+        assert describe.describe_buffer(buffer, "s3:store:data.csv:other") != res
+        assert len(sidecars()) == 2
+
+
+def sidecars() -> list:
+    return sorted(describe.DESCRIBE_PATH.glob("*.json"))
+
+
+def age(src, seconds):
+    # Set the last use of a sidecar some seconds ago
+    last_use = time.time() - seconds
+    os.utime(src, (last_use, last_use))
+
+
+@pytest.fixture(autouse=True)
+def describe_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(describe, "DESCRIBE_PATH", tmp_path / "describe")
+    monkeypatch.setattr(describe, "_descriptions", describe.OrderedDict())
+
+
+@pytest.fixture
+def data(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a;b\n1;2\n")
+    return path
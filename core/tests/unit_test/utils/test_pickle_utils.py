@@ -0,0 +1,40 @@
+import pickle
+from io import BytesIO
+
+from nefertem_core.utils.pickle_utils import dump, dumps, register_reducer
+
+
+class Content:
+    """
+    Object that loses its content when pickled as it is.
+    """
+
+    def __init__(self, content) -> None:
+        self.content = content
+
+    def __getstate__(self) -> dict:
+        return {}
+
+    def __setstate__(self, state: dict) -> None:
+        self.content = None
+
+
+register_reducer(Content, lambda obj: (Content, (obj.content,)))
+
+
+def test_dumps():
+    obj = {"content": Content([1, 2]), "other": (1, "a")}
+    loaded = pickle.loads(dumps(obj))
+    assert loaded["content"].content == [1, 2]
+    assert loaded["other"] == (1, "a")
+
+
+def test_dump():
+    buffer = BytesIO()
+    dump([Content("a")], buffer)
+    buffer.seek(0)
+    assert pickle.load(buffer)[0].content == "a"
+
+
+def test_global_pickling_not_modified():
+    assert pickle.loads(pickle.dumps(Content("a"))).content is None
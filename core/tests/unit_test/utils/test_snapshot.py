@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+from nefertem_core.stores.builder import StoreBuilder
+from nefertem_core.utils import snapshot
+
+
+class TestCachedSnapshot:
+    def test_memory(self, store, data):
+        calls = []
+        first = snapshot.cached_snapshot(store, data, lambda: calls.append(1) or pd.read_csv(data))
+        assert snapshot.cached_snapshot(store, data, lambda: pytest.fail("read again")) is first
+        assert len(calls) == 1
+
+    def test_persisted(self, store, data, tmp_path):
+        first = snapshot.cached_snapshot(store, data, lambda: pd.read_csv(data), persist=True)
+        assert len(list((tmp_path / "snapshot").glob("*.parquet"))) == 1
+
+        # Another process reads the stored snapshot
+        snapshot._snapshots.clear()
+        second = snapshot.cached_snapshot(store, data, lambda: pytest.fail("read again"), persist=True)
+        pd.testing.assert_frame_equal(second, first)
+
+    def test_memory_only(self, store, data, tmp_path):
+        snapshot.set_snapshot_path(None)
+        assert snapshot.cached_snapshot(store, data, lambda: pd.read_csv(data), persist=True)["a"].tolist() == [1]
+        assert not (tmp_path / "snapshot").exists()
+
+
+@pytest.fixture(autouse=True)
+def snapshot_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_PATH", tmp_path / "snapshot")
+    monkeypatch.setattr(snapshot, "_snapshots", snapshot.OrderedDict())
+
+
+@pytest.fixture
+def data(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    return str(path)
+
+
+@pytest.fixture
+def store(tmp_path):
+    builder = StoreBuilder()
+    builder.build_input_store(str(tmp_path / "tmp"), {"name": "local", "store_type": "local"})
+    return builder.get_input_store("local")
@@ -41,12 +41,8 @@ class RunInference(Run):
             Return a list of framework results.
 
         """
-        schemas = self.run_handler.get_item(ResultType.FRAMEWORK.value)
-        if schemas:
-            return schemas
-
-        self.run_handler.run(self.run_info.resources)
-        return self.run_handler.get_item(ResultType.FRAMEWORK.value)
+        keys = self.run_handler.run(self.run_info.resources)
+        return self.run_handler.get_item(ResultType.FRAMEWORK.value, keys)
 
     def infer_nefertem(self) -> list[NefertemSchema]:
         """
@@ -58,12 +54,8 @@ class RunInference(Run):
             Return a list of NefertemSchemas.
 
         """
-        schemas = self.run_handler.get_item(ResultType.NEFERTEM.value)
-        if schemas:
-            return schemas
-
-        self.run_handler.run(self.run_info.resources)
-        return self.run_handler.get_item(ResultType.NEFERTEM.value)
+        keys = self.run_handler.run(self.run_info.resources)
+        return self.run_handler.get_item(ResultType.NEFERTEM.value, keys)
 
     def infer(self) -> tuple[list[Any], list[NefertemSchema]]:
         """
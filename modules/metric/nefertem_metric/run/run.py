@@ -48,12 +48,8 @@ class RunMetric(Run):
             Return a list of framework results.
 
         """
-        metrics = self.run_handler.get_item(ResultType.FRAMEWORK.value)
-        if metrics:
-            return metrics
-
-        self.run_handler.run(self.run_info.resources, metrics)
-        return self.run_handler.get_item(ResultType.FRAMEWORK.value)
+        keys = self.run_handler.run(self.run_info.resources, metrics)
+        return self.run_handler.get_item(ResultType.FRAMEWORK.value, keys)
 
     def metric_nefertem(self, metrics: list[dict]) -> list[NefertemMetricReport]:
         """
@@ -70,12 +66,8 @@ class RunMetric(Run):
             Return a list of NefertemMetricReport.
 
         """
-        metrics = self.run_handler.get_item(ResultType.NEFERTEM.value)
-        if metrics:
-            return metrics
-
-        self.run_handler.run(self.run_info.resources, metrics)
-        return self.run_handler.get_item(ResultType.NEFERTEM.value)
+        keys = self.run_handler.run(self.run_info.resources, metrics)
+        return self.run_handler.get_item(ResultType.NEFERTEM.value, keys)
 
     def metric(self, metrics: list[dict]) -> tuple[list[Any], list[NefertemMetricReport]]:
         """
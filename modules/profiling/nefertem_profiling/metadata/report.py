@@ -13,6 +13,10 @@ class NefertemProfile(NefertemBaseReport):
         Descriptors of data stats.
     fields : dict
         Descriptors of data fields.
+    state : dict
+        Mergeable state of the profile, e.g. counts, moments and sketches,
+        to merge it with the profiles of other partitions of the data.
+        Only kept by plugins that support it, if requested.
     """
 
     def __init__(
@@ -22,6 +26,7 @@ class NefertemProfile(NefertemBaseReport):
         duration: float,
         stats: dict,
         fields: dict,
+        state: dict | None = None,
     ) -> None:
         """
         Constructor.
@@ -29,3 +34,18 @@ class NefertemProfile(NefertemBaseReport):
         super().__init__(framework_name, framework_version, duration)
         self.stats = stats
         self.fields = fields
+        self.state = state
+
+    def to_dict(self) -> dict:
+        """
+        Return the profile as dict, without state if not kept.
+
+        Returns
+        -------
+        dict
+            Profile as dict.
+        """
+        profile = dict(super().to_dict())
+        if profile.get("state") is None:
+            profile.pop("state", None)
+        return profile
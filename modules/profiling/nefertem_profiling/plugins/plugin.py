@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import typing
 from abc import abstractmethod
 from typing import Any
 
 from nefertem_core.plugins.plugin import Plugin
 from nefertem_core.plugins.utils import ResultType
+from nefertem_core.utils.exceptions import RunError
+
+if typing.TYPE_CHECKING:
+    from nefertem_core.plugins.utils import Result
 
 
 class ProfilingPlugin(Plugin):
@@ -12,6 +17,13 @@ class ProfilingPlugin(Plugin):
     Run plugin that executes profiling over a Resource.
     """
 
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        super().__init__()
+        self.partition_id = None
+
     def execute(self) -> dict:
         """
         Method that call specific execution.
@@ -19,6 +31,54 @@ class ProfilingPlugin(Plugin):
         plugin = f"Plugin: {self.framework_name()} {self.id};"
         self.logger.info(f"Execute profiling - {plugin}")
         lib_result = self.profile()
+        return self._render_results(lib_result)
+
+    def execute_partition(self) -> Result:
+        """
+        Profile the partition of a resource handled by a sub-plugin.
+
+        Returns
+        -------
+        Result
+            Profiling result of the partition.
+        """
+        plugin = f"Plugin: {self.framework_name()} {self.id};"
+        self.logger.info(f"Execute profiling - {plugin} Partition: {self.partition_id};")
+        return self.profile()
+
+    def merge_partitions(self, results: list[Result]) -> dict:
+        """
+        Merge the profiling results of the sub-plugins and render them.
+
+        Parameters
+        ----------
+        results : list[Result]
+            Profiling results of the partitions, in partition order.
+
+        Returns
+        -------
+        dict
+            Results of execution.
+        """
+        self.logger.info(f"Merge {len(results)} partitions - Plugin: {self.framework_name()} {self.id};")
+        lib_result = self.merge_profiles(results)
+        return self._render_results(lib_result)
+
+    def _render_results(self, lib_result: Result) -> dict:
+        """
+        Render the profiling result.
+
+        Parameters
+        ----------
+        lib_result : Result
+            Profiling result.
+
+        Returns
+        -------
+        dict
+            Results of execution.
+        """
+        plugin = f"Plugin: {self.framework_name()} {self.id};"
         self.logger.info(f"Render report - {plugin}")
         nt_result = self.render_nefertem(lib_result)
         self.logger.info(f"Render artifact - {plugin}")
@@ -30,6 +90,13 @@ class ProfilingPlugin(Plugin):
             ResultType.LIBRARY.value: self.get_framework(),
         }
 
+    def merge_profiles(self, results: list[Result]) -> Result:
+        """
+        Merge the profiling results of the partitions of a resource.
+        Must be implemented by plugins that support partitioning.
+        """
+        raise RunError(f"Plugin {self.framework_name()} {self.id} does not support the merge of profiling results.")
+
     @abstractmethod
     def profile(self) -> Any:
         """
@@ -39,12 +39,8 @@ class RunProfiling(Run):
             Return a list of framework results.
 
         """
-        profiles = self.run_handler.get_item(ResultType.FRAMEWORK.value)
-        if profiles:
-            return profiles
-
-        self.run_handler.run(self.run_info.resources)
-        return self.run_handler.get_item(ResultType.FRAMEWORK.value)
+        keys = self.run_handler.run(self.run_info.resources)
+        return self.run_handler.get_item(ResultType.FRAMEWORK.value, keys)
 
     def profile_nefertem(self) -> list[NefertemProfile]:
         """
@@ -56,12 +52,8 @@ class RunProfiling(Run):
             Return a list of NefertemProfile.
 
         """
-        profiles = self.run_handler.get_item(ResultType.NEFERTEM.value)
-        if profiles:
-            return profiles
-
-        self.run_handler.run(self.run_info.resources)
-        return self.run_handler.get_item(ResultType.NEFERTEM.value)
+        keys = self.run_handler.run(self.run_info.resources)
+        return self.run_handler.get_item(ResultType.NEFERTEM.value, keys)
 
     def profile(self) -> tuple[list[Any], list[NefertemProfile]]:
         """
@@ -3,11 +3,16 @@ Validation plugin abstract class module.
 """
 from __future__ import annotations
 
+import typing
 from abc import abstractmethod
 from typing import Any
 
 from nefertem_core.plugins.plugin import Plugin
 from nefertem_core.plugins.utils import ResultType
+from nefertem_core.utils.exceptions import RunError
+
+if typing.TYPE_CHECKING:
+    from nefertem_core.plugins.utils import Result
 
 
 class ValidationPlugin(Plugin):
@@ -22,6 +27,7 @@ class ValidationPlugin(Plugin):
         super().__init__()
         self.constraint = None
         self.error_report = None
+        self.partition_id = None
 
     def execute(self) -> dict:
         """
@@ -37,6 +43,55 @@ class ValidationPlugin(Plugin):
         resources = f"Resources: {self.constraint.resources};"
         self.logger.info(f"Execute validation - {plugin} {constraint} {resources}")
         lib_result = self.validate()
+        return self._render_results(lib_result)
+
+    def execute_partition(self) -> Result:
+        """
+        Validate the partition of a resource handled by a sub-plugin.
+
+        Returns
+        -------
+        Result
+            Validation result of the partition.
+        """
+        plugin = f"Plugin: {self.framework_name()} {self.id};"
+        self.logger.info(f"Execute validation - {plugin} Partition: {self.partition_id};")
+        return self.validate()
+
+    def merge_partitions(self, results: list[Result]) -> dict:
+        """
+        Merge the validation results of the sub-plugins and render them.
+
+        Parameters
+        ----------
+        results : list[Result]
+            Validation results of the partitions, in partition order.
+
+        Returns
+        -------
+        dict
+            Results of execution.
+        """
+        self.logger.info(f"Merge {len(results)} partitions - Plugin: {self.framework_name()} {self.id};")
+        lib_result = self.merge_reports(results)
+        return self._render_results(lib_result)
+
+    def _render_results(self, lib_result: Result | list[Result]) -> dict:
+        """
+        Render the validation result.
+
+        Parameters
+        ----------
+        lib_result : Result | list[Result]
+            Validation result, or results of every constraint of a
+            plugin that validates many constraints.
+
+        Returns
+        -------
+        dict
+            Results of execution.
+        """
+        plugin = f"Plugin: {self.framework_name()} {self.id};"
         self.logger.info(f"Render report - {plugin}")
         nt_result = self.render_nefertem(lib_result)
         self.logger.info(f"Render artifact - {plugin}")
@@ -48,6 +103,40 @@ class ValidationPlugin(Plugin):
             ResultType.LIBRARY.value: self.get_framework(),
         }
 
+    @staticmethod
+    def _merge(results: list[dict]) -> dict:
+        """
+        Merge the results of plugins executed by a plugin that validates
+        many constraints, e.g. when validating them together fails.
+
+        Parameters
+        ----------
+        results : list[dict]
+            Results of execution of every constraint.
+
+        Returns
+        -------
+        dict
+            Results of execution, with a list of values for every result type.
+        """
+        merged = {
+            ResultType.FRAMEWORK.value: [],
+            ResultType.NEFERTEM.value: [],
+            ResultType.RENDERED.value: [],
+        }
+        for result in results:
+            for key, values in merged.items():
+                values.append(result[key])
+        merged[ResultType.LIBRARY.value] = results[0][ResultType.LIBRARY.value]
+        return merged
+
+    def merge_reports(self, results: list[Result]) -> Result:
+        """
+        Merge the validation results of the partitions of a resource.
+        Must be implemented by plugins that support partitioning.
+        """
+        raise RunError(f"Plugin {self.framework_name()} {self.id} does not support the merge of validation results.")
+
     @abstractmethod
     def validate(self) -> Any:
         """
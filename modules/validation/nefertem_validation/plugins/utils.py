@@ -45,7 +45,7 @@ def parse_error_report(error_list: list, report_type) -> list:
         return error_list
 
 
-def get_errors(count: int = 0, records: list = None) -> dict:
+def get_errors(count: int = 0, records: list = None, lower_bound: bool = False) -> dict:
     """
     Return a common error structure.
 
@@ -55,6 +55,9 @@ def get_errors(count: int = 0, records: list = None) -> dict:
         Number of errors.
     records : list
         List of errors.
+    lower_bound : bool
+        If True, the validation stopped before the end of the data
+        and the number of errors is a lower bound.
 
     Returns
     -------
@@ -63,4 +66,7 @@ def get_errors(count: int = 0, records: list = None) -> dict:
     """
     if records is None:
         records = []
-    return {"count": count, "records": records}
+    errors = {"count": count, "records": records}
+    if lower_bound:
+        errors["lower_bound"] = True
+    return errors
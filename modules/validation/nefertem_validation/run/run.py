@@ -49,12 +49,8 @@ class RunValidation(Run):
         list[Any]
             Return a list of framework results.
         """
-        reports = self.run_handler.get_item(ResultType.FRAMEWORK.value)
-        if reports:
-            return reports
-
-        self.run_handler.run(self.run_info.resources, constraints, error_report)
-        return self.run_handler.get_item(ResultType.FRAMEWORK.value)
+        keys = self.run_handler.run(self.run_info.resources, constraints, error_report)
+        return self.run_handler.get_item(ResultType.FRAMEWORK.value, keys)
 
     def validate_nefertem(self, constraints: list[dict], error_report: str | None = "partial") -> list[NefertemReport]:
         """
@@ -76,12 +72,8 @@ class RunValidation(Run):
         list[NefertemReport]
             Return a list of "NefertemReport".
         """
-        reports = self.run_handler.get_item(ResultType.NEFERTEM.value)
-        if reports:
-            return reports
-
-        self.run_handler.run(self.run_info.resources, constraints, error_report)
-        return self.run_handler.get_item(ResultType.NEFERTEM.value)
+        keys = self.run_handler.run(self.run_info.resources, constraints, error_report)
+        return self.run_handler.get_item(ResultType.NEFERTEM.value, keys)
 
     def validate(self, constraints: list[dict], error_report: str | None = "partial") -> Any:
         """
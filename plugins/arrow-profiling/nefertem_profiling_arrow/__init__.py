@@ -0,0 +1 @@
+from nefertem_profiling_arrow.builder import ProfilingBuilderArrow as Builder
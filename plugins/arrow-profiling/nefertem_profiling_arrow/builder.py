@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import typing
+from copy import deepcopy
+
+from nefertem_core.readers.builder import build_reader
+from nefertem_core.readers.registry import reader_registry
+from nefertem_profiling.plugins.builder import ProfilingPluginBuilder
+from nefertem_profiling_arrow.plugin import ProfilingPluginArrow
+
+if typing.TYPE_CHECKING:
+    from nefertem_core.resources.data_resource import DataResource
+
+
+BATCH_READER = "arrow_batch_reader"
+
+
+class ProfilingBuilderArrow(ProfilingPluginBuilder):
+    """
+    Profile plugin builder.
+    """
+
+    def __init__(self, stores: dict[str, str], exec_args: dict, num_worker: int = 1) -> None:
+        """
+        Constructor.
+        """
+        super().__init__(stores, exec_args, num_worker)
+
+        # Register new reader in the reader registry
+        reader_registry.register(
+            BATCH_READER,
+            "nefertem_profiling_arrow.reader",
+            "ArrowBatchReader",
+        )
+
+    def build(self, resources: list[DataResource]) -> list[ProfilingPluginArrow]:
+        """
+        Build a plugin for each resource.
+
+        Parameters
+        ----------
+        resources : list[DataResource]
+            List of resources.
+
+        Returns
+        -------
+        list[ProfilingPluginArrow]
+            List of plugins.
+        """
+        plugins = []
+        for res in resources:
+            # Get data reader for the resource
+            data_reader = build_reader(BATCH_READER, self.stores[res.store])
+
+            # Build and setup plugin with a copy of the resource to avoid
+            # resource modification
+            plugin = ProfilingPluginArrow()
+            plugin.setup(data_reader, deepcopy(res), self.exec_args)
+            plugins.append(plugin)
+        return plugins
@@ -0,0 +1,249 @@
+"""
+Arrow implementation of profiling plugin.
+"""
+from __future__ import annotations
+
+import copy
+import json
+import typing
+
+import pyarrow
+from nefertem_core.plugins.utils import ExecutionStatus, RenderTuple, Result, exec_decorator
+from nefertem_core.utils.io_utils import write_bytesio
+from nefertem_core.utils.utils import build_uuid, listify
+from nefertem_profiling.metadata.report import NefertemProfile
+from nefertem_profiling.plugins.plugin import ProfilingPlugin
+from nefertem_profiling_arrow.statistics import TableStatistics
+from nefertem_profiling_arrow.utils import PROFILE_FIELDS, QUANTILES
+
+if typing.TYPE_CHECKING:
+    from nefertem_core.resources.data_resource import DataResource
+    from nefertem_core.stores.input.objects._base import InputStore
+    from nefertem_profiling_arrow.reader import ArrowBatchReader
+
+
+class ProfilingPluginArrow(ProfilingPlugin):
+    """
+    Arrow implementation of profiling plugin.
+
+    Column statistics are computed in a single pass over the Arrow record
+    batches of the resource, with a bounded memory. A resource made of
+    several files is profiled file by file, and the statistics of the
+    files are merged.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        super().__init__()
+        self.resource = None
+        self.exec_multiprocess = True
+
+    def setup(
+        self,
+        data_reader: ArrowBatchReader,
+        resource: DataResource,
+        exec_args: dict,
+    ) -> None:
+        """
+        Setup plugin.
+
+        Parameters
+        ----------
+        data_reader : ArrowBatchReader
+            Data reader.
+        resource : DataResource
+            Data resource to be profiled.
+        exec_args : dict
+            Execution arguments (batch_rows, top_k, quantiles, sketch_size,
+            hll_precision, max_counted, seed, keep_state).
+
+        Returns
+        -------
+        None
+        """
+        self.data_reader = data_reader
+        self.resource = resource
+        self.exec_args = exec_args
+        self.exec_partition = len(listify(resource.path)) > 1
+
+    def get_inputs(self) -> list[tuple[InputStore, str]]:
+        """
+        Return the inputs read by the plugin.
+
+        Returns
+        -------
+        list[tuple[InputStore, str]]
+            List of (store, path) tuples.
+        """
+        return [(self.data_reader.store, path) for path in listify(self.resource.path)]
+
+    def partition(self) -> list[ProfilingPluginArrow]:
+        """
+        Split a resource made of several files into one sub-plugin for
+        each file.
+
+        Returns
+        -------
+        list[ProfilingPluginArrow]
+            List of sub-plugins.
+        """
+        partitions = []
+        for idx, path in enumerate(listify(self.resource.path)):
+            part = copy.copy(self)
+            part.id = build_uuid()
+            part.partition_id = idx
+            part.resource = self.resource.copy(update={"path": path})
+            part.exec_partition = False
+            partitions.append(part)
+        return partitions
+
+    def merge_profiles(self, results: list[Result]) -> Result:
+        """
+        Merge the statistics of the files of a resource.
+
+        Parameters
+        ----------
+        results : list[Result]
+            Profiling results of the files, in file order.
+
+        Returns
+        -------
+        Result
+            Merged profiling result.
+        """
+        duration = round(sum(res.duration or 0 for res in results), 2)
+        for res in results:
+            if res.errors is not None:
+                return Result(ExecutionStatus.ERROR.value, duration, res.errors)
+        stats = self._new_statistics()
+        for res in results:
+            stats.merge(res.artifact)
+        return Result(ExecutionStatus.FINISHED.value, duration, None, stats)
+
+    @exec_decorator
+    def profile(self) -> TableStatistics:
+        """
+        Compute column statistics.
+
+        Returns
+        -------
+        TableStatistics
+            Column statistics.
+        """
+        stats = self._new_statistics()
+        batch_rows = self.exec_args.get("batch_rows", 65_536)
+        for batch in self.data_reader.fetch_batches(self.resource.path, batch_rows):
+            stats.update(batch)
+        return stats
+
+    def _new_statistics(self) -> TableStatistics:
+        """
+        Return empty statistics configured by the execution arguments.
+        """
+        return TableStatistics(
+            precision=self.exec_args.get("hll_precision", 14),
+            sketch_size=self.exec_args.get("sketch_size", 200),
+            capacity=self.exec_args.get("max_counted", 1000),
+            seed=self.exec_args.get("seed"),
+        )
+
+    def _to_dict(self, stats: TableStatistics) -> dict:
+        """
+        Return the statistics reported, with "table" and "variables" keys.
+        """
+        return stats.to_dict(
+            self.exec_args.get("quantiles", QUANTILES),
+            self.exec_args.get("top_k", 10),
+        )
+
+    @exec_decorator
+    def render_nefertem(self, result: Result) -> RenderTuple:
+        """
+        Return a NefertemProfile ready to be persisted as metadata.
+
+        Parameters
+        ----------
+        result : Result
+            Execution result.
+
+        Returns
+        -------
+        RenderTuple
+            Rendered object.
+        """
+        exec_err = result.errors
+        duration = result.duration
+
+        state = None
+        if exec_err is None:
+            # Profile fields first, then the other statistics
+            profile = self._to_dict(result.artifact)
+            fields = {}
+            for name, var in profile["variables"].items():
+                fields[name] = {k: var.get(k) for k in PROFILE_FIELDS}
+                fields[name].update({k: v for k, v in var.items() if k not in PROFILE_FIELDS})
+            stats = profile["table"]
+            if self.exec_args.get("keep_state", False):
+                state = result.artifact.to_state()
+        else:
+            self.logger.error(f"Execution error {str(exec_err)} for plugin {self.id}")
+            fields = {}
+            stats = {}
+
+        obj = NefertemProfile(
+            **self.get_framework(),
+            duration=duration,
+            stats=stats,
+            fields=fields,
+            state=state,
+        )
+        filename = f"nefertem_profile_{self.id}.json"
+        return RenderTuple(obj, filename)
+
+    @exec_decorator
+    def render_artifact(self, result: Result) -> list[RenderTuple]:
+        """
+        Return the statistics ready to be persisted as artifact.
+
+        Parameters
+        ----------
+        result : Result
+            Execution result.
+
+        Returns
+        -------
+        list[tuple]
+            List of RenderTuple.
+        """
+        if result.artifact is None:
+            obj = {"errors": result.errors}
+        else:
+            obj = write_bytesio(json.dumps(self._to_dict(result.artifact)))
+        filename = f"arrow_profile_{self.id}.json"
+        return [RenderTuple(obj, filename)]
+
+    @staticmethod
+    def framework_name() -> str:
+        """
+        Get library name.
+
+        Returns
+        -------
+        str
+            Library name.
+        """
+        return pyarrow.__name__
+
+    @staticmethod
+    def framework_version() -> str:
+        """
+        Get library version.
+
+        Returns
+        -------
+        str
+            Library version.
+        """
+        return pyarrow.__version__
@@ -0,0 +1,54 @@
+"""
+ArrowBatchReader module.
+"""
+from __future__ import annotations
+
+from typing import Iterator
+
+import pyarrow as pa
+from nefertem_core.readers.objects.arrow import ArrowReader, get_dataset_format
+from nefertem_core.utils.describe import describe_resource
+from nefertem_core.utils.utils import listify
+
+
+class ArrowBatchReader(ArrowReader):
+    """
+    ArrowBatchReader class.
+
+    Read one or more CSV or Parquet files as a stream of Arrow record
+    batches, so that only a few batches are in memory.
+    """
+
+    def fetch_batches(self, src: str | list[str], batch_rows: int = 65_536) -> Iterator[pa.RecordBatch]:
+        """
+        Fetch resources from backend and read them batch by batch.
+
+        Parameters
+        ----------
+        src : str | list[str]
+            Resource path or list of resource paths.
+        batch_rows : int
+            Maximum number of rows of a batch.
+
+        Yields
+        ------
+        pa.RecordBatch
+            Batch of rows.
+
+        Raises
+        ------
+        ValueError
+            If the files are not all CSV or all Parquet files.
+        """
+        srcs = listify(src)
+        file_format = get_dataset_format(srcs)
+        if file_format is None:
+            raise ValueError("Only CSV files or Parquet files can be profiled!")
+        args = {}
+        if file_format == "csv":
+            res = describe_resource(self.store.fetch_file(srcs[0]))
+            args = {
+                "delimiter": res.get("dialect", {}).get("csv", {}).get("delimiter", ","),
+                "encoding": res.get("encoding"),
+            }
+        yield from self.fetch_dataset(srcs, **args).to_batches(batch_size=batch_rows)
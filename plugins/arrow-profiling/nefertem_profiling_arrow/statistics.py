@@ -0,0 +1,932 @@
+"""
+Column statistics computed in a single pass over Arrow record batches.
+
+Every statistic is updated batch by batch with vectorized operations and
+keeps a bounded state, whatever the number of rows. Distinct values are
+estimated with a HyperLogLog, quantiles with a KLL sketch and the most
+frequent values with a bounded table of counts. Statistics of the same
+column can be merged, also after being stored as a JSON state.
+"""
+from __future__ import annotations
+
+import base64
+import math
+import numbers
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from nefertem_profiling_arrow.utils import get_field_type, is_hashable, is_numeric
+
+
+class HyperLogLog:
+    """
+    HyperLogLog estimator of the number of distinct values.
+
+    Attributes
+    ----------
+    precision : int
+        Number of bits of the hash selecting a register.
+    registers : np.ndarray
+        Registers with the maximum rank seen.
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        """
+        Constructor.
+        """
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, hashes: np.ndarray) -> None:
+        """
+        Add 64 bits hashes of values.
+
+        Parameters
+        ----------
+        hashes : np.ndarray
+            Array of uint64 hashes.
+
+        Returns
+        -------
+        None
+        """
+        if not len(hashes):
+            return
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = hashes << np.uint64(self.precision)
+
+        # Rank is the position of the first set bit of the hash after
+        # the register bits. Halves of 32 bits are exact as float64.
+        high = (rest >> np.uint64(32)).astype(np.float64)
+        low = (rest & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        zeros = np.where(high > 0, 32 - np.frexp(high)[1], 64 - np.frexp(low)[1])
+        rank = np.minimum(zeros + 1, 64 - self.precision + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: HyperLogLog) -> None:
+        """
+        Merge the registers of another estimator with the same precision.
+
+        Parameters
+        ----------
+        other : HyperLogLog
+            Estimator to merge.
+
+        Returns
+        -------
+        None
+        """
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def to_state(self) -> dict:
+        """
+        Return the state of the estimator.
+
+        Returns
+        -------
+        dict
+            Precision and registers, encoded in base64.
+        """
+        return {"precision": self.precision, "registers": base64.b64encode(self.registers.tobytes()).decode()}
+
+    @classmethod
+    def from_state(cls, state: dict) -> HyperLogLog:
+        """
+        Build an estimator from its state.
+
+        Parameters
+        ----------
+        state : dict
+            Estimator state.
+
+        Returns
+        -------
+        HyperLogLog
+            Estimator.
+        """
+        obj = cls(state["precision"])
+        obj.registers = np.frombuffer(base64.b64decode(state["registers"]), dtype=np.uint8).copy()
+        return obj
+
+    def estimate(self) -> int:
+        """
+        Return the estimated number of distinct values.
+
+        Returns
+        -------
+        int
+            Number of distinct values.
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class QuantileSketch:
+    """
+    KLL sketch of the distribution of numeric values.
+
+    Values are kept in levels of compactors. When a level is full, its
+    values are sorted and every other value is promoted to the next level,
+    where it counts twice. Lower levels are smaller, so the sketch keeps
+    about 3 * size values.
+
+    Attributes
+    ----------
+    size : int
+        Size of the highest level, the larger the more accurate.
+    levels : list[np.ndarray]
+        Values of each level.
+    """
+
+    def __init__(self, size: int = 200, seed: int | None = None) -> None:
+        """
+        Constructor.
+        """
+        self.size = size
+        self.levels = [np.empty(0)]
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Add numeric values.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Array of values, without nulls.
+
+        Returns
+        -------
+        None
+        """
+        self.levels[0] = np.concatenate([self.levels[0], values.astype(np.float64)])
+        self._compress()
+
+    def merge(self, other: QuantileSketch) -> None:
+        """
+        Merge the values of another sketch.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            Sketch to merge.
+
+        Returns
+        -------
+        None
+        """
+        for level, values in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], values])
+        self._compress()
+
+    def to_state(self) -> dict:
+        """
+        Return the state of the sketch.
+
+        Returns
+        -------
+        dict
+            Size and values of each level.
+        """
+        return {"size": self.size, "levels": [v.tolist() for v in self.levels]}
+
+    @classmethod
+    def from_state(cls, state: dict, seed: int | None = None) -> QuantileSketch:
+        """
+        Build a sketch from its state.
+
+        Parameters
+        ----------
+        state : dict
+            Sketch state.
+        seed : int
+            Seed of the compactions.
+
+        Returns
+        -------
+        QuantileSketch
+            Sketch.
+        """
+        obj = cls(state["size"], seed)
+        obj.levels = [np.asarray(v, dtype=np.float64) for v in state["levels"]]
+        return obj
+
+    def quantiles(self, qs: list[float]) -> list[float | None]:
+        """
+        Return the estimated quantiles.
+
+        Parameters
+        ----------
+        qs : list[float]
+            Quantiles to estimate, between 0 and 1.
+
+        Returns
+        -------
+        list[float | None]
+            Quantile values, None if the sketch is empty.
+        """
+        values = np.concatenate(self.levels)
+        if not len(values):
+            return [None for _ in qs]
+        weights = np.concatenate([np.full(len(v), 2**i, dtype=np.float64) for i, v in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative = np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, np.asarray(qs) * cumulative[-1])
+        return [float(i) for i in values[np.minimum(index, len(values) - 1)]]
+
+    def _capacity(self, level: int) -> int:
+        """
+        Return the capacity of a level.
+        """
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.size * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        """
+        Compact the full levels, until no level is full.
+        """
+        compacted = True
+        while compacted:
+            compacted = False
+            for level in range(len(self.levels)):
+                values = self.levels[level]
+                if len(values) <= self._capacity(level):
+                    continue
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                values = np.sort(values)
+
+                # An odd value out stays in the level
+                keep = values[:1] if len(values) % 2 else values[:0]
+                values = values[len(keep) :]
+                promoted = values[int(self.rng.integers(2)) :: 2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                compacted = True
+
+
+class FrequentItems:
+    """
+    Counts of the most frequent values.
+
+    Counts are exact until the number of distinct values exceeds the
+    capacity. Then only the values with the highest counts are kept, and
+    their counts are lower bounds. Values are counted by their string
+    representation.
+
+    Attributes
+    ----------
+    capacity : int
+        Maximum number of values counted.
+    counts : pd.Series
+        Count of each value.
+    exact : bool
+        Whether counts are exact.
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """
+        Constructor.
+        """
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.exact = True
+
+    def update(self, values: pd.Series) -> None:
+        """
+        Add values.
+
+        Parameters
+        ----------
+        values : pd.Series
+            Series of values, without nulls.
+
+        Returns
+        -------
+        None
+        """
+        counts = values.value_counts(sort=False)
+        counts.index = counts.index.astype(str)
+        self._add(counts)
+
+    def merge(self, other: FrequentItems) -> None:
+        """
+        Merge the counts of another table.
+
+        Parameters
+        ----------
+        other : FrequentItems
+            Counts to merge.
+
+        Returns
+        -------
+        None
+        """
+        self.exact = self.exact and other.exact
+        self._add(other.counts)
+
+    def to_state(self) -> dict:
+        """
+        Return the state of the counts.
+
+        Returns
+        -------
+        dict
+            Capacity, exactness and count of each value.
+        """
+        return {"capacity": self.capacity, "exact": self.exact, "counts": {k: int(v) for k, v in self.counts.items()}}
+
+    @classmethod
+    def from_state(cls, state: dict) -> FrequentItems:
+        """
+        Build counts from their state.
+
+        Parameters
+        ----------
+        state : dict
+            Counts state.
+
+        Returns
+        -------
+        FrequentItems
+            Counts.
+        """
+        obj = cls(state["capacity"])
+        obj.exact = state["exact"]
+        obj.counts = pd.Series(state["counts"], dtype="int64")
+        return obj
+
+    def top(self, k: int) -> dict:
+        """
+        Return the most frequent values with their counts.
+
+        Parameters
+        ----------
+        k : int
+            Number of values.
+
+        Returns
+        -------
+        dict
+            Count of each value.
+        """
+        top = self.counts.nlargest(k)
+        return {k: int(v) for k, v in top.items()}
+
+    def n_unique(self) -> int | None:
+        """
+        Return the number of values occurring once, None if not exact.
+
+        Returns
+        -------
+        int | None
+            Number of unique values.
+        """
+        if not self.exact:
+            return None
+        return int((self.counts == 1).sum())
+
+    def _add(self, counts: pd.Series) -> None:
+        """
+        Add counts and keep the highest ones.
+        """
+        counts = counts[counts > 0]
+        if not len(counts):
+            return
+        if len(self.counts):
+            counts = self.counts.add(counts, fill_value=0)
+        self.counts = counts.astype("int64")
+        if len(self.counts) > self.capacity:
+            self.counts = self.counts.nlargest(self.capacity)
+            self.exact = False
+
+
+class Moments:
+    """
+    Count, mean and variance of numeric values. Batches are combined
+    with the parallel algorithm of Chan et al.
+
+    Attributes
+    ----------
+    count : int
+        Number of values.
+    mean : float
+        Mean.
+    m2 : float
+        Sum of squared differences from the mean.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Add numeric values.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Array of values, without nulls.
+
+        Returns
+        -------
+        None
+        """
+        if not len(values):
+            return
+        values = values.astype(np.float64)
+        mean = float(values.mean())
+        self._combine(len(values), mean, float(np.square(values - mean).sum()))
+
+    def merge(self, other: Moments) -> None:
+        """
+        Merge the moments of other values.
+
+        Parameters
+        ----------
+        other : Moments
+            Moments to merge.
+
+        Returns
+        -------
+        None
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other.m2)
+
+    def to_state(self) -> dict:
+        """
+        Return the state of the moments.
+
+        Returns
+        -------
+        dict
+            Count, mean and sum of squared differences.
+        """
+        return {"count": self.count, "mean": self.mean, "m2": self.m2}
+
+    @classmethod
+    def from_state(cls, state: dict) -> Moments:
+        """
+        Build moments from their state.
+
+        Parameters
+        ----------
+        state : dict
+            Moments state.
+
+        Returns
+        -------
+        Moments
+            Moments.
+        """
+        obj = cls()
+        obj.count = state["count"]
+        obj.mean = state["mean"]
+        obj.m2 = state["m2"]
+        return obj
+
+    def variance(self) -> float | None:
+        """
+        Return the sample variance, None with less than two values.
+
+        Returns
+        -------
+        float | None
+            Variance.
+        """
+        if self.count < 2:
+            return None
+        return self.m2 / (self.count - 1)
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        """
+        Combine the moments with the ones of other values.
+        """
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+
+class ColumnStatistics:
+    """
+    Statistics of a column.
+
+    Attributes
+    ----------
+    name : str
+        Column name.
+    type : str
+        Column type, as named by ydata-profiling.
+    n : int
+        Number of rows.
+    n_missing : int
+        Number of null values.
+    memory_size : int
+        Size of the column in Arrow memory.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        data_type: pa.DataType,
+        precision: int = 14,
+        sketch_size: int = 200,
+        capacity: int = 1000,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Constructor.
+        """
+        self.name = name
+        self.type = get_field_type(data_type)
+        self.hashable = is_hashable(data_type)
+        self.numeric = is_numeric(data_type)
+        self.n = 0
+        self.n_missing = 0
+        self.memory_size = 0
+        self.min = None
+        self.max = None
+        self.distinct = HyperLogLog(precision) if self.hashable else None
+        self.frequent = FrequentItems(capacity) if self.hashable else None
+        self.moments = Moments() if self.numeric else None
+        self.quantiles = QuantileSketch(sketch_size, seed) if self.numeric else None
+
+    def update(self, array: pa.Array | pa.ChunkedArray) -> None:
+        """
+        Add the values of a batch.
+
+        Parameters
+        ----------
+        array : pa.Array | pa.ChunkedArray
+            Column values.
+
+        Returns
+        -------
+        None
+        """
+        self.n += len(array)
+        self.n_missing += array.null_count
+        self.memory_size += array.nbytes
+        if not self.hashable:
+            return
+
+        array = pc.drop_null(array)
+        if not len(array):
+            return
+        if pa.types.is_dictionary(array.type):
+            array = pc.cast(array, array.type.value_type)
+        if self.type in ("Numeric", "DateTime"):
+            bounds = pc.min_max(array)
+            self._update_bounds(_to_json(bounds["min"].as_py()), _to_json(bounds["max"].as_py()))
+
+        series = array.to_pandas()
+        self.distinct.update(pd.util.hash_pandas_object(series, index=False).to_numpy())
+        self.frequent.update(series)
+        if self.numeric:
+            values = series.to_numpy(dtype=np.float64)
+            values = values[~np.isnan(values)]
+            self.moments.update(values)
+            self.quantiles.update(values)
+
+    def merge(self, other: ColumnStatistics) -> None:
+        """
+        Merge the statistics of the same column computed on other rows.
+
+        Parameters
+        ----------
+        other : ColumnStatistics
+            Statistics to merge.
+
+        Returns
+        -------
+        None
+        """
+        self.n += other.n
+        self.n_missing += other.n_missing
+        self.memory_size += other.memory_size
+        if not self.hashable:
+            return
+        self._update_bounds(other.min, other.max)
+        self.distinct.merge(other.distinct)
+        self.frequent.merge(other.frequent)
+        if self.numeric:
+            self.moments.merge(other.moments)
+            self.quantiles.merge(other.quantiles)
+
+    def to_state(self) -> dict:
+        """
+        Return the state of the statistics, that can be serialized to JSON.
+
+        Returns
+        -------
+        dict
+            Statistics state.
+        """
+        state = {
+            "name": self.name,
+            "type": self.type,
+            "hashable": self.hashable,
+            "numeric": self.numeric,
+            "n": self.n,
+            "n_missing": self.n_missing,
+            "memory_size": self.memory_size,
+            "min": self.min,
+            "max": self.max,
+        }
+        if self.hashable:
+            state["distinct"] = self.distinct.to_state()
+            state["frequent"] = self.frequent.to_state()
+        if self.numeric:
+            state["moments"] = self.moments.to_state()
+            state["quantiles"] = self.quantiles.to_state()
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict, seed: int | None = None) -> ColumnStatistics:
+        """
+        Build the statistics of a column from their state.
+
+        Parameters
+        ----------
+        state : dict
+            Statistics state.
+        seed : int
+            Seed of the quantile sketch.
+
+        Returns
+        -------
+        ColumnStatistics
+            Column statistics.
+        """
+        obj = cls.__new__(cls)
+        for key in ("name", "type", "hashable", "numeric", "n", "n_missing", "memory_size", "min", "max"):
+            setattr(obj, key, state[key])
+        obj.distinct = HyperLogLog.from_state(state["distinct"]) if obj.hashable else None
+        obj.frequent = FrequentItems.from_state(state["frequent"]) if obj.hashable else None
+        obj.moments = Moments.from_state(state["moments"]) if obj.numeric else None
+        obj.quantiles = QuantileSketch.from_state(state["quantiles"], seed) if obj.numeric else None
+        return obj
+
+    def to_dict(self, quantiles: list[float], top_k: int) -> dict:
+        """
+        Return the statistics of the column. Keys are named as the
+        variables of a ydata-profiling profile.
+
+        Parameters
+        ----------
+        quantiles : list[float]
+            Quantiles to report.
+        top_k : int
+            Number of most frequent values to report.
+
+        Returns
+        -------
+        dict
+            Column statistics.
+        """
+        count = self.n - self.n_missing
+        stats = {
+            "type": self.type,
+            "hashable": self.hashable,
+            "n": self.n,
+            "count": count,
+            "n_missing": self.n_missing,
+            "p_missing": _ratio(self.n_missing, self.n),
+            "memory_size": self.memory_size,
+        }
+        if not self.hashable:
+            return stats
+
+        # Distinct values are exact while all values are counted, then
+        # estimated. Counts kept are lower bounds, a count above one
+        # means the column has duplicates.
+        if self.frequent.exact:
+            n_distinct = len(self.frequent.counts)
+            is_unique = n_distinct == count
+        else:
+            n_distinct = min(self.distinct.estimate(), count)
+            is_unique = bool((self.frequent.counts <= 1).all())
+        n_unique = self.frequent.n_unique()
+        stats.update(
+            {
+                "n_distinct": n_distinct,
+                "p_distinct": _ratio(n_distinct, count),
+                "is_unique": is_unique,
+                "n_unique": n_unique,
+                "p_unique": _ratio(n_unique, count),
+                "exact_distinct": self.frequent.exact,
+                "top": self.frequent.top(top_k),
+            }
+        )
+        if self.type in ("Numeric", "DateTime"):
+            stats["min"] = self.min
+            stats["max"] = self.max
+        if self.numeric:
+            variance = self.moments.variance()
+            stats["mean"] = self.moments.mean if self.moments.count else None
+            stats["variance"] = variance
+            stats["std"] = math.sqrt(variance) if variance is not None else None
+            for q, value in zip(quantiles, self.quantiles.quantiles(quantiles)):
+                stats[f"{q:.0%}"] = value
+        return stats
+
+    def _update_bounds(self, minimum: object, maximum: object) -> None:
+        """
+        Update minimum and maximum.
+        """
+        if minimum is not None:
+            self.min = minimum if self.min is None else min(self.min, minimum)
+        if maximum is not None:
+            self.max = maximum if self.max is None else max(self.max, maximum)
+
+
+class TableStatistics:
+    """
+    Statistics of a table, computed column by column.
+
+    Attributes
+    ----------
+    columns : dict[str, ColumnStatistics]
+        Statistics of each column.
+    n : int
+        Number of rows.
+    """
+
+    def __init__(
+        self,
+        precision: int = 14,
+        sketch_size: int = 200,
+        capacity: int = 1000,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Constructor.
+        """
+        self.precision = precision
+        self.sketch_size = sketch_size
+        self.capacity = capacity
+        self.seed = seed
+        self.columns: dict[str, ColumnStatistics] = {}
+        self.n = 0
+
+    def update(self, batch: pa.RecordBatch | pa.Table) -> None:
+        """
+        Add the rows of a batch.
+
+        Parameters
+        ----------
+        batch : pa.RecordBatch | pa.Table
+            Batch of rows.
+
+        Returns
+        -------
+        None
+        """
+        self.n += batch.num_rows
+        for field, array in zip(batch.schema, batch.columns):
+            if field.name not in self.columns:
+                self.columns[field.name] = ColumnStatistics(
+                    field.name,
+                    field.type,
+                    self.precision,
+                    self.sketch_size,
+                    self.capacity,
+                    self.seed,
+                )
+            self.columns[field.name].update(array)
+
+    def merge(self, other: TableStatistics) -> None:
+        """
+        Merge the statistics of other rows of the table.
+
+        Parameters
+        ----------
+        other : TableStatistics
+            Statistics to merge.
+
+        Returns
+        -------
+        None
+        """
+        self.n += other.n
+        for name, column in other.columns.items():
+            if name in self.columns:
+                self.columns[name].merge(column)
+            else:
+                self.columns[name] = column
+
+    def to_state(self) -> dict:
+        """
+        Return the state of the statistics, that can be serialized to JSON
+        and merged with the statistics of other rows of the table.
+
+        Returns
+        -------
+        dict
+            Statistics state.
+        """
+        return {
+            "n": self.n,
+            "precision": self.precision,
+            "sketch_size": self.sketch_size,
+            "capacity": self.capacity,
+            "columns": {k: v.to_state() for k, v in self.columns.items()},
+        }
+
+    @classmethod
+    def from_state(cls, state: dict, seed: int | None = None) -> TableStatistics:
+        """
+        Build the statistics of a table from their state.
+
+        Parameters
+        ----------
+        state : dict
+            Statistics state.
+        seed : int
+            Seed of the quantile sketches.
+
+        Returns
+        -------
+        TableStatistics
+            Table statistics.
+        """
+        obj = cls(state["precision"], state["sketch_size"], state["capacity"], seed)
+        obj.n = state["n"]
+        obj.columns = {k: ColumnStatistics.from_state(v, seed) for k, v in state["columns"].items()}
+        return obj
+
+    def to_dict(self, quantiles: list[float], top_k: int) -> dict:
+        """
+        Return table and column statistics. Keys are named as the table
+        and variables of a ydata-profiling profile.
+
+        Parameters
+        ----------
+        quantiles : list[float]
+            Quantiles to report.
+        top_k : int
+            Number of most frequent values to report.
+
+        Returns
+        -------
+        dict
+            Statistics, with "table" and "variables" keys.
+        """
+        variables = {k: v.to_dict(quantiles, top_k) for k, v in self.columns.items()}
+        n_cells = self.n * len(variables)
+        n_cells_missing = sum(v["n_missing"] for v in variables.values())
+        types = {}
+        for var in variables.values():
+            types[var["type"]] = types.get(var["type"], 0) + 1
+        table = {
+            "n": self.n,
+            "n_var": len(variables),
+            "memory_size": sum(v["memory_size"] for v in variables.values()),
+            "n_cells_missing": n_cells_missing,
+            "n_vars_with_missing": sum(1 for v in variables.values() if v["n_missing"]),
+            "p_cells_missing": _ratio(n_cells_missing, n_cells),
+            "types": types,
+        }
+        return {"table": table, "variables": variables}
+
+
+def _ratio(num: int | None, den: int) -> float | None:
+    """
+    Return a ratio, None if undefined.
+    """
+    if num is None or not den:
+        return None
+    return num / den
+
+
+def _to_json(value: object) -> object:
+    """
+    Return a value that can be serialized to JSON and compared with the
+    values of the same type: numbers as numbers, dates and times in ISO
+    format.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, numbers.Number):
+        return float(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
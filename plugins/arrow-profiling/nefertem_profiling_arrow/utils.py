@@ -0,0 +1,89 @@
+"""
+Utils functions for arrow profiling.
+"""
+from __future__ import annotations
+
+import pyarrow as pa
+
+
+def get_field_type(data_type: pa.DataType) -> str:
+    """
+    Return the type of a column as named by ydata-profiling.
+
+    Parameters
+    ----------
+    data_type : pa.DataType
+        Arrow type of the column.
+
+    Returns
+    -------
+    str
+        Column type.
+    """
+    if pa.types.is_dictionary(data_type):
+        data_type = data_type.value_type
+    if pa.types.is_boolean(data_type):
+        return "Boolean"
+    if is_numeric(data_type):
+        return "Numeric"
+    if pa.types.is_temporal(data_type) and not pa.types.is_duration(data_type):
+        return "DateTime"
+    if pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+        return "Categorical"
+    return "Unsupported"
+
+
+def is_numeric(data_type: pa.DataType) -> bool:
+    """
+    Return whether a column is numeric.
+
+    Parameters
+    ----------
+    data_type : pa.DataType
+        Arrow type of the column.
+
+    Returns
+    -------
+    bool
+        Whether the column is numeric.
+    """
+    if pa.types.is_dictionary(data_type):
+        data_type = data_type.value_type
+    return pa.types.is_integer(data_type) or pa.types.is_floating(data_type) or pa.types.is_decimal(data_type)
+
+
+def is_hashable(data_type: pa.DataType) -> bool:
+    """
+    Return whether the values of a column can be counted.
+
+    Parameters
+    ----------
+    data_type : pa.DataType
+        Arrow type of the column.
+
+    Returns
+    -------
+    bool
+        Whether the column is hashable.
+    """
+    return not pa.types.is_nested(data_type) and not pa.types.is_null(data_type)
+
+
+# Fields of the profile, the same of a ydata-profiling profile
+PROFILE_FIELDS = [
+    "n_distinct",
+    "p_distinct",
+    "is_unique",
+    "n_unique",
+    "p_unique",
+    "type",
+    "hashable",
+    "n_missing",
+    "n",
+    "p_missing",
+    "count",
+    "memory_size",
+]
+
+# Default quantiles
+QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
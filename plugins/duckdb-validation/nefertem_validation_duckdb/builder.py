@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import time
 import typing
 from copy import deepcopy
 from pathlib import Path
@@ -7,7 +9,7 @@ from pathlib import Path
 import duckdb
 from nefertem_core.readers.builder import build_reader
 from nefertem_core.readers.registry import reader_registry
-from nefertem_core.utils.utils import build_uuid, flatten_list, listify
+from nefertem_core.utils.utils import build_hash, build_uuid, flatten_list, listify
 from nefertem_validation.plugins.builder import ValidationPluginBuilder
 from nefertem_validation_duckdb.constraint import ConstraintDuckDB
 from nefertem_validation_duckdb.plugin import ValidationPluginDuckDB
@@ -19,6 +21,35 @@ if typing.TYPE_CHECKING:
 
 
 PANDAS_READER = "pandas_df_duckdb_reader"
+CACHE_DB = "cache.duckdb"
+CACHE_TABLE = "nefertem_cache"
+
+# Shared connections and run schemas of a db, closed and dropped at the end of the run
+CONNECTIONS: dict[str, list[duckdb.DuckDBPyConnection]] = {}
+SCHEMAS: dict[str, list[str]] = {}
+
+
+def release_db(db: str) -> None:
+    """
+    Close the shared connections to a db and drop the schemas of the
+    runs from it, so that the persistent db keeps only the cached tables.
+
+    Parameters
+    ----------
+    db : str
+        Database path.
+
+    Returns
+    -------
+    None
+    """
+    for conn in CONNECTIONS.pop(db, []):
+        conn.close()
+    schemas = SCHEMAS.pop(db, [])
+    if schemas and Path(db).exists():
+        with duckdb.connect(database=db, read_only=False) as con:
+            for schema in schemas:
+                con.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE;")
 
 
 class ValidationBuilderDuckDB(ValidationPluginBuilder):
@@ -26,11 +57,11 @@ class ValidationBuilderDuckDB(ValidationPluginBuilder):
     DuckDB validation plugin builder.
     """
 
-    def __init__(self, stores: list[InputStore], exec_args: dict) -> None:
+    def __init__(self, stores: list[InputStore], exec_args: dict, num_worker: int = 1) -> None:
         """
         Constructor.
         """
-        super().__init__(stores, exec_args)
+        super().__init__(stores, exec_args, num_worker)
 
         # Register new reader in the reader registry
         reader_registry.register(
@@ -63,20 +94,34 @@ class ValidationBuilderDuckDB(ValidationPluginBuilder):
             List of plugins.
         """
 
-        # Create a new db for all validation
+        # Create a new db for all validation or open the persistent one
         # Use the temporary directory from one store (all stores share the same tmp dir)
-        tmp_path = self.stores[resources[0].store].temp_dir
-        self._setup_connection(tmp_path)
+        cache_dir = self.exec_args.get("cache_dir")
+        if cache_dir is not None:
+            self._setup_cache(cache_dir)
+        else:
+            tmp_path = self.stores[resources[0].store].temp_dir
+            self._setup_connection(tmp_path)
+        self._setup_schema(self.stores[resources[0].store], cache_dir is not None)
+        materialize = self.exec_args.get("materialize", False)
 
         # Filter resources and constraints
         f_constraint = self._validate_constraints(constraints)
         f_resources = self._filter_resources(resources, f_constraint)
-        for res in f_resources:
-            self._register_resources(res)
+        used = [self._register_resources(res, materialize) for res in f_resources]
+
+        # Evict the least recently used tables of the persistent db
+        if cache_dir is not None:
+            self._evict_cache(self.exec_args.get("cache_size", 1024**3), [key for key in used if key is not None])
 
         # Close connection to db
         self._tear_down_connection()
 
+        # Share a read-only connection between plugins executed by threads
+        shared = None
+        if self.exec_args.get("shared_connection", False) and f_constraint:
+            shared = self._share_connection()
+
         plugins = []
         for const in f_constraint:
             # Get data reader for the resource
@@ -84,7 +129,8 @@ class ValidationBuilderDuckDB(ValidationPluginBuilder):
 
             # Build and setup plugin
             plugin = ValidationPluginDuckDB()
-            plugin.setup(data_reader, str(self.tmp_db), const, error_report)
+            cursor = shared.cursor() if shared is not None else None
+            plugin.setup(data_reader, str(self.tmp_db), const, error_report, cursor, self.schema)
             plugins.append(plugin)
         return plugins
 
@@ -106,6 +152,68 @@ class ValidationBuilderDuckDB(ValidationPluginBuilder):
         self.tmp_db.parent.mkdir(parents=True, exist_ok=True)
         self.con = duckdb.connect(database=str(self.tmp_db), read_only=False)
 
+    def _setup_schema(self, store: InputStore, persistent: bool) -> None:
+        """
+        Create the schema of the run, where resources are registered, so
+        that runs sharing the persistent db do not replace each other's
+        resources. The db is released when the run cleans the store.
+
+        Parameters
+        ----------
+        store : InputStore
+            Store cleaned at the end of the run.
+        persistent : bool
+            If True, the schema is dropped at the end of the run.
+
+        Returns
+        -------
+        None
+        """
+        db = str(self.tmp_db)
+        self.schema = f"run_{build_uuid().replace('-', '')}"
+        self.con.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema};")
+        if persistent:
+            SCHEMAS.setdefault(db, []).append(self.schema)
+        store.register_cleanup(f"duckdb:{db}", lambda: release_db(db))
+
+    def _share_connection(self) -> duckdb.DuckDBPyConnection:
+        """
+        Open a read-only connection to the db shared by the plugins.
+        The connection is closed when the run cleans the store, after
+        the plugins are executed.
+
+        Returns
+        -------
+        duckdb.DuckDBPyConnection
+            Connection to the db.
+        """
+        db = str(self.tmp_db)
+        threads = self.exec_args.get("threads", os.cpu_count())
+        shared = duckdb.connect(database=db, read_only=True, config={"threads": threads})
+        CONNECTIONS.setdefault(db, []).append(shared)
+        return shared
+
+    def _setup_cache(self, cache_dir: str) -> None:
+        """
+        Open the persistent db shared by runs, where ingested resources
+        are kept in tables named after the fingerprint of their content.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Path to cache folder.
+
+        Returns
+        -------
+        None
+        """
+        self.tmp_db = Path(cache_dir, CACHE_DB)
+        self.tmp_db.parent.mkdir(parents=True, exist_ok=True)
+        self.con = duckdb.connect(database=str(self.tmp_db), read_only=False)
+        self.con.execute(
+            f"CREATE TABLE IF NOT EXISTS {CACHE_TABLE} (key VARCHAR PRIMARY KEY, size BIGINT, last_used DOUBLE);"
+        )
+
     @staticmethod
     def _validate_constraints(constraints: list[dict]) -> list[ConstraintDuckDB]:
         """
@@ -143,26 +251,173 @@ class ValidationBuilderDuckDB(ValidationPluginBuilder):
         res_names = flatten_list([deepcopy(const.resources) for const in constraints])
         return [res for res in resources if res.name in res_names]
 
-    def _register_resources(self, resource: DataResource) -> None:
+    def _register_resources(self, resource: DataResource, materialize: bool = False) -> str | None:
         """
         Register resource in duckdb.
 
+        CSV and Parquet files are registered as views that DuckDB reads
+        from disk when queried, or copied by DuckDB into a table if
+        materialize is True. Other formats are read with pandas and copied
+        into a table. Resources are registered in the schema of the run.
+        In the persistent db, tables are named after the
+        fingerprint of the resource content and the resource is a view over
+        them, so a resource whose content did not change is not fetched
+        and copied again.
+
         Parameters
         ----------
         resource : DataResource
             Resource to register.
+        materialize : bool
+            If True, copy CSV and Parquet files into a table.
 
         Returns
         -------
-        None
+        str | None
+            Cache key of the table of the resource, None if not cached.
         """
+        store = self.stores[resource.store]
+        paths = listify(resource.path)
+
+        # Reuse the table of a resource whose content did not change
+        key = self._get_cache_key(resource, materialize)
+        if key is not None and self._touch_cache(key):
+            self._replace(self.schema, resource.name, "VIEW", f"SELECT * FROM main.cache_{key}")
+            return key
+
         # Fetch data resource
-        data_reader: PandasDataFrameDuckDBReader = build_reader(PANDAS_READER, self.stores[resource.store])
+        data_reader: PandasDataFrameDuckDBReader = build_reader(PANDAS_READER, store)
+
+        # Register the files read by DuckDB
+        source = data_reader.fetch_duckdb_source(paths)  # noqa pylint: disable=no-member
+        if source is not None and not materialize:
+            self._replace(self.schema, resource.name, "VIEW", f"SELECT * FROM {source}")
+            return None
+
+        # Copy data in a table, read it with pandas if DuckDB can not
+        if source is None:
+            df = data_reader.fetch_local_data(paths)  # noqa pylint: disable=no-member
+            source = "nefertem_df"
+            self.con.register(source, df)
+        if key is None:
+            self._replace(self.schema, resource.name, "TABLE", f"SELECT * FROM {source}")
+            return None
+        self._replace("main", f"cache_{key}", "TABLE", f"SELECT * FROM {source}")
+        size = sum(Path(store.fetch_file(path)).stat().st_size for path in paths)
+        self.con.execute(f"INSERT OR REPLACE INTO {CACHE_TABLE} VALUES (?, ?, ?);", [key, size, time.time()])
+        self._replace(self.schema, resource.name, "VIEW", f"SELECT * FROM main.cache_{key}")
+        return key
+
+    def _replace(self, schema: str, name: str, kind: str, query: str) -> None:
+        """
+        Create a table or a view, replacing any table or view with the same name.
 
-        # Read data and register it in duckdb
-        paths = listify(resource.path)
-        df = data_reader.fetch_local_data(paths)  # noqa pylint: disable=no-member
-        self.con.execute(f"CREATE TABLE IF NOT EXISTS {resource.name} AS SELECT * FROM df;")
+        Parameters
+        ----------
+        schema : str
+            Schema of the table or view.
+        name : str
+            Name of the table or view.
+        kind : str
+            TABLE or VIEW.
+        query : str
+            Query that defines the table or view.
+
+        Returns
+        -------
+        None
+        """
+        existing = self.con.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_schema = ? AND table_name = ?;",
+            [schema, name],
+        ).fetchone()
+        if existing is not None and (existing[0] == "VIEW") != (kind == "VIEW"):
+            self.con.execute(f"DROP {'VIEW' if existing[0] == 'VIEW' else 'TABLE'} {schema}.{name};")
+        self.con.execute(f"CREATE OR REPLACE {kind} {schema}.{name} AS {query};")
+
+    def _get_cache_key(self, resource: DataResource, materialize: bool) -> str | None:
+        """
+        Return the cache key of a resource, made of the fingerprints
+        of its files.
+
+        Parameters
+        ----------
+        resource : DataResource
+            Resource to register.
+        materialize : bool
+            If True, CSV and Parquet files are copied into a table.
+
+        Returns
+        -------
+        str | None
+            Cache key, None if the persistent db is not used or the content
+            of a file can not be fingerprinted.
+        """
+        if self.exec_args.get("cache_dir") is None:
+            return None
+        store = self.stores[resource.store]
+        fingerprints = []
+        for path in listify(resource.path):
+            fingerprint = store.get_fingerprint(path)
+            if fingerprint is None:
+                return None
+            fingerprints.append([path, fingerprint])
+        return build_hash(
+            {
+                "store": store.store_type,
+                "inputs": fingerprints,
+                "materialize": materialize,
+                "duckdb": duckdb.__version__,
+            }
+        )
+
+    def _touch_cache(self, key: str) -> bool:
+        """
+        Mark a cached table as used.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        bool
+            True if the table is cached.
+        """
+        found = self.con.execute(f"SELECT 1 FROM {CACHE_TABLE} WHERE key = ?;", [key]).fetchone()
+        if found is None:
+            return False
+        self.con.execute(f"UPDATE {CACHE_TABLE} SET last_used = ? WHERE key = ?;", [time.time(), key])
+        return True
+
+    def _evict_cache(self, max_size: int, used: list[str]) -> None:
+        """
+        Drop the least recently used tables until the cached resources
+        fit in the maximum size. Tables used by this run are kept.
+
+        Parameters
+        ----------
+        max_size : int
+            Maximum size in bytes of the files of the cached resources.
+        used : list[str]
+            Cache keys of the tables used by this run.
+
+        Returns
+        -------
+        None
+        """
+        entries = self.con.execute(f"SELECT key, size FROM {CACHE_TABLE} ORDER BY last_used;").fetchall()
+        size = sum(entry[1] for entry in entries)
+        for key, entry_size in entries:
+            if size <= max_size:
+                break
+            if key in used:
+                continue
+            self.con.execute(f"DROP TABLE IF EXISTS main.cache_{key};")
+            self.con.execute(f"DELETE FROM {CACHE_TABLE} WHERE key = ?;", [key])
+            size -= entry_size
+        self.con.execute("CHECKPOINT;")
 
     def _tear_down_connection(self) -> None:
         """
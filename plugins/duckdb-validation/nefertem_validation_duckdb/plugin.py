@@ -4,21 +4,28 @@ DuckDB implementation of validation plugin.
 from __future__ import annotations
 
 import typing
+from typing import Any
 
 import duckdb
 from nefertem_core.plugins.utils import RenderTuple, exec_decorator
+from nefertem_core.utils.exceptions import StoreError
 from nefertem_validation.metadata.report import NefertemReport
 from nefertem_validation.plugins.plugin import ValidationPlugin
 from nefertem_validation.plugins.utils import get_errors, parse_error_report, render_error_type
 from nefertem_validation_duckdb.utils import (
+    HEAD_ROWS,
     ValidationReport,
+    build_count_query,
+    build_head_query,
     evaluate_validity,
+    is_existence_check,
     return_first_value,
     return_head,
     return_length,
 )
 
 if typing.TYPE_CHECKING:
+    import pandas as pd
     from nefertem_core.plugins.utils import Result
     from nefertem_validation_duckdb.constraint import ConstraintDuckDB
     from nefertem_validation_duckdb.reader import PandasDataFrameDuckDBReader
@@ -35,6 +42,8 @@ class ValidationPluginDuckDB(ValidationPlugin):
         """
         super().__init__()
         self.db = None
+        self.cursor = None
+        self.schema = None
         self.exec_multiprocess = True
 
     def setup(
@@ -43,6 +52,8 @@ class ValidationPluginDuckDB(ValidationPlugin):
         db: str,
         constraint: ConstraintDuckDB,
         error_report: str,
+        cursor: duckdb.DuckDBPyConnection | None = None,
+        schema: str | None = None,
     ) -> None:
         """
         Setup plugin.
@@ -57,34 +68,50 @@ class ValidationPluginDuckDB(ValidationPlugin):
             Constraint to validate resource in db.
         error_report : str
             Error report modality.
+        cursor : duckdb.DuckDBPyConnection
+            Cursor of a connection shared with other plugins. If given, the
+            plugin is executed by a thread and the query runs on the cursor,
+            parallelized by DuckDB, instead of a connection of its own.
+        schema : str
+            Schema where the resources of the run are registered.
         """
         self.data_reader = data_reader
         self.db = db
         self.constraint = constraint
         self.error_report = error_report
-
-        # Set filter function according to check type
-        if self.constraint.check == "value":
-            self.filter_fnc = return_first_value
-        elif self.constraint.check == "rows":
-            self.filter_fnc = return_length
+        self.cursor = cursor
+        self.schema = schema
+        if cursor is not None:
+            self.exec_multiprocess = False
+            self.exec_multithread = True
 
     @exec_decorator
     def validate(self) -> ValidationReport:
         """
         Generate a validation report.
 
+        The checks are evaluated in DuckDB: only the head of the query
+        result is fetched, and rows are counted by DuckDB when the check
+        needs more than their existence. Queries that can not be wrapped
+        as a subquery, e.g. with a trailing comment or many statements,
+        are executed as they are and their whole result is fetched.
+
         Returns
         -------
         ValidationReport
             ValidationReport object.
         """
+        conn = self.cursor if self.cursor is not None else duckdb.connect(database=self.db, read_only=True)
         try:
-            # Fetch data from db
-            data = self.data_reader.read_duckdb(self.db, self.constraint.query)
+            # Resolve the names of the resources in the schema of the run
+            if self.schema is not None:
+                conn.execute(f"SET search_path = '{self.schema},main';")
 
-            # Filter result
-            value = self.filter_fnc(data)
+            # Fetch the head of the query result from db
+            data, complete = self._fetch_head(conn)
+
+            # Get the checked value
+            value = self._get_value(data, conn, complete)
 
             # Evaluate validity
             valid, errors = evaluate_validity(value, self.constraint.expect, self.constraint.value)
@@ -92,8 +119,83 @@ class ValidationPluginDuckDB(ValidationPlugin):
             # Return report
             result = return_head(data)
             return ValidationReport(result, valid, errors)
-        except Exception as ex:
-            raise ex
+        finally:
+            conn.close()
+
+    def _fetch_head(self, conn: duckdb.DuckDBPyConnection) -> tuple[pd.DataFrame, bool]:
+        """
+        Fetch the first rows of the query result. If the wrapped query
+        fails, the query is executed as it is.
+
+        Parameters
+        ----------
+        conn : duckdb.DuckDBPyConnection
+            Connection to the database.
+
+        Returns
+        -------
+        tuple[pd.DataFrame, bool]
+            First rows of the query result, and whether they are the whole result.
+        """
+        try:
+            return self.data_reader.read_duckdb(self.db, build_head_query(self.constraint.query), conn), False
+        except StoreError as ex:
+            self.logger.warning(
+                f"Unable to wrap the query of constraint {self.constraint.name}, executing it as it is. "
+                f"Arguments: {str(ex.args)}"
+            )
+            return self.data_reader.read_duckdb(self.db, self.constraint.query, conn), True
+
+    def _get_value(self, head: pd.DataFrame, conn: duckdb.DuckDBPyConnection, complete: bool = False) -> Any:
+        """
+        Return the value checked by the constraint.
+
+        Parameters
+        ----------
+        head : pd.DataFrame
+            First rows of the query result.
+        conn : duckdb.DuckDBPyConnection
+            Connection to the database.
+        complete : bool
+            Whether the rows are the whole query result.
+
+        Returns
+        -------
+        Any
+            First value of the result or number of rows of the result.
+        """
+        if self.constraint.check == "value":
+            return return_first_value(head)
+
+        # Emptiness and results shorter than the head do not need a count
+        if complete or is_existence_check(self.constraint) or return_length(head) < HEAD_ROWS:
+            return return_length(head)
+        return self._count(conn)
+
+    def _count(self, conn: duckdb.DuckDBPyConnection) -> int:
+        """
+        Count the rows of the query result in DuckDB. If the wrapped
+        query fails, the query is executed as it is.
+
+        Parameters
+        ----------
+        conn : duckdb.DuckDBPyConnection
+            Connection to the database.
+
+        Returns
+        -------
+        int
+            Number of rows of the query result.
+        """
+        try:
+            count = self.data_reader.read_duckdb(self.db, build_count_query(self.constraint.query), conn)
+        except StoreError as ex:
+            self.logger.warning(
+                f"Unable to count the rows of constraint {self.constraint.name} in DuckDB, "
+                f"executing its query as it is. Arguments: {str(ex.args)}"
+            )
+            return return_length(self.data_reader.read_duckdb(self.db, self.constraint.query, conn))
+        return return_first_value(count)
 
     @exec_decorator
     def render_nefertem(self, result: Result) -> RenderTuple:
@@ -3,12 +3,17 @@ PandasDataFrameDuckDBReader module.
 """
 from __future__ import annotations
 
+from pathlib import Path
+from typing import BinaryIO
+
 import duckdb
 import pandas as pd
+import pyarrow as pa
 from nefertem_core.readers.objects._base import DataReader
+from nefertem_core.readers.objects.arrow import ArrowReader, get_dataset_format
+from nefertem_core.utils.describe import describe_buffer, describe_resource
 from nefertem_core.utils.exceptions import StoreError
 from nefertem_core.utils.utils import listify
-from nefertem_validation_duckdb.utils import describe_resource
 
 
 class PandasDataFrameDuckDBReader(DataReader):
@@ -18,9 +23,11 @@ class PandasDataFrameDuckDBReader(DataReader):
     It allows to read a resource as pandas DataFrame.
     """
 
-    def fetch_local_data(self, srcs: list[str]) -> pd.DataFrame:
+    def fetch_local_data(self, srcs: list[str]) -> pd.DataFrame | pa.Table:
         """
-        Fetch resource from backend.
+        Fetch resource from backend. CSV and Parquet files are read in a
+        single Arrow table, that DuckDB copies without converting it to
+        pandas, other formats are read one by one and concatenated.
 
         Parameters
         ----------
@@ -29,31 +36,115 @@ class PandasDataFrameDuckDBReader(DataReader):
 
         Returns
         -------
-        pd.DataFrame
-            Pandas DataFrame.
+        pd.DataFrame | pa.Table
+            Pandas DataFrame or Arrow table.
         """
-        dfs = []
-        for src in srcs:
-            dfs.append(self.fetch_data(src))
-        return pd.concat(dfs)
+        file_format = get_dataset_format(srcs)
+        if file_format is None:
+            return pd.concat([self.fetch_data(src) for src in srcs])
+        args = {}
+        if file_format == "csv":
+            csv_args = self._get_csv_args(describe_resource(self.store.fetch_file(srcs[0])))
+            args = {"delimiter": csv_args["sep"], "encoding": csv_args["encoding"]}
+        return ArrowReader(self.store).fetch_data(srcs, **args)
 
-    def fetch_data(self, src: str) -> pd.DataFrame:
+    def fetch_duckdb_source(self, srcs: list[str]) -> str | None:
         """
-        Fetch resource from backend.
+        Fetch resources from backend and return a DuckDB table function
+        that reads them from disk, without loading them in memory.
+        Resources must be all CSV or all Parquet files.
+
+        Parameters
+        ----------
+        srcs : list[str]
+            List of paths to resources.
+
+        Returns
+        -------
+        str | None
+            Table function reading the resources, None if DuckDB can not read them.
+        """
+        file_format = get_dataset_format(srcs)
+        if file_format is None:
+            return None
+        paths = [str(Path(self.store.fetch_file(src)).resolve()) for src in srcs]
+        files = "[" + ", ".join(self._quote(path) for path in paths) + "]"
+        union = ", union_by_name=true" if len(paths) > 1 else ""
+        if file_format == "parquet":
+            return f"read_parquet({files}{union})"
+        if file_format == "csv":
+            resources = [describe_resource(path) for path in paths]
+            delimiters = {self._get_csv_args(res)["sep"] for res in resources}
+            encodings = {res.get("encoding") for res in resources}
+            if len(delimiters) > 1 or not encodings <= {None, "utf-8"}:
+                return None
+            return f"read_csv_auto({files}, delim={self._quote(delimiters.pop())}, header=true{union})"
+        return None
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        """
+        Return a SQL string literal.
+        """
+        return "'" + value.replace("'", "''") + "'"
+
+    def fetch_data(self, src: str, columns: list[str] | None = None) -> pd.DataFrame:
+        """
+        Fetch resource from backend. Parquet and CSV files are read from
+        a file object of the store, so stores that support ranged reads
+        transfer only the footer and the requested columns of a Parquet
+        file and stream CSV files without storing them.
 
         Parameters
         ----------
         src : str
             Path to resource.
+        columns : list[str]
+            Columns to read, by default all.
 
         Returns
         -------
         pd.DataFrame
             Pandas DataFrame.
         """
+        file_format = Path(src).suffix.lower()
+        if file_format == ".parquet":
+            with self.store.fetch_buffer(src) as buffer:
+                return pd.read_parquet(buffer, columns=columns)
+        if file_format == ".csv":
+            with self.store.fetch_buffer(src) as buffer:
+                res = self._describe_csv(src, buffer)
+                return pd.read_csv(buffer, usecols=columns, **self._get_csv_args(res))
+
         path = self.store.fetch_file(src)
         res = describe_resource(path)
-        return self._read_df_from_path(res)
+        df = self._read_df_from_path(res)
+        return df if columns is None else df[columns]
+
+    def _describe_csv(self, src: str, buffer: BinaryIO) -> dict:
+        """
+        Describe a CSV resource read from a file object of the store.
+        Fetched files are described by path, resources read with ranged
+        requests by their first bytes. Both descriptions are cached until
+        the resource changes.
+
+        Parameters
+        ----------
+        src : str
+            Path to resource.
+        buffer : BinaryIO
+            File object of the resource.
+
+        Returns
+        -------
+        dict
+            Resource description.
+        """
+        if not self.store.reads_ranges():
+            return describe_resource(self.store.fetch_file(src))
+        fingerprint = self.store.get_fingerprint(src)
+        source = None if fingerprint is None else f"{self.store.store_type}:{self.store.name}:{src}:{fingerprint}"
+        return describe_buffer(buffer, source)
 
     def _read_df_from_path(self, resource: dict) -> pd.DataFrame:
         """
@@ -73,10 +164,7 @@ class PandasDataFrameDuckDBReader(DataReader):
         file_format = resource.get("format")
 
         if file_format == "csv":
-            csv_args = {
-                "sep": resource.get("dialect", {}).get("csv", {}).get("delimiter", ","),
-                "encoding": resource.get("encoding"),
-            }
+            csv_args = self._get_csv_args(resource)
             list_df = [pd.read_csv(i, **csv_args) for i in paths]
         elif file_format in ["xls", "xlsx", "ods", "odf"]:
             list_df = [pd.read_excel(i) for i in paths]
@@ -87,7 +175,32 @@ class PandasDataFrameDuckDBReader(DataReader):
 
         return pd.concat(list_df)
 
-    def read_duckdb(self, src: str, query: str) -> pd.DataFrame:
+    @staticmethod
+    def _get_csv_args(resource: dict) -> dict:
+        """
+        Return the arguments to read a CSV file.
+
+        Parameters
+        ----------
+        resource : dict
+            Resource description.
+
+        Returns
+        -------
+        dict
+            Arguments of pandas read_csv.
+        """
+        return {
+            "sep": resource.get("dialect", {}).get("csv", {}).get("delimiter", ","),
+            "encoding": resource.get("encoding"),
+        }
+
+    def read_duckdb(
+        self,
+        src: str,
+        query: str,
+        cursor: duckdb.DuckDBPyConnection | None = None,
+    ) -> pd.DataFrame:
         """
         Read data from a local duckdb.
 
@@ -97,6 +210,9 @@ class PandasDataFrameDuckDBReader(DataReader):
             Source name.
         query : str
             Query to execute.
+        cursor : duckdb.DuckDBPyConnection
+            Cursor of a connection to the database, left open. If None, a
+            read-only connection to the database is opened for the query.
 
         Returns
         -------
@@ -109,8 +225,12 @@ class PandasDataFrameDuckDBReader(DataReader):
             If the query fails.
         """
         try:
+            if cursor is not None:
+                return cursor.execute(query).fetchdf()
             conn = duckdb.connect(database=src, read_only=True)
-            conn.execute(query)
-            return conn.fetchdf()
+            try:
+                return conn.execute(query).fetchdf()
+            finally:
+                conn.close()
         except Exception as ex:
             raise StoreError(f"Unable to read data from query: {query}. Arguments: {str(ex.args)}")
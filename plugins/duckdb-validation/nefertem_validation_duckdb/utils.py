@@ -4,10 +4,16 @@ SQL checks module.
 from __future__ import annotations
 
 import re
+import typing
 from typing import Any
 
 import pandas as pd
-from frictionless import Detector, Resource
+
+if typing.TYPE_CHECKING:
+    from nefertem_validation_duckdb.constraint import ConstraintDuckDB
+
+# Number of rows of the sample returned in reports
+HEAD_ROWS = 100
 
 
 def evaluate_validity(result: Any, expect: str, value: Any) -> tuple:
@@ -135,25 +141,6 @@ class ValidationReport:
         return {"result": self.result, "valid": self.valid, "error": self.error}
 
 
-def describe_resource(pth: str) -> dict:
-    """
-    Describe a resource using frictionless.
-
-    With bigger buffer/sample we should avoid error encoding detection.
-
-    Parameters
-    ----------
-    pth: str
-        Path to resource.
-
-    Returns
-    -------
-    dict
-        Resource description.
-    """
-    return Resource.describe(source=pth, detector=Detector(buffer_size=20000, sample_size=1250)).to_dict()
-
-
 def return_head(df: pd.DataFrame) -> dict:
     """
     Return head(100) of DataFrame as dict.
@@ -173,3 +160,31 @@ def return_length(df: pd.DataFrame) -> int:
     Return length of DataFrame.
     """
     return df.shape[0]
+
+
+def _as_subquery(query: str, alias: str = "nefertem_subquery") -> str:
+    """
+    Wrap a query to select from it.
+    """
+    return f"({query.strip().rstrip(';')}) AS {alias}"
+
+
+def build_head_query(query: str, limit: int = HEAD_ROWS) -> str:
+    """
+    Build a query that returns the first rows of a query.
+    """
+    return f"SELECT * FROM {_as_subquery(query)} LIMIT {limit}"
+
+
+def build_count_query(query: str) -> str:
+    """
+    Build a query that counts in DuckDB the rows of a query.
+    """
+    return f"SELECT COUNT(*) AS count FROM {_as_subquery(query)}"
+
+
+def is_existence_check(constraint: ConstraintDuckDB) -> bool:
+    """
+    Check if a rows constraint only needs to know if the query returns rows.
+    """
+    return constraint.expect in ("empty", "non-empty")
@@ -6,7 +6,7 @@ from __future__ import annotations
 import typing
 
 from nefertem_core.readers.builder import build_reader
-from nefertem_core.utils.commons import FILE_READER
+from nefertem_core.utils.commons import ARROW_READER
 from nefertem_metric_evidently.metrics import MetricEvidently
 from nefertem_metric_evidently.plugin import ProfilingPluginEvidently
 from nefertem_profiling.plugins.builder import ProfilingPluginBuilder
@@ -34,18 +34,18 @@ class MetricBuilderEvidently(ProfilingPluginBuilder):
             for resource in resources:
                 if resource.name == metric.resource:
                     store = self.stores[resource.store]
-                    data_reader = build_reader(FILE_READER, store)
+                    data_reader = build_reader(ARROW_READER, store)
                     curr_resource = resource
                 elif resource.name == metric.reference_resource:
                     store = self.stores[resource.store]
-                    ref_data_reader = build_reader(FILE_READER, store)
+                    ref_data_reader = build_reader(ARROW_READER, store)
                     ref_resource = resource
 
             if curr_resource is not None:
                 plugin = ProfilingPluginEvidently()
                 plugin.setup(
                     data_reader,
-                    resource,
+                    curr_resource,
                     metric,
                     self.exec_args,
                     ref_data_reader,
@@ -7,13 +7,18 @@ from typing import Any
 import evidently
 from evidently.report import Report
 from nefertem_core.plugins.utils import RenderTuple, Result, exec_decorator
+from nefertem_core.readers.objects.arrow import to_pandas
 from nefertem_core.utils.io_utils import write_bytesio
+from nefertem_core.utils.snapshot import cached_snapshot
+from nefertem_core.utils.utils import listify
 from nefertem_metric.metadata.report import NefertemMetricReport, ProfileMetric
 from nefertem_metric.plugins.plugin import MetricPlugin
 
 if typing.TYPE_CHECKING:
-    from nefertem_core.readers.objects.file import FileReader
+    import pandas as pd
+    from nefertem_core.readers.objects.arrow import ArrowReader
     from nefertem_core.resources.data_resource import DataResource
+    from nefertem_core.stores.input.objects._base import InputStore
     from nefertem_metric_evidently.metrics import MetricEvidently
 
 
@@ -33,11 +38,11 @@ class MetricPluginEvidently(MetricPlugin):
 
     def setup(
         self,
-        data_reader: FileReader,
+        data_reader: ArrowReader,
         resource: DataResource,
         metric: MetricEvidently,
         exec_args: dict,
-        reference_data_reader: FileReader = None,
+        reference_data_reader: ArrowReader = None,
         reference_resource: DataResource = None,
     ) -> None:
         """
@@ -50,23 +55,54 @@ class MetricPluginEvidently(MetricPlugin):
         self.metric = metric
         self.exec_args = exec_args
 
+    def get_inputs(self) -> list[tuple[InputStore, str]]:
+        """
+        Return the inputs read by the plugin, reference resource included.
+
+        Returns
+        -------
+        list[tuple[InputStore, str]]
+            List of (store, path) tuples.
+        """
+        inputs = [(self.data_reader.store, path) for path in listify(self.resource.path)]
+        if self.reference_resource is not None:
+            store = self.reference_data_reader.store
+            inputs.extend((store, path) for path in listify(self.reference_resource.path))
+        return inputs
+
     @exec_decorator
     def profile(self) -> Report:
         """
         Generate evidently profile.
         """
-        data = self.data_reader.fetch_data(self.resource.path)
-        reference_data = (
-            None
-            if self.reference_resource is None
-            else self.reference_data_reader.fetch_data(self.reference_resource.path)
-        )
+        data = to_pandas(self.data_reader.fetch_data(self.resource.path))
+        reference_data = None if self.reference_resource is None else self._fetch_reference()
 
         metrics = self._rebuild_metrics()
         report = Report(metrics=metrics)
         report.run(current_data=data, reference_data=reference_data)
         return report
 
+    def _fetch_reference(self) -> pd.DataFrame:
+        """
+        Return the reference data. The reference is read once and shared
+        by the evidently plugins executed by the same process, and stored
+        across runs if persist_reference is set, until its content changes.
+
+        Returns
+        -------
+        pd.DataFrame
+            Reference data.
+        """
+        reader = self.reference_data_reader
+        path = self.reference_resource.path
+        return cached_snapshot(
+            reader.store,
+            path,
+            lambda: to_pandas(reader.fetch_data(path)),
+            persist=self.exec_args.get("persist_reference", False),
+        )
+
     def _rebuild_metrics(self) -> list[Any]:
         """
         Rebuild metrics converting to Evidently metrics.
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from nefertem_core.readers.builder import build_reader
 from nefertem_core.resources.data_resource import DataResource
-from nefertem_core.utils.commons import FILE_READER
+from nefertem_core.utils.commons import ARROW_READER
 from nefertem_validation.plugins.builder import ValidationPluginBuilder
 from nefertem_validation_evidently.constraint import ConstraintEvidently
 from nefertem_validation_evidently.plugin import ValidationPluginEvidently
@@ -25,21 +25,25 @@ class ValidationBuilderEvidently(ValidationPluginBuilder):
         f_constraints = self._validate_constraints(constraints)
         plugins = []
         for constraint in f_constraints:
+            data_reader = None
+            curr_resource = None
+            ref_data_reader = None
+            ref_resource = None
             for resource in resources:
                 if resource.name == constraint.resource:
                     store = self.stores[resource.store]
-                    data_reader = build_reader(FILE_READER, store)
+                    data_reader = build_reader(ARROW_READER, store)
                     curr_resource = resource
                 elif resource.name == constraint.reference_resource:
                     store = self.stores[resource.store]
-                    ref_data_reader = build_reader(FILE_READER, store)
+                    ref_data_reader = build_reader(ARROW_READER, store)
                     ref_resource = resource
 
             if curr_resource is not None:
                 plugin = ValidationPluginEvidently()
                 plugin.setup(
                     data_reader,
-                    resource,
+                    curr_resource,
                     constraint,
                     error_report,
                     self.exec_args,
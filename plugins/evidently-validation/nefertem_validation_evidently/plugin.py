@@ -3,10 +3,14 @@ from __future__ import annotations
 import importlib
 
 import evidently
+import pandas as pd
 from evidently.test_suite import TestSuite
 from nefertem_core.plugins.utils import RenderTuple, Result, exec_decorator
-from nefertem_core.readers.objects.file import FileReader
+from nefertem_core.readers.objects.arrow import ArrowReader, to_pandas
 from nefertem_core.resources.data_resource import DataResource
+from nefertem_core.stores.input.objects._base import InputStore
+from nefertem_core.utils.snapshot import cached_snapshot
+from nefertem_core.utils.utils import listify
 from nefertem_validation.metadata.report import NefertemReport
 from nefertem_validation.plugins.plugin import ValidationPlugin
 from nefertem_validation.plugins.utils import get_errors, parse_error_report
@@ -29,12 +33,12 @@ class ValidationPluginEvidently(ValidationPlugin):
 
     def setup(
         self,
-        data_reader: FileReader,
+        data_reader: ArrowReader,
         resource: DataResource,
         constraint: ConstraintEvidently,
         error_report: str,
         exec_args: dict,
-        reference_data_reader: FileReader = None,
+        reference_data_reader: ArrowReader = None,
         reference_resource: DataResource = None,
     ) -> None:
         self.data_reader = data_reader
@@ -45,22 +49,53 @@ class ValidationPluginEvidently(ValidationPlugin):
         self.error_report = error_report
         self.exec_args = exec_args
 
+    def get_inputs(self) -> list[tuple[InputStore, str]]:
+        """
+        Return the inputs read by the plugin, reference resource included.
+
+        Returns
+        -------
+        list[tuple[InputStore, str]]
+            List of (store, path) tuples.
+        """
+        inputs = [(self.data_reader.store, path) for path in listify(self.resource.path)]
+        if self.reference_resource is not None:
+            store = self.reference_data_reader.store
+            inputs.extend((store, path) for path in listify(self.reference_resource.path))
+        return inputs
+
     @exec_decorator
     def validate(self) -> dict:
         """
         Validate a Data Resource.
         """
-        data = self.data_reader.fetch_data(self.resource.path)
-        reference_data = (
-            None
-            if self.reference_resource is None
-            else self.reference_data_reader.fetch_data(self.reference_resource.path)
-        )
+        data = to_pandas(self.data_reader.fetch_data(self.resource.path))
+        reference_data = None if self.reference_resource is None else self._fetch_reference()
         tests = self._rebuild_constraints()
         test_run = TestSuite(tests=tests)
         test_run.run(current_data=data, reference_data=reference_data)
         return test_run
 
+    def _fetch_reference(self) -> pd.DataFrame:
+        """
+        Return the reference data. The reference is read once and shared
+        by the evidently plugins executed by the same process, and stored
+        across runs if persist_reference is set, until its content changes.
+
+        Returns
+        -------
+        pd.DataFrame
+            Reference data.
+        """
+        reader = self.reference_data_reader
+        path = self.reference_resource.path
+        return cached_snapshot(
+            reader.store,
+            path,
+            lambda: to_pandas(reader.fetch_data(path)),
+            persist=self.exec_args.get("persist_reference", False),
+        )
+
     def _rebuild_constraints(self) -> list[any]:
         """
         Rebuild constraints converting to Evidently test.
@@ -8,6 +8,8 @@ import typing
 import frictionless
 from frictionless import Schema
 from nefertem_core.plugins.utils import RenderTuple, exec_decorator
+from nefertem_core.utils.pickle_utils import register_reducer
+from nefertem_core.utils.utils import listify
 from nefertem_inference.metadata.report import NefertemSchema
 from nefertem_inference.plugins.plugin import InferencePlugin
 from nefertem_inference.plugins.utils import get_fields
@@ -16,6 +18,11 @@ if typing.TYPE_CHECKING:
     from nefertem_core.plugins.utils import Result
     from nefertem_core.readers.objects.file import FileReader
     from nefertem_core.resources.data_resource import DataResource
+    from nefertem_core.stores.input.objects._base import InputStore
+
+
+# Pickle schemas through their descriptor
+register_reducer(Schema, lambda obj: (Schema.from_descriptor, (obj.to_dict(),)))
 
 
 class InferencePluginFrictionless(InferencePlugin):
@@ -68,6 +75,17 @@ class InferencePluginFrictionless(InferencePlugin):
         self.resource = resource
         self.exec_args = exec_args
 
+    def get_inputs(self) -> list[tuple[InputStore, str]]:
+        """
+        Return the inputs read by the plugin.
+
+        Returns
+        -------
+        list[tuple[InputStore, str]]
+            List of (store, path) tuples.
+        """
+        return [(self.data_reader.store, path) for path in listify(self.resource.path)]
+
     @exec_decorator
     def infer(self) -> Schema:
         """
@@ -6,9 +6,12 @@ from __future__ import annotations
 import typing
 
 import frictionless
-from frictionless import Resource
+from frictionless import Resource, system
+from frictionless.resources import TableResource
 from nefertem_core.plugins.utils import RenderTuple, exec_decorator
 from nefertem_core.utils.io_utils import write_bytesio
+from nefertem_core.utils.pickle_utils import register_reducer
+from nefertem_core.utils.utils import listify
 from nefertem_profiling.metadata.report import NefertemProfile
 from nefertem_profiling.plugins.plugin import ProfilingPlugin
 
@@ -16,6 +19,31 @@ if typing.TYPE_CHECKING:
     from nefertem_core.plugins.utils import Result
     from nefertem_core.readers.objects.file import FileReader
     from nefertem_core.resources.data_resource import DataResource
+    from nefertem_core.stores.input.objects._base import InputStore
+
+
+def _load_resource(descriptor: dict) -> Resource:
+    """
+    Rebuild a pickled resource. Profiled resources point to the
+    absolute path of fetched data, trusted to rebuild them.
+
+    Parameters
+    ----------
+    descriptor : dict
+        Resource descriptor.
+
+    Returns
+    -------
+    Resource
+        Frictionless resource.
+    """
+    with system.use_context(trusted=True):
+        return Resource.from_descriptor(descriptor)
+
+
+# Pickle profiled resources through their descriptor
+register_reducer(Resource, lambda obj: (_load_resource, (obj.to_dict(),)))
+register_reducer(TableResource, lambda obj: (_load_resource, (obj.to_dict(),)))
 
 
 class ProfilingPluginFrictionless(ProfilingPlugin):
@@ -52,6 +80,17 @@ class ProfilingPluginFrictionless(ProfilingPlugin):
         self.resource = resource
         self.exec_args = exec_args
 
+    def get_inputs(self) -> list[tuple[InputStore, str]]:
+        """
+        Return the inputs read by the plugin.
+
+        Returns
+        -------
+        list[tuple[InputStore, str]]
+            List of (store, path) tuples.
+        """
+        return [(self.data_reader.store, path) for path in listify(self.resource.path)]
+
     @exec_decorator
     def profile(self) -> Resource:
         """
@@ -4,10 +4,13 @@ import typing
 from copy import deepcopy
 
 from nefertem_core.readers.builder import build_reader
+from nefertem_core.stores.input.objects.sql import build_sql_path
+from nefertem_core.stores.kinds import StoreKinds
 from nefertem_core.utils.commons import FILE_READER
+from nefertem_core.utils.utils import listify
 from nefertem_validation.plugins.builder import ValidationPluginBuilder
 from nefertem_validation_frictionless.constraints import ConstraintFrictionless, ConstraintFullFrictionless
-from nefertem_validation_frictionless.plugin import ValidationPluginFrictionless
+from nefertem_validation_frictionless.plugin import ValidationPluginFrictionless, ValidationPluginFrictionlessBatch
 
 if typing.TYPE_CHECKING:
     from nefertem_core.resources.data_resource import DataResource
@@ -23,23 +26,109 @@ class ValidationBuilderFrictionless(ValidationPluginBuilder):
         resources: list[DataResource],
         constraints: list[dict],
         error_report: str,
-    ) -> list[ValidationPluginFrictionless]:
+    ) -> list[ValidationPluginFrictionless | ValidationPluginFrictionlessBatch]:
         """
-        Build a plugin for every resource and every constraint.
+        Build a plugin for every resource and every constraint. Unless the
+        batch execution argument is False, field constraints of the same
+        resource are validated together in a single pass by one plugin.
         """
+        exec_args = dict(self.exec_args)
+        chunk_size = exec_args.pop("chunk_size", None)
+        pushdown = exec_args.pop("pushdown", False)
+        # Errors counted beyond the limit can not be split by constraint
+        batch = exec_args.pop("batch", True) and not exec_args.get("count_errors", False)
         f_constraints = self._validate_constraints(constraints)
         plugins = []
         for res in resources:
             resource = deepcopy(res)
-            for const in f_constraints:
-                if resource.name in const.resources:
-                    store = self.stores[resource.store]
+            store = self.stores[resource.store]
+            pushdown_store = pushdown and store.store_type == StoreKinds.SQL.value
+            r_constraints = [const for const in f_constraints if resource.name in const.resources]
+            groups = self._group_constraints(r_constraints) if batch else [[const] for const in r_constraints]
+            for group in groups:
+                group_plugins = []
+                for const in group:
                     data_reader = build_reader(FILE_READER, store)
                     plugin = ValidationPluginFrictionless()
-                    plugin.setup(data_reader, resource, const, error_report, self.exec_args)
-                    plugins.append(plugin)
+                    size = chunk_size if self._is_row_local(const) else None
+                    if pushdown_store:
+                        plugin_resource = self._pushdown_resource(resource, const)
+                    else:
+                        plugin_resource = resource
+                    plugin.setup(data_reader, plugin_resource, const, error_report, exec_args, size)
+                    group_plugins.append(plugin)
+                if len(group_plugins) == 1:
+                    plugins.extend(group_plugins)
+                    continue
+
+                # Validate the field constraints of the group in a single pass
+                plugin = ValidationPluginFrictionlessBatch()
+                size = chunk_size if all(self._is_row_local(const) for const in group) else None
+                plugin_resource = self._pushdown_resource(resource, *group) if pushdown_store else resource
+                data_reader = build_reader(FILE_READER, store)
+                plugin.setup(data_reader, plugin_resource, group_plugins, error_report, exec_args, size)
+                plugins.append(plugin)
         return plugins
 
+    @staticmethod
+    def _group_constraints(
+        constraints: list[ConstraintFrictionless | ConstraintFullFrictionless],
+    ) -> list[list[ConstraintFrictionless | ConstraintFullFrictionless]]:
+        """
+        Group the field constraints of a resource that can be added to the
+        same schema. Constraints on the same field are grouped only if they
+        check the same type with the same weight and different rules, and
+        a format constraint is never grouped with other constraints on its
+        field, since it changes the type errors of the field. Full schema
+        constraints are not grouped.
+        """
+        groups = []
+        group_fields = []
+        for const in constraints:
+            if not isinstance(const, ConstraintFrictionless):
+                groups.append([const])
+                group_fields.append(None)
+                continue
+            for group, fields in zip(groups, group_fields):
+                if fields is None:
+                    continue
+                field = fields.get(const.field)
+                if field is None:
+                    fields[const.field] = (const.field_type, const.weight, {const.constraint})
+                    group.append(const)
+                    break
+                field_type, weight, rules = field
+                if (
+                    field_type == const.field_type
+                    and weight == const.weight
+                    and const.constraint not in rules
+                    and "format" not in rules | {const.constraint}
+                ):
+                    rules.add(const.constraint)
+                    group.append(const)
+                    break
+            else:
+                groups.append([const])
+                group_fields.append({const.field: (const.field_type, const.weight, {const.constraint})})
+        return groups
+
+    @staticmethod
+    def _pushdown_resource(
+        resource: DataResource,
+        *consts: ConstraintFrictionless | ConstraintFullFrictionless,
+    ) -> DataResource:
+        """
+        Return a copy of a SQL resource that reads only the fields
+        checked by constraints, so the store exports only those columns.
+        """
+        if not all(isinstance(const, ConstraintFrictionless) for const in consts):
+            return resource
+        fields = list(dict.fromkeys(const.field for const in consts))
+        resource = deepcopy(resource)
+        paths = [build_sql_path(path, fields) for path in listify(resource.path)]
+        resource.path = paths if isinstance(resource.path, list) else paths[0]
+        return resource
+
     @staticmethod
     def _validate_constraints(
         constraints: list[dict],
@@ -54,3 +143,17 @@ class ValidationBuilderFrictionless(ValidationPluginBuilder):
             elif c.get("type") == "frictionless_full":
                 const.append(ConstraintFullFrictionless(**c))
         return const
+
+    @staticmethod
+    def _is_row_local(const: ConstraintFrictionless | ConstraintFullFrictionless) -> bool:
+        """
+        Check if a constraint can be validated one row at a time, so that
+        a resource can be split into chunks validated independently.
+        Uniqueness and relations between rows require the whole resource.
+        """
+        if isinstance(const, ConstraintFrictionless):
+            return const.constraint != "unique"
+        schema = const.table_schema
+        if any(schema.get(key) for key in ("primaryKey", "uniqueKeys", "foreignKeys")):
+            return False
+        return not any(field.get("constraints", {}).get("unique") for field in schema.get("fields", []))
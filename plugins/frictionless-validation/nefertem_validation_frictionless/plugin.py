@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import copy
+import csv
+import os
+import re
+import sys
 import typing
+from pathlib import Path
 
 import frictionless
-from frictionless import Report, Resource, Schema
+from frictionless import Checklist, Dialect, Report, Resource, Schema
 from frictionless.exception import FrictionlessException
-from nefertem_core.plugins.utils import RenderTuple, Result, exec_decorator
+from frictionless.formats import CsvControl
+from nefertem_core.plugins.utils import ExecutionStatus, RenderTuple, Result, exec_decorator
+from nefertem_core.utils.describe import cached_describe
+from nefertem_core.utils.pickle_utils import register_reducer
+from nefertem_core.utils.utils import build_uuid, listify
 from nefertem_validation.metadata.report import NefertemReport
 from nefertem_validation.plugins.plugin import ValidationPlugin
 from nefertem_validation.plugins.utils import get_errors, parse_error_report, render_error_type
@@ -13,9 +23,91 @@ from nefertem_validation.plugins.utils import get_errors, parse_error_report, re
 if typing.TYPE_CHECKING:
     from nefertem_core.readers.objects.file import FileReader
     from nefertem_core.resources.data_resource import DataResource
+    from nefertem_core.stores.input.objects._base import InputStore
     from nefertem_validation_frictionless.constraints import ConstraintFrictionless, ConstraintFullFrictionless
 
 
+# Reports returned by worker processes are pickled, and frictionless
+# metadata objects lose their content if pickled as they are
+register_reducer(Report, lambda obj: (Report.from_descriptor, (obj.to_dict(),)))
+
+# Default frictionless limit of errors
+LIMIT_ERRORS = 1000
+
+# Warnings of reports whose errors exceed the limit, when the validation
+# stopped at the limit or when it went on counting the errors
+LIMIT_WARNING = "reached error limit"
+COUNT_WARNING = "counted errors beyond limit"
+
+# Row position in frictionless error messages
+ROW_POSITION = re.compile(r'(row (?:at position )?")(\d+)(")', re.IGNORECASE)
+
+# Errors of a field caused by its type or constraints
+FIELD_ERRORS = ("type-error", "constraint-error", "unique-error")
+
+
+class ErrorCounter(Checklist):
+    """
+    Checklist that stores errors up to a limit and counts the others,
+    so the validation reads the whole resource with bounded memory.
+    """
+
+    def __init__(self, limit: int, **kwargs) -> None:
+        """
+        Constructor.
+        """
+        super().__init__(**kwargs)
+        self.limit = limit
+        self.stored = 0
+        self.dropped = 0
+
+    def match(self, error: frictionless.Error) -> bool:
+        """
+        Check if an error is reported, counting it if beyond the limit.
+        """
+        if not super().match(error):
+            return False
+        if self.stored >= self.limit:
+            self.dropped += 1
+            return False
+        self.stored += 1
+        return True
+
+
+class ConstraintErrorCounter(Checklist):
+    """
+    Checklist that stores up to a limit the errors of every constraint
+    of a batch, so a constraint with many errors does not use up the
+    errors reported for the other constraints.
+    """
+
+    def __init__(self, limit: int, constraints: list[ConstraintFrictionless], **kwargs) -> None:
+        """
+        Constructor.
+        """
+        super().__init__(**kwargs)
+        self.limit = limit
+        self.constraints = constraints
+        self.stored = [0] * len(constraints)
+
+    def match(self, error: frictionless.Error) -> bool:
+        """
+        Check if an error is reported, i.e. if a constraint it belongs
+        to has not reached the limit.
+        """
+        if not super().match(error):
+            return False
+        descriptor = error.to_dict()
+        matched = False
+        for idx, const in enumerate(self.constraints):
+            if self.stored[idx] >= self.limit:
+                continue
+            if ValidationPluginFrictionlessBatch._is_constraint_error(descriptor, const):
+                self.stored[idx] += 1
+                matched = True
+        return matched
+
+
 class ValidationPluginFrictionless(ValidationPlugin):
     """
     Frictionless implementation of validation plugin.
@@ -28,6 +120,8 @@ class ValidationPluginFrictionless(ValidationPlugin):
         super().__init__()
         self.resource = None
         self.schema = None
+        self.chunk_size = None
+        self.chunk = None
         self.exec_multiprocess = True
 
     def setup(
@@ -37,6 +131,7 @@ class ValidationPluginFrictionless(ValidationPlugin):
         constraint: ConstraintFrictionless | ConstraintFullFrictionless,
         error_report: str,
         exec_args: dict,
+        chunk_size: int | None = None,
     ) -> None:
         """
         Setup plugin.
@@ -52,13 +147,32 @@ class ValidationPluginFrictionless(ValidationPlugin):
         error_report : str
             Error report modality.
         exec_args : dict
-            Execution arguments for Resource.validate method.
+            Execution arguments for Resource.validate method. If count_errors
+            is True, the whole resource is validated and errors beyond the
+            limit are counted without being stored, otherwise the validation
+            stops at the limit and the count of errors is a lower bound.
+        chunk_size : int
+            Size in bytes of the chunks a CSV resource is split into
+            to be validated in parallel. If None, the resource is not split.
         """
         self.data_reader = data_reader
         self.resource = resource
         self.constraint = constraint
         self.error_report = error_report
         self.exec_args = exec_args
+        self.chunk_size = chunk_size
+        self.exec_partition = chunk_size is not None and chunk_size > 0
+
+    def get_inputs(self) -> list[tuple[InputStore, str]]:
+        """
+        Return the inputs read by the plugin.
+
+        Returns
+        -------
+        list[tuple[InputStore, str]]
+            List of (store, path) tuples.
+        """
+        return [(self.data_reader.store, path) for path in listify(self.resource.path)]
 
     @exec_decorator
     def validate(self) -> Report:
@@ -70,10 +184,281 @@ class ValidationPluginFrictionless(ValidationPlugin):
         Report
             Validation report.
         """
+        resource = self._get_resource()
+        args = dict(self.exec_args)
+        if not args.pop("count_errors", False):
+            return Report.from_descriptor(resource.validate(**args).to_dict())
+
+        # Count the errors beyond the limit without storing them
+        limit = args.get("limit_errors", LIMIT_ERRORS)
+        checklist = self._get_checklist(args)
+        counter = ErrorCounter(
+            limit,
+            checks=checklist.checks,
+            pick_errors=checklist.pick_errors,
+            skip_errors=checklist.skip_errors,
+        )
+        report = resource.validate(**{**args, "checklist": counter, "limit_errors": 0}).to_dict()
+        if counter.dropped:
+            task = report["tasks"][0]
+            task["warnings"].append(f"{COUNT_WARNING}: {limit}")
+            for obj in (task, report):
+                obj["stats"]["errors"] += counter.dropped
+                obj["stats"]["warnings"] += 1
+        return Report.from_descriptor(report)
+
+    def _get_resource(self) -> Resource:
+        """
+        Return the resource to validate, with the schema of the constraint,
+        or the chunk of the resource assigned to the plugin.
+
+        Returns
+        -------
+        Resource
+            Resource to validate.
+        """
+        data = self.data_reader.fetch_data(self.resource.path)
+        if self.chunk is not None:
+            return self._get_chunk(str(data))
+        schema = self._rebuild_constraints(str(data))
+        return Resource(path=str(data), schema=schema)
+
+    @staticmethod
+    def _get_checklist(args: dict) -> Checklist:
+        """
+        Return the checklist of the execution arguments.
+
+        Parameters
+        ----------
+        args : dict
+            Execution arguments for Resource.validate method.
+
+        Returns
+        -------
+        Checklist
+            Checklist.
+        """
+        checklist = args.get("checklist") or Checklist()
+        if isinstance(checklist, dict):
+            checklist = Checklist.from_descriptor(checklist)
+        return checklist
+
+    def partition(self) -> list[ValidationPluginFrictionless]:
+        """
+        Split a CSV resource into chunks of whole records, each one
+        validated by a sub-plugin against the same schema.
+        Resources that are not single CSV files, or that are smaller
+        than the chunk size, are not split.
+
+        Returns
+        -------
+        list[ValidationPluginFrictionless]
+            List of sub-plugins.
+        """
         data = self.data_reader.fetch_data(self.resource.path)
+        if not isinstance(data, (str, Path)) or Path(data).suffix.lower() != ".csv":
+            return []
+        size = os.path.getsize(data)
+        if size <= self.chunk_size:
+            return []
+
+        # Infer schema, encoding and dialect once for all the chunks
         schema = self._rebuild_constraints(str(data))
-        res = Resource(path=str(data), schema=schema).validate(**self.exec_args)
-        return Report.from_descriptor(res.to_dict())
+        description = cached_describe(
+            data,
+            f"frictionless=={frictionless.__version__}:resource",
+            lambda path: Resource.describe(path=path).to_dict(),
+        )
+        options = {"encoding": description.get("encoding"), "dialect": description.get("dialect", {})}
+
+        # Cut the file at the end of the record that follows every chunk boundary
+        offsets = self._split_records(data, self.chunk_size, options)
+        if len(offsets) < 2:
+            return []
+
+        partitions = []
+        for idx, (start, end) in enumerate(offsets):
+            part = copy.copy(self)
+            part.id = build_uuid()
+            part.partition_id = idx
+            part.schema = schema.to_dict()
+            part.chunk = (offsets[0][0], start, end, options)
+            part.exec_partition = False
+            partitions.append(part)
+        return partitions
+
+    @staticmethod
+    def _split_records(data_path: str, chunk_size: int, options: dict) -> list[tuple[int, int]]:
+        """
+        Return the byte offsets of chunks of whole records of a CSV file.
+        The file is parsed with its dialect, so a quoted field spanning
+        several lines is never cut, and the first chunk starts after the
+        header rows. Files whose records can not be parsed line by line,
+        e.g. with comment rows or an encoding that is not ASCII compatible,
+        are not split.
+
+        Parameters
+        ----------
+        data_path : str
+            Data path.
+        chunk_size : int
+            Minimum size in bytes of a chunk.
+        options : dict
+            Encoding and dialect of the file.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            Start and end offset of every chunk.
+        """
+        encoding = options["encoding"] or "utf-8"
+        dialect = Dialect.from_descriptor(options["dialect"])
+        if "\n".encode(encoding) != b"\n" or dialect.comment_char or dialect.comment_rows:
+            return []
+        control = dialect.get_control("csv") if dialect.has_control("csv") else CsvControl()
+        header_rows = max(dialect.header_rows, default=0) if dialect.header else 0
+
+        position = 0
+
+        def lines() -> typing.Iterator[str]:
+            nonlocal position
+            with open(data_path, "rb") as file:
+                for line in file:
+                    position += len(line)
+                    yield line.decode(encoding, errors="replace")
+
+        # The csv reader consumes lines only up to the end of a record
+        reader = csv.reader(lines(), dialect=control.to_python())
+        for _ in range(header_rows):
+            next(reader, None)
+        offsets = []
+        start = position
+        for _ in reader:
+            if position - start >= chunk_size:
+                offsets.append((start, position))
+                start = position
+        if position > start:
+            offsets.append((start, position))
+        return offsets
+
+    def _get_chunk(self, data_path: str) -> Resource:
+        """
+        Return an in-memory resource made of the header and the chunk
+        of rows assigned to the plugin.
+
+        Parameters
+        ----------
+        data_path : str
+            Data path.
+
+        Returns
+        -------
+        Resource
+            Chunk resource.
+        """
+        header, start, end, options = self.chunk
+        with open(data_path, "rb") as file:
+            head = file.read(header)
+            file.seek(start)
+            rows = file.read(end - start)
+        return Resource(
+            head + rows,
+            format="csv",
+            encoding=options["encoding"],
+            dialect=Dialect.from_descriptor(options["dialect"]),
+            schema=Schema(self.schema),
+        )
+
+    def merge_reports(self, results: list[Result], limit: int | None = None) -> Result:
+        """
+        Merge the reports of the chunks of a resource into a single report.
+        Row numbers are shifted to the position of the rows in the resource,
+        errors are kept in row order and truncated to the limit of errors.
+
+        Parameters
+        ----------
+        results : list[Result]
+            Validation results of the chunks, in chunk order.
+        limit : int
+            Maximum number of errors, by default the limit of errors of the validation.
+
+        Returns
+        -------
+        Result
+            Merged validation result.
+        """
+        duration = round(sum(res.duration or 0 for res in results), 2)
+        for res in results:
+            if res.errors is not None:
+                return Result(ExecutionStatus.ERROR.value, duration, res.errors)
+
+        if limit is None:
+            limit = self.exec_args.get("limit_errors", LIMIT_ERRORS)
+        data = self.data_reader.fetch_data(self.resource.path)
+        tasks = [res.artifact.to_dict()["tasks"][0] for res in results]
+
+        errors = []
+        warnings = []
+        offset = 0
+        seconds = 0
+        dropped = 0
+        for idx, task in enumerate(tasks):
+            for error in task["errors"]:
+                if "rowNumber" in error:
+                    row = error["rowNumber"] + offset
+                    error = {
+                        **error,
+                        "rowNumber": row,
+                        "message": ROW_POSITION.sub(rf"\g<1>{row}\g<3>", error["message"]),
+                    }
+                # Header errors are reported by every chunk
+                elif idx > 0:
+                    continue
+                errors.append(error)
+            warnings.extend(warn for warn in task["warnings"] if not warn.startswith((LIMIT_WARNING, COUNT_WARNING)))
+            offset += task["stats"]["rows"]
+            seconds += task["stats"]["seconds"]
+            dropped += task["stats"]["errors"] - len(task["errors"])
+
+        # Errors counted beyond the limit are added to the count of errors
+        count = len(errors) + dropped
+        if self.exec_args.get("count_errors", False) and count > limit:
+            errors = errors[:limit]
+            warnings.append(f"{COUNT_WARNING}: {limit}")
+        elif len(errors) >= limit:
+            errors = errors[:limit]
+            warnings.append(f"{LIMIT_WARNING}: {limit}")
+            count = limit
+
+        task = {
+            **tasks[0],
+            "name": Path(data).stem,
+            "place": str(data),
+            "valid": not errors,
+            "stats": {
+                "errors": count,
+                "warnings": len(warnings),
+                "seconds": round(seconds, 3),
+                "bytes": os.path.getsize(data),
+                "fields": tasks[0]["stats"]["fields"],
+                "rows": offset,
+            },
+            "warnings": warnings,
+            "errors": errors,
+        }
+        report = {
+            "valid": not errors,
+            "stats": {
+                "tasks": 1,
+                "errors": count,
+                "warnings": len(warnings),
+                "seconds": round(seconds, 3),
+            },
+            "warnings": [],
+            "errors": [],
+            "tasks": [task],
+        }
+        return Result(ExecutionStatus.FINISHED.value, duration, artifact=Report.from_descriptor(report))
 
     def _rebuild_constraints(self, data_path: str) -> Schema:
         """
@@ -125,6 +510,7 @@ class ValidationPluginFrictionless(ValidationPlugin):
     def _get_schema(data_path: str) -> dict:
         """
         Infer simple schema of a resource if not present.
+        The inferred schema is cached until the file changes.
 
         Parameters
         ----------
@@ -137,7 +523,11 @@ class ValidationPluginFrictionless(ValidationPlugin):
             Schema.
         """
         try:
-            schema = Schema.describe(path=data_path).to_dict()
+            schema = cached_describe(
+                data_path,
+                f"frictionless=={frictionless.__version__}:schema",
+                lambda path: Schema.describe(path=path).to_dict(),
+            )
             if not schema:
                 return {"fields": []}
             return {"fields": [{"name": field["name"], "type": "any"} for field in schema["fields"]]}
@@ -165,12 +555,17 @@ class ValidationPluginFrictionless(ValidationPlugin):
         errors = None
 
         if exec_err is None:
-            valid = result.artifact.to_dict().get("valid")
+            report = result.artifact.to_dict()
+            valid = report.get("valid")
             if not valid:
-                errors_list = [render_error_type(err[0]) for err in result.artifact.flatten(spec=["code"])]
-                total_count = len(errors_list)
+                errors_list = [render_error_type(err[0]) for err in result.artifact.flatten(spec=["type"])]
+                total_count = max(len(errors_list), report["stats"]["errors"])
                 parsed_error_list = parse_error_report(errors_list, self.error_report)
-                errors = get_errors(total_count, parsed_error_list)
+
+                # The validation stopped at the limit, more errors may follow
+                warnings = [warn for task in report["tasks"] for warn in task["warnings"]]
+                lower_bound = any(warn.startswith(LIMIT_WARNING) for warn in warnings)
+                errors = get_errors(total_count, parsed_error_list, lower_bound)
 
         else:
             self.logger.error(f"Execution error {str(exec_err)} for plugin {self.id}")
@@ -231,3 +626,301 @@ class ValidationPluginFrictionless(ValidationPlugin):
             Library version.
         """
         return frictionless.__version__
+
+
+class ValidationPluginFrictionlessBatch(ValidationPluginFrictionless):
+    """
+    Frictionless validation of many field constraints of a resource in
+    a single pass.
+
+    The constraints are added to one schema and the resource is validated
+    once, then the errors of the report are split by field and error code
+    and rendered by a ValidationPluginFrictionless for every constraint.
+    Errors that do not depend on a field type or constraint, e.g. blank
+    rows, are reported for every constraint, as if validated one by one.
+    Every constraint has its own limit of errors, and the validation stops
+    when all the constraints reached it. If the validation fails, the
+    constraints are validated one by one.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        super().__init__()
+        self.plugins = []
+        self.constraints = []
+
+    def setup(
+        self,
+        data_reader: FileReader,
+        resource: DataResource,
+        plugins: list[ValidationPluginFrictionless],
+        error_report: str,
+        exec_args: dict,
+        chunk_size: int | None = None,
+    ) -> None:
+        """
+        Setup plugin.
+
+        Parameters
+        ----------
+        data_reader : FileReader
+            Data reader.
+        resource : DataResource
+            Data resource with all the fields checked by the constraints.
+        plugins : list[ValidationPluginFrictionless]
+            Plugins of the constraints to validate in a single pass.
+        error_report : str
+            Error report modality.
+        exec_args : dict
+            Execution arguments for Resource.validate method.
+        chunk_size : int
+            Size in bytes of the chunks a CSV resource is split into
+            to be validated in parallel. If None, the resource is not split.
+        """
+        super().setup(data_reader, resource, None, error_report, exec_args, chunk_size)
+        self.plugins = plugins
+        self.constraints = [plugin.constraint for plugin in plugins]
+
+    def execute(self) -> dict:
+        """
+        Validate all the constraints and render a result for each one.
+
+        Returns
+        -------
+        dict
+            Results of execution, with a list of values for every result type.
+        """
+        plugin = f"Plugin: {self.framework_name()} {self.id};"
+        constraints = f"Constraints: {[const.name for const in self.constraints]};"
+        self.logger.info(f"Execute batch validation - {plugin} {constraints}")
+        lib_result = self.validate()
+        return self._render_batch(lib_result)
+
+    @exec_decorator
+    def validate(self) -> Report:
+        """
+        Get frictionless validation report of all the constraints.
+
+        Returns
+        -------
+        Report
+            Validation report.
+        """
+        resource = self._get_resource()
+        args = dict(self.exec_args)
+        limit = args.get("limit_errors", LIMIT_ERRORS)
+        if not limit:
+            return Report.from_descriptor(resource.validate(**args).to_dict())
+
+        # Store up to the limit the errors of every constraint
+        checklist = self._get_checklist(args)
+        counter = ConstraintErrorCounter(
+            limit,
+            self.constraints,
+            checks=checklist.checks,
+            pick_errors=checklist.pick_errors,
+            skip_errors=checklist.skip_errors,
+        )
+        report = resource.validate(**{**args, "checklist": counter, "limit_errors": limit * len(self.constraints)})
+        return Report.from_descriptor(report.to_dict())
+
+    def merge_reports(self, results: list[Result], limit: int | None = None) -> Result:
+        """
+        Merge the reports of the chunks of a resource into a single report.
+        Errors are not truncated, they are limited by constraint when the
+        report is split.
+
+        Parameters
+        ----------
+        results : list[Result]
+            Validation results of the chunks, in chunk order.
+        limit : int
+            Maximum number of errors, by default no limit.
+
+        Returns
+        -------
+        Result
+            Merged validation result.
+        """
+        return super().merge_reports(results, limit or sys.maxsize)
+
+    def merge_partitions(self, results: list[Result]) -> dict:
+        """
+        Merge the validation results of the sub-plugins and render them
+        for every constraint.
+
+        Parameters
+        ----------
+        results : list[Result]
+            Validation results of the partitions, in partition order.
+
+        Returns
+        -------
+        dict
+            Results of execution, with a list of values for every result type.
+        """
+        self.logger.info(f"Merge {len(results)} partitions - Plugin: {self.framework_name()} {self.id};")
+        lib_result = self.merge_reports(results)
+        return self._render_batch(lib_result)
+
+    def _render_batch(self, lib_result: Result) -> dict:
+        """
+        Split the validation result by constraint and render it with
+        the plugin of every constraint.
+
+        Parameters
+        ----------
+        lib_result : Result
+            Validation result of all the constraints.
+
+        Returns
+        -------
+        dict
+            Results of execution, with a list of values for every result type.
+        """
+        if lib_result.errors is not None:
+            self.logger.warning(
+                f"Batch validation failed for plugin {self.id}, validating constraints one by one. "
+                f"Arguments: {str(lib_result.errors)}"
+            )
+            return self._merge([plugin.execute() for plugin in self.plugins])
+
+        report = lib_result.artifact.to_dict()
+        task = report["tasks"][0]
+        limit = self.exec_args.get("limit_errors", LIMIT_ERRORS)
+        results = []
+        for plugin in self.plugins:
+            errors = [err for err in task["errors"] if self._is_constraint_error(err, plugin.constraint)]
+            artifact = self._split_report(report, errors, limit)
+            results.append(Result(ExecutionStatus.FINISHED.value, lib_result.duration, artifact=artifact))
+        return self._render_results(results)
+
+    @staticmethod
+    def _is_constraint_error(error: dict, constraint: ConstraintFrictionless) -> bool:
+        """
+        Check if an error is reported by the validation of a constraint.
+
+        Parameters
+        ----------
+        error : dict
+            Frictionless error.
+        constraint : ConstraintFrictionless
+            Constraint.
+
+        Returns
+        -------
+        bool
+            True if the error belongs to the constraint.
+        """
+        code = error.get("type")
+        if code not in FIELD_ERRORS or "fieldName" not in error:
+            return True
+        if error["fieldName"] != constraint.field:
+            return False
+        if code == "unique-error":
+            return constraint.constraint == "unique"
+        if code == "constraint-error":
+            return error.get("note", "").startswith(f'constraint "{constraint.constraint}"')
+        return True
+
+    @staticmethod
+    def _split_report(report: dict, errors: list[dict], limit: int) -> Report:
+        """
+        Return a copy of a report with only some of its errors, truncated
+        to the limit of errors.
+
+        Parameters
+        ----------
+        report : dict
+            Frictionless report.
+        errors : list[dict]
+            Errors to keep.
+        limit : int
+            Maximum number of errors, no limit if 0.
+
+        Returns
+        -------
+        Report
+            Validation report.
+        """
+        task = report["tasks"][0]
+        warnings = [warn for warn in task["warnings"] if not warn.startswith(LIMIT_WARNING)]
+        if limit and len(errors) >= limit:
+            errors = errors[:limit]
+            warnings.append(f"{LIMIT_WARNING}: {limit}")
+        task = {
+            **task,
+            "valid": not errors,
+            "stats": {**task["stats"], "errors": len(errors), "warnings": len(warnings)},
+            "warnings": warnings,
+            "errors": errors,
+        }
+        report = {
+            **report,
+            "valid": not errors,
+            "stats": {**report["stats"], "errors": len(errors), "warnings": len(warnings)},
+            "tasks": [task],
+        }
+        return Report.from_descriptor(report)
+
+    def _rebuild_constraints(self, data_path: str) -> Schema:
+        """
+        Add the constraints of all the plugins to a simplified schema.
+
+        Parameters
+        ----------
+        data_path : str
+            Data path.
+
+        Returns
+        -------
+        Schema
+            Schema with constraints.
+        """
+        schema = self._get_schema(data_path)
+        fields = {field["name"]: field for field in schema["fields"]}
+        for const in self.constraints:
+            field = fields.get(const.field)
+            if field is None:
+                continue
+            field["error"] = {"weight": const.weight}
+            field["type"] = const.field_type
+            if const.constraint == "format":
+                field["format"] = const.value
+            elif const.constraint != "type":
+                field.setdefault("constraints", {})[const.constraint] = const.value
+        return Schema(schema)
+
+    def render_nefertem(self, result: list[Result]) -> list[Result]:
+        """
+        Return the NefertemReport of every constraint, rendered by its plugin.
+
+        Parameters
+        ----------
+        result : list[Result]
+            Execution result of every constraint.
+
+        Returns
+        -------
+        list[Result]
+            Rendered object of every constraint.
+        """
+        return [plugin.render_nefertem(res) for plugin, res in zip(self.plugins, result)]
+
+    def render_artifact(self, result: list[Result]) -> list[Result]:
+        """
+        Return the artifacts of every constraint, rendered by its plugin.
+
+        Parameters
+        ----------
+        result : list[Result]
+            Execution result of every constraint.
+
+        Returns
+        -------
+        list[Result]
+            Rendered objects of every constraint.
+        """
+        return [plugin.render_artifact(res) for plugin, res in zip(self.plugins, result)]
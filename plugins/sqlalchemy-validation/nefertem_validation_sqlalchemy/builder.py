@@ -7,8 +7,8 @@ from nefertem_core.readers.registry import reader_registry
 from nefertem_core.utils.utils import flatten_list
 from nefertem_validation.plugins.builder import ValidationPluginBuilder
 from nefertem_validation_sqlalchemy.constraint import ConstraintSqlAlchemy
-from nefertem_validation_sqlalchemy.plugin import ValidationPluginSqlAlchemy
-from operations.nefertem_validation.nefertem_validation.utils import ValidationError
+from nefertem_validation_sqlalchemy.plugin import ValidationPluginSqlAlchemy, ValidationPluginSqlAlchemyBatch
+from nefertem_validation.utils import ValidationError
 
 if typing.TYPE_CHECKING:
     from nefertem_core.resources.data_resource import DataResource
@@ -23,11 +23,11 @@ class ValidationBuilderSqlAlchemy(ValidationPluginBuilder):
     SqlAlchemy validation plugin builder.
     """
 
-    def __init__(self, stores: list[InputStore], exec_args: dict) -> None:
+    def __init__(self, stores: list[InputStore], exec_args: dict, num_worker: int = 1) -> None:
         """
         Constructor.
         """
-        super().__init__(stores, exec_args)
+        super().__init__(stores, exec_args, num_worker)
 
         # Register new reader in the reader registry
         reader_registry.register(
@@ -41,9 +41,11 @@ class ValidationBuilderSqlAlchemy(ValidationPluginBuilder):
         resources: list[DataResource],
         constraints: list[dict],
         error_report: str,
-    ) -> list[ValidationPluginSqlAlchemy]:
+    ) -> list[ValidationPluginSqlAlchemy | ValidationPluginSqlAlchemyBatch]:
         """
-        Build a plugin for every resource and every constraint.
+        Build a plugin for every constraint. Unless the batch execution
+        argument is False, constraints that count the rows of queries
+        on the same store are validated together by a single plugin.
 
         Parameters
         ----------
@@ -56,9 +58,10 @@ class ValidationBuilderSqlAlchemy(ValidationPluginBuilder):
 
         Returns
         -------
-        list[ValidationPluginSqlAlchemy]
+        list[ValidationPluginSqlAlchemy | ValidationPluginSqlAlchemyBatch]
             List of plugins.
         """
+        batch = self.exec_args.get("batch", True)
 
         # Filter resources and constraints
         f_constraint = self._validate_constraints(constraints)
@@ -67,13 +70,26 @@ class ValidationBuilderSqlAlchemy(ValidationPluginBuilder):
 
         # Build plugins
         plugins = []
+        batches = {}
         for i in g_constraint:
-            # Build reader
-            data_reader = build_reader(PANDAS_READER, i["store"])
+            # Build reader, its connections are shared by the plugins executed at the same time
+            data_reader = build_reader(PANDAS_READER, i["store"], pool_size=self.num_worker)
 
             # Setup plugin
             plugin = ValidationPluginSqlAlchemy()
-            plugin.setup(data_reader, i["constraint"], error_report, self.exec_args)
+            plugin.setup(data_reader, i["constraint"], error_report)
+            if batch and i["constraint"].check == "rows":
+                batches.setdefault(i["store"].name, []).append(plugin)
+            else:
+                plugins.append(plugin)
+
+        # Group the plugins that count rows on the same store
+        for group in batches.values():
+            if len(group) == 1:
+                plugins.extend(group)
+                continue
+            plugin = ValidationPluginSqlAlchemyBatch()
+            plugin.setup(group[0].data_reader, group, error_report)
             plugins.append(plugin)
         return plugins
 
@@ -140,7 +156,7 @@ class ValidationBuilderSqlAlchemy(ValidationPluginBuilder):
             List of constraints and store.
         """
 
-        grouped = {}
+        grouped = []
         for const in constraints:
             # Check if all resources described by constraint are in the same database
             res_stores = [res.store for res in resources if res.name in const.resources]
@@ -151,6 +167,6 @@ class ValidationBuilderSqlAlchemy(ValidationPluginBuilder):
                 raise ValidationError(f"No resources for constraint '{const.name}' are in a configured store.")
 
             # Pack constraint and store together
-            grouped.append({"constraint": const, "store": self.stores[res_stores][0]})
+            grouped.append({"constraint": const, "store": self.stores[res_stores[0]]})
 
         return grouped
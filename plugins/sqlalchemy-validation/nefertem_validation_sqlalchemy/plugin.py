@@ -4,22 +4,29 @@ SQLAlchemy implementation of validation plugin.
 from __future__ import annotations
 
 import typing
+from typing import Any
 
 import sqlalchemy
-from nefertem_core.plugins.utils import RenderTuple, exec_decorator
+from nefertem_core.plugins.utils import ExecutionStatus, RenderTuple, Result, exec_decorator
+from nefertem_core.utils.exceptions import StoreError
 from nefertem_validation.metadata.report import NefertemReport
 from nefertem_validation.plugins.plugin import ValidationPlugin
 from nefertem_validation.plugins.utils import get_errors, parse_error_report, render_error_type
 from nefertem_validation_sqlalchemy.utils import (
+    HEAD_ROWS,
     ValidationReport,
+    build_batch_query,
+    build_count_query,
+    build_head_query,
     evaluate_validity,
+    is_existence_check,
     return_first_value,
     return_head,
     return_length,
 )
 
 if typing.TYPE_CHECKING:
-    from nefertem_core.plugins.utils import Result
+    import pandas as pd
     from nefertem_validation_sqlalchemy.constraint import ConstraintSqlAlchemy
     from nefertem_validation_sqlalchemy.reader import PandasDataFrameSQLReader
 
@@ -34,7 +41,9 @@ class ValidationPluginSqlAlchemy(ValidationPlugin):
         Constructor.
         """
         super().__init__()
-        self.exec_multiprocess = True
+
+        # Queries wait on the database, so threads share the pooled engine
+        self.exec_multithread = True
 
     def setup(
         self,
@@ -58,28 +67,29 @@ class ValidationPluginSqlAlchemy(ValidationPlugin):
         self.constraint = constraint
         self.error_report = error_report
 
-        # Set filter function according to check type
-        if self.constraint.check == "value":
-            self.filter_fnc = return_first_value
-        elif self.constraint.check == "rows":
-            self.filter_fnc = return_length
-
     @exec_decorator
     def validate(self) -> dict:
         """
         Generate a validation report.
 
+        The checks are evaluated in the database: only the head of the
+        query result is fetched, and rows are counted by the database
+        when the check needs more than their existence. Queries that can
+        not be wrapped as a subquery, e.g. with a CTE or an ORDER BY on
+        some databases, are executed as they are and their whole result
+        is fetched.
+
         Returns
         -------
         ValidationReport
             ValidationReport object.
         """
         try:
-            # Fetch data from db
-            data = self.data_reader.fetch_data(self.constraint.name, self.constraint.query)
+            # Fetch the head of the query result from db
+            data, complete = self._fetch_head()
 
-            # Filter data
-            value = self.filter_fnc(data)
+            # Get the checked value
+            value = self._get_value(data, complete)
 
             # Evaluate validity
             valid, errors = evaluate_validity(value, self.constraint.expect, self.constraint.value)
@@ -90,6 +100,87 @@ class ValidationPluginSqlAlchemy(ValidationPlugin):
         except Exception as ex:
             raise ex
 
+    def _fetch_head(self) -> tuple[pd.DataFrame, bool]:
+        """
+        Fetch the first rows of the query result. If the wrapped query
+        fails, the query is executed as it is.
+
+        Returns
+        -------
+        tuple[pd.DataFrame, bool]
+            First rows of the query result, and whether they are the whole result.
+        """
+        try:
+            return self.data_reader.fetch_data(self.constraint.name, build_head_query(self.constraint.query)), False
+        except StoreError as ex:
+            self.logger.warning(
+                f"Unable to wrap the query of constraint {self.constraint.name}, executing it as it is. "
+                f"Arguments: {str(ex.args)}"
+            )
+            return self.data_reader.fetch_data(self.constraint.name, self.constraint.query), True
+
+    def _get_value(self, head: pd.DataFrame, complete: bool = False) -> Any:
+        """
+        Return the value checked by the constraint.
+
+        Parameters
+        ----------
+        head : pd.DataFrame
+            First rows of the query result.
+        complete : bool
+            Whether the rows are the whole query result.
+
+        Returns
+        -------
+        Any
+            First value of the result or number of rows of the result.
+        """
+        if self.constraint.check == "value":
+            return return_first_value(head)
+        if self._needs_count(head, complete):
+            return self._count()
+        return return_length(head)
+
+    def _needs_count(self, head: pd.DataFrame, complete: bool = False) -> bool:
+        """
+        Return whether the rows of the query result must be counted by the
+        database. Emptiness and results shorter than the head do not need
+        a count.
+
+        Parameters
+        ----------
+        head : pd.DataFrame
+            First rows of the query result.
+        complete : bool
+            Whether the rows are the whole query result.
+
+        Returns
+        -------
+        bool
+            Whether the rows must be counted.
+        """
+        return not (complete or is_existence_check(self.constraint) or return_length(head) < HEAD_ROWS)
+
+    def _count(self) -> int:
+        """
+        Count the rows of the query result in the database. If the
+        wrapped query fails, the query is executed as it is.
+
+        Returns
+        -------
+        int
+            Number of rows of the query result.
+        """
+        try:
+            count = self.data_reader.fetch_data(self.constraint.name, build_count_query(self.constraint.query))
+        except StoreError as ex:
+            self.logger.warning(
+                f"Unable to count the rows of constraint {self.constraint.name} in the database, "
+                f"executing its query as it is. Arguments: {str(ex.args)}"
+            )
+            return return_length(self.data_reader.fetch_data(self.constraint.name, self.constraint.query))
+        return return_first_value(count)
+
     @exec_decorator
     def render_nefertem(self, result: Result) -> RenderTuple:
         """
@@ -176,3 +267,178 @@ class ValidationPluginSqlAlchemy(ValidationPlugin):
             Library version.
         """
         return sqlalchemy.__version__
+
+
+class ValidationPluginSqlAlchemyBatch(ValidationPlugin):
+    """
+    SQLAlchemy validation of many rows constraints with fewer count queries.
+
+    The head of every query is fetched as by a ValidationPluginSqlAlchemy,
+    since it is the sample of the report, then the rows of all the queries
+    longer than the head are counted by one query that returns a column
+    for every constraint, instead of a count query for each one. Reports and
+    artifacts are rendered by the plugin of every constraint, so they are
+    the same of a validation without batch. If the validation fails,
+    every constraint is validated by its own plugin.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        super().__init__()
+        self.exec_multithread = True
+        self.plugins = []
+        self.constraints = []
+
+    def setup(
+        self,
+        data_reader: PandasDataFrameSQLReader,
+        plugins: list[ValidationPluginSqlAlchemy],
+        error_report: str,
+    ) -> None:
+        """
+        Setup plugin.
+
+        Parameters
+        ----------
+        data_reader : PandasDataFrameSQLReader
+            Data reader.
+        plugins : list[ValidationPluginSqlAlchemy]
+            Plugins of the constraints to validate together.
+        error_report : str
+            Error report modality.
+        """
+        self.data_reader = data_reader
+        self.plugins = plugins
+        self.constraints = [plugin.constraint for plugin in plugins]
+        self.error_report = error_report
+
+    def execute(self) -> dict:
+        """
+        Validate all the constraints and render a result for each one.
+
+        Returns
+        -------
+        dict
+            Results of execution, with a list of values for every result type.
+        """
+        plugin = f"Plugin: {self.framework_name()} {self.id};"
+        constraints = f"Constraints: {[const.name for const in self.constraints]};"
+        self.logger.info(f"Execute batch validation - {plugin} {constraints}")
+        lib_result = self.validate()
+        if lib_result.errors is not None:
+            self.logger.warning(
+                f"Batch validation failed for plugin {self.id}, validating constraints one by one. "
+                f"Arguments: {str(lib_result.errors)}"
+            )
+            return self._merge([plugin.execute() for plugin in self.plugins])
+        results = [
+            Result(ExecutionStatus.FINISHED.value, lib_result.duration, artifact=report)
+            for report in lib_result.artifact
+        ]
+        return self._render_results(results)
+
+    @exec_decorator
+    def validate(self) -> list[ValidationReport]:
+        """
+        Evaluate the checks of all the constraints.
+
+        Returns
+        -------
+        list[ValidationReport]
+            ValidationReport object of every constraint.
+        """
+        heads = [plugin._fetch_head() for plugin in self.plugins]
+        to_count = [idx for idx, (plugin, head) in enumerate(zip(self.plugins, heads)) if plugin._needs_count(*head)]
+        counts = self._count(to_count)
+        reports = []
+        for idx, (const, (data, _)) in enumerate(zip(self.constraints, heads)):
+            value = counts[idx] if idx in counts else return_length(data)
+            valid, errors = evaluate_validity(value, const.expect, const.value)
+            reports.append(ValidationReport(return_head(data), valid, errors))
+        return reports
+
+    def _count(self, idxs: list[int]) -> dict[int, int]:
+        """
+        Count the rows of the queries of some constraints with a single
+        query. If it fails, every query is counted by its own plugin.
+
+        Parameters
+        ----------
+        idxs : list[int]
+            Indexes of the constraints.
+
+        Returns
+        -------
+        dict[int, int]
+            Number of rows by index of the constraint.
+        """
+        if not idxs:
+            return {}
+        try:
+            query = build_batch_query([self.constraints[idx] for idx in idxs])
+            data = self.data_reader.fetch_data(self.constraints[0].name, query)
+        except StoreError as ex:
+            self.logger.warning(
+                f"Unable to count the rows of the constraints of plugin {self.id} with a single query, "
+                f"counting them one by one. Arguments: {str(ex.args)}"
+            )
+            return {idx: self.plugins[idx]._count() for idx in idxs}
+        return {idx: data.iloc[0, pos].item() for pos, idx in enumerate(idxs)}
+
+    def render_nefertem(self, result: list[Result]) -> list[Result]:
+        """
+        Return the NefertemReport of every constraint, rendered by its plugin.
+
+        Parameters
+        ----------
+        result : list[Result]
+            Execution result of every constraint.
+
+        Returns
+        -------
+        list[Result]
+            Rendered object of every constraint.
+        """
+        return [plugin.render_nefertem(res) for plugin, res in zip(self.plugins, result)]
+
+    def render_artifact(self, result: list[Result]) -> list[Result]:
+        """
+        Return the artifacts of every constraint, rendered by its plugin.
+
+        Parameters
+        ----------
+        result : list[Result]
+            Execution result of every constraint.
+
+        Returns
+        -------
+        list[Result]
+            Rendered objects of every constraint.
+        """
+        return [plugin.render_artifact(res) for plugin, res in zip(self.plugins, result)]
+
+    @staticmethod
+    def framework_name() -> str:
+        """
+        Get library name.
+
+        Returns
+        -------
+        str
+            Library name.
+        """
+        return ValidationPluginSqlAlchemy.framework_name()
+
+    @staticmethod
+    def framework_version() -> str:
+        """
+        Get library version.
+
+        Returns
+        -------
+        str
+            Library version.
+        """
+        return ValidationPluginSqlAlchemy.framework_version()
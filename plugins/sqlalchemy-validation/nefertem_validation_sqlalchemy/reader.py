@@ -3,11 +3,42 @@ PandasDataFrameReader module.
 """
 from __future__ import annotations
 
+import multiprocessing
+import threading
+import typing
+
 import pandas as pd
 from nefertem_core.readers.objects._base import DataReader
 from nefertem_core.utils.exceptions import StoreError
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.sql import Select
+
+if typing.TYPE_CHECKING:
+    from nefertem_core.stores.input.objects._base import InputStore
+
+# Engines of the main process by connection string, shared by all its readers during a run
+ENGINES: dict[str, Engine] = {}
+ENGINES_LOCK = threading.Lock()
+
+
+def dispose_engine(conn_str: str) -> None:
+    """
+    Close the connections of the engine of a database and forget it.
+
+    Parameters
+    ----------
+    conn_str : str
+        Connection string.
+
+    Returns
+    -------
+    None
+    """
+    with ENGINES_LOCK:
+        engine = ENGINES.pop(conn_str, None)
+    if engine is not None:
+        engine.dispose()
 
 
 class PandasDataFrameSQLReader(DataReader):
@@ -15,33 +46,65 @@ class PandasDataFrameSQLReader(DataReader):
     PandasDataFrameSQLReader class.
 
     It allows to read a resource as pandas DataFrame.
+    The plugins reading with it run in threads, so readers share one
+    engine, and its pool of connections, for every database. The engine
+    is disposed when the store is cleaned at the end of the run. Readers
+    executed in worker processes open their own engine for every query
+    and dispose it, so no connection is shared with a forked parent.
     """
 
-    def fetch_data(self, src: str, query: str) -> pd.DataFrame:
+    def __init__(self, store: InputStore, pool_size: int = 1) -> None:
+        """
+        Constructor.
+        """
+        super().__init__(store)
+        self.pool_size = pool_size
+
+    def fetch_data(self, src: str, query: str | Select) -> pd.DataFrame:
         """
-        Fetch resource from backend.
+        Fetch resource from backend. The query can be a string
+        or a SQLAlchemy select statement.
         """
         conn_string = self.store.fetch_native(src)
         return self._read_df_from_db(conn_string, query)
 
-    @staticmethod
-    def _get_engine(conn_str: str) -> Engine:
+    def _get_engine(self, conn_str: str) -> Engine:
+        """
+        Return the SQLAlchemy Engine of the main process for a database,
+        creating it on first use and registering its disposal at the
+        end of the run.
+        """
+        with ENGINES_LOCK:
+            engine = ENGINES.get(conn_str)
+            if engine is None:
+                engine = self._create_engine(conn_str)
+                ENGINES[conn_str] = engine
+                self.store.register_cleanup(f"engine:{conn_str}", lambda: dispose_engine(conn_str))
+            return engine
+
+    def _create_engine(self, conn_str: str) -> Engine:
         """
-        Create a SQLAlchemy Engine.
+        Create a SQLAlchemy Engine with a pool of pool_size connections.
         """
         try:
+            return create_engine(conn_str, pool_size=self.pool_size, pool_pre_ping=True)
+        except TypeError:
+            # Dialects without a queue pool, e.g. SQLite
             return create_engine(conn_str)
         except Exception as ex:
             raise StoreError(f"Something wrong with connection string. Arguments: {str(ex.args)}")
 
-    def _read_df_from_db(self, conn_str: str, query: str) -> pd.DataFrame:
+    def _read_df_from_db(self, conn_str: str, query: str | Select) -> pd.DataFrame:
         """
         Use the pandas to read data from db.
         """
-        engine = self._get_engine(conn_str)
+        in_worker = multiprocessing.parent_process() is not None
+        engine = self._create_engine(conn_str) if in_worker else self._get_engine(conn_str)
         try:
-            return pd.read_sql(query, engine)
+            with engine.connect() as conn:
+                return pd.read_sql(query, conn)
         except Exception as ex:
             raise StoreError(f"Unable to read data from query: {query}. Arguments: {str(ex.args)}")
         finally:
-            engine.dispose()
+            if in_worker:
+                engine.dispose()
@@ -4,10 +4,18 @@ SQL checks module.
 from __future__ import annotations
 
 import re
+import typing
 from typing import Any
 
 import pandas as pd
-from frictionless import Detector, Resource
+import sqlalchemy
+from sqlalchemy.sql import Select
+
+if typing.TYPE_CHECKING:
+    from nefertem_validation_sqlalchemy.constraint import ConstraintSqlAlchemy
+
+# Number of rows of the sample returned in reports
+HEAD_ROWS = 100
 
 
 def evaluate_validity(result: Any, expect: str, value: Any) -> tuple:
@@ -135,25 +143,6 @@ class ValidationReport:
         return {"result": self.result, "valid": self.valid, "error": self.error}
 
 
-def describe_resource(pth: str) -> dict:
-    """
-    Describe a resource using frictionless.
-
-    With bigger buffer/sample we should avoid error encoding detection.
-
-    Parameters
-    ----------
-    pth: str
-        Path to resource.
-
-    Returns
-    -------
-    dict
-        Resource description.
-    """
-    return Resource.describe(source=pth, detector=Detector(buffer_size=20000, sample_size=1250)).to_dict()
-
-
 def return_head(df: pd.DataFrame) -> dict:
     """
     Return head(100) of DataFrame as dict.
@@ -173,3 +162,48 @@ def return_length(df: pd.DataFrame) -> int:
     Return length of DataFrame.
     """
     return df.shape[0]
+
+
+def _as_subquery(query: str, alias: str = "nefertem_subquery") -> sqlalchemy.TextClause:
+    """
+    Wrap a query to select from it.
+    """
+    return sqlalchemy.text(f"({query.strip().rstrip(';')}) AS {alias}")
+
+
+def build_head_query(query: str, limit: int = HEAD_ROWS) -> Select:
+    """
+    Build a query that returns the first rows of a query.
+    The limit is rendered in the syntax of the database.
+    """
+    return sqlalchemy.select(sqlalchemy.literal_column("*")).select_from(_as_subquery(query)).limit(limit)
+
+
+def build_count_query(query: str) -> Select:
+    """
+    Build a query that counts in the database the rows of a query.
+    """
+    return sqlalchemy.select(sqlalchemy.func.count().label("count")).select_from(_as_subquery(query))
+
+
+def is_existence_check(constraint: ConstraintSqlAlchemy) -> bool:
+    """
+    Check if a rows constraint only needs to know if the query returns rows.
+    """
+    return constraint.expect in ("empty", "non-empty")
+
+
+def build_batch_query(constraints: list[ConstraintSqlAlchemy]) -> Select:
+    """
+    Build a query that counts in a single row the rows of the queries of
+    many rows constraints, one COUNT(*) column for each constraint.
+    """
+    columns = []
+    for idx, const in enumerate(constraints):
+        column = (
+            sqlalchemy.select(sqlalchemy.func.count())
+            .select_from(_as_subquery(const.query, f"nefertem_subquery_{idx}"))
+            .scalar_subquery()
+        )
+        columns.append(column.label(f"check_{idx}"))
+    return sqlalchemy.select(*columns)
@@ -20,11 +20,11 @@ class ProfilingBuilderYdataProfiling(ProfilingPluginBuilder):
     Profile plugin builder.
     """
 
-    def __init__(self, stores: dict[str, str], exec_args: dict) -> None:
+    def __init__(self, stores: dict[str, str], exec_args: dict, num_worker: int = 1) -> None:
         """
         Constructor.
         """
-        super().__init__(stores, exec_args)
+        super().__init__(stores, exec_args, num_worker)
 
         # Register new reader in the reader registry
         reader_registry.register(
@@ -9,14 +9,16 @@ import typing
 import ydata_profiling
 from nefertem_core.plugins.utils import RenderTuple, exec_decorator
 from nefertem_core.utils.io_utils import write_bytesio
+from nefertem_core.utils.utils import listify
 from nefertem_profiling.metadata.report import NefertemProfile
 from nefertem_profiling.plugins.plugin import ProfilingPlugin
-from nefertem_profiling_ydata_profiling.utils import PROFILE_COLUMNS, PROFILE_FIELDS
+from nefertem_profiling_ydata_profiling.utils import PROFILE_COLUMNS, PROFILE_FIELDS, check_sample_args, sample_batches
 from ydata_profiling import ProfileReport
 
 if typing.TYPE_CHECKING:
     from nefertem_core.plugins.utils import Result
     from nefertem_core.resources.data_resource import DataResource
+    from nefertem_core.stores.input.objects._base import InputStore
     from nefertem_profiling_ydata_profiling.reader import PandasDataFrameFileReader
 
 
@@ -31,6 +33,7 @@ class ProfilingPluginYdataProfiling(ProfilingPlugin):
         """
         super().__init__()
         self.resource = None
+        self.sample_info = None
         self.exec_multiprocess = True
 
     def setup(
@@ -49,29 +52,66 @@ class ProfilingPluginYdataProfiling(ProfilingPlugin):
         resource : DataResource
             Data resource to be profiled.
         exec_args : dict
-            Execution arguments for ProfileReport.
+            Execution arguments for ProfileReport and sampling arguments
+            (sample_size, sample_method, sample_column, sample_seed).
 
         Returns
         -------
         None
+
+        Raises
+        ------
+        ValueError
+            If the sampling arguments are invalid.
         """
         self.data_reader = data_reader
         self.resource = resource
         self.exec_args = exec_args
+        if exec_args.get("sample_size") is not None:
+            check_sample_args(exec_args.get("sample_method", "reservoir"), exec_args.get("sample_column"))
+
+    def get_inputs(self) -> list[tuple[InputStore, str]]:
+        """
+        Return the inputs read by the plugin.
+
+        Returns
+        -------
+        list[tuple[InputStore, str]]
+            List of (store, path) tuples.
+        """
+        return [(self.data_reader.store, path) for path in listify(self.resource.path)]
 
     @exec_decorator
     def profile(self) -> ProfileReport:
         """
-        Generate ydata_profiling profile.
+        Generate ydata_profiling profile. If a sample size is given, the
+        resource is read in batches and only a sample of its rows is
+        profiled.
 
         Returns
         -------
         ProfileReport
             ProfileReport object.
         """
-        data = self.data_reader.fetch_data(self.resource.path)
-        profile = ProfileReport(data, lazy=False, **self.exec_args)
-        return ProfileReport().loads(profile.dumps())
+        exec_args = dict(self.exec_args)
+        sample_size = exec_args.pop("sample_size", None)
+        sample_method = exec_args.pop("sample_method", "reservoir")
+        sample_column = exec_args.pop("sample_column", None)
+        sample_seed = exec_args.pop("sample_seed", None)
+
+        if sample_size is None:
+            data = self.data_reader.fetch_data(self.resource.path)
+        else:
+            data, rows_read = sample_batches(
+                self.data_reader.fetch_batches(self.resource.path),
+                sample_size,
+                sample_method,
+                sample_column,
+                sample_seed,
+            )
+            self.sample_info = {"method": sample_method, "rows": len(data), "rows_read": rows_read}
+
+        return ProfileReport(data, lazy=False, **exec_args)
 
     @exec_decorator
     def render_nefertem(self, result: Result) -> RenderTuple:
@@ -109,6 +149,12 @@ class ProfilingPluginYdataProfiling(ProfilingPlugin):
             fields = args.get("variables", {})
             stats = args.get("table", {})
 
+            # Mark statistics computed on a sample
+            if self.sample_info is not None:
+                stats["sample"] = self.sample_info
+                for field in fields.values():
+                    field["sampled"] = True
+
         else:
             self.logger.error(f"Execution error {str(exec_err)} for plugin {self.id}")
             fields = {}
@@ -3,10 +3,15 @@ PandasDataFrameReader module.
 """
 from __future__ import annotations
 
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
 import pandas as pd
+import pyarrow.parquet as pq
 from nefertem_core.readers.objects._base import DataReader
+from nefertem_core.readers.objects.arrow import ArrowReader, get_dataset_format, to_pandas
+from nefertem_core.utils.describe import describe_buffer, describe_resource
 from nefertem_core.utils.utils import listify
-from nefertem_profiling_ydata_profiling.utils import describe_resource
 
 
 class PandasDataFrameFileReader(DataReader):
@@ -16,14 +21,78 @@ class PandasDataFrameFileReader(DataReader):
     Read a DataFrame from local file.
     """
 
-    def fetch_data(self, src: str) -> pd.DataFrame:
+    def fetch_data(self, src: str | list[str]) -> pd.DataFrame:
         """
-        Fetch resource from backend.
+        Fetch resource from backend. Parquet and CSV files are read from
+        a file object of the store, so stores that support ranged reads
+        do not store them.
         """
+        srcs = listify(src)
+        if len(srcs) > 1:
+            return self._fetch_partitions(srcs)
+        src = srcs[0]
+
+        file_format = Path(src).suffix.lower()
+        if file_format == ".parquet":
+            with self.store.fetch_buffer(src) as buffer:
+                return pd.read_parquet(buffer)
+        if file_format == ".csv":
+            with self.store.fetch_buffer(src) as buffer:
+                res = self._describe_csv(src, buffer)
+                return pd.read_csv(buffer, **self._get_csv_args(res))
+
         path = self.store.fetch_file(src)
         res = describe_resource(path)
         return self._read_df_from_path(res)
 
+    def fetch_batches(self, src: str | list[str], batch_rows: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Fetch resource from backend one batch of rows at a time, so that
+        only a batch is in memory. CSV files are read in chunks of rows,
+        Parquet files by row groups from the start, other formats are
+        read whole. Reading stops when the iteration stops.
+        """
+        for path in listify(src):
+            file_format = Path(path).suffix.lower()
+            if file_format == ".parquet":
+                with self.store.fetch_buffer(path) as buffer:
+                    for batch in pq.ParquetFile(buffer).iter_batches(batch_size=batch_rows):
+                        yield batch.to_pandas()
+            elif file_format == ".csv":
+                with self.store.fetch_buffer(path) as buffer:
+                    res = self._describe_csv(path, buffer)
+                    yield from pd.read_csv(buffer, chunksize=batch_rows, **self._get_csv_args(res))
+            else:
+                yield self.fetch_data(path)
+
+    def _describe_csv(self, src: str, buffer: BinaryIO) -> dict:
+        """
+        Describe a CSV resource read from a file object of the store.
+        Fetched files are described by path, resources read with ranged
+        requests by their first bytes. Both descriptions are cached until
+        the resource changes.
+        """
+        if not self.store.reads_ranges():
+            return describe_resource(self.store.fetch_file(src))
+        fingerprint = self.store.get_fingerprint(src)
+        source = None if fingerprint is None else f"{self.store.store_type}:{self.store.name}:{src}:{fingerprint}"
+        return describe_buffer(buffer, source)
+
+    def _fetch_partitions(self, srcs: list[str]) -> pd.DataFrame:
+        """
+        Read a resource split in several files. CSV and Parquet files are
+        read in a single Arrow table, converted once to pandas, other
+        formats are read one by one and concatenated.
+        """
+        file_format = get_dataset_format(srcs)
+        if file_format is None:
+            return pd.concat([self.fetch_data(src) for src in srcs])
+        args = {}
+        if file_format == "csv":
+            csv_args = self._get_csv_args(describe_resource(self.store.fetch_file(srcs[0])))
+            args = {"delimiter": csv_args["sep"], "encoding": csv_args["encoding"]}
+        return to_pandas(ArrowReader(self.store).fetch_data(srcs, **args))
+
     def _read_df_from_path(self, resource: dict) -> pd.DataFrame:
         """
         Read a file into a pandas DataFrame.
@@ -32,10 +101,7 @@ class PandasDataFrameFileReader(DataReader):
         file_format = resource.get("format")
 
         if file_format == "csv":
-            csv_args = {
-                "sep": resource.get("dialect", {}).get("csv", {}).get("delimiter", ","),
-                "encoding": resource.get("encoding"),
-            }
+            csv_args = self._get_csv_args(resource)
             list_df = [pd.read_csv(i, **csv_args) for i in paths]
         elif file_format in ["xls", "xlsx", "ods", "odf"]:
             list_df = [pd.read_excel(i) for i in paths]
@@ -45,3 +111,13 @@ class PandasDataFrameFileReader(DataReader):
             raise ValueError("File extension not supported!")
 
         return pd.concat(list_df)
+
+    @staticmethod
+    def _get_csv_args(resource: dict) -> dict:
+        """
+        Return the arguments to read a CSV file.
+        """
+        return {
+            "sep": resource.get("dialect", {}).get("csv", {}).get("delimiter", ","),
+            "encoding": resource.get("encoding"),
+        }
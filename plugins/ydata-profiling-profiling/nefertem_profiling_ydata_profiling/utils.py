@@ -3,26 +3,10 @@ Utils functions for data reader.
 """
 from __future__ import annotations
 
-from frictionless import Detector, Resource
+from typing import Iterable
 
-
-def describe_resource(pth: str) -> dict:
-    """
-    Describe a resource using frictionless.
-
-    With bigger buffer/sample we should avoid error encoding detection.
-
-    Parameters
-    ----------
-    pth: str
-        Path to resource.
-
-    Returns
-    -------
-    dict
-        Resource description.
-    """
-    return Resource.describe(source=pth, detector=Detector(buffer_size=20000, sample_size=1250)).to_dict()
+import numpy as np
+import pandas as pd
 
 
 # Columns/fields to parse from profile
@@ -41,3 +25,114 @@ PROFILE_FIELDS = [
     "count",
     "memory_size",
 ]
+
+# Sampling methods
+SAMPLE_METHODS = ["reservoir", "stratified", "head"]
+
+# Column of the random keys of sampled rows
+SAMPLE_KEY = "__nefertem_sample_key"
+
+
+def check_sample_args(method: str = "reservoir", column: str | None = None) -> None:
+    """
+    Check the sampling arguments.
+
+    Parameters
+    ----------
+    method : str
+        Sampling method, one of "reservoir", "stratified" or "head".
+    column : str
+        Column to stratify the sample by.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If the method is not supported or the stratification column is missing.
+    """
+    if method not in SAMPLE_METHODS:
+        raise ValueError(f"Sampling method {method} not supported! Use one of {SAMPLE_METHODS}.")
+    if method == "stratified" and column is None:
+        raise ValueError("A column is required by stratified sampling!")
+
+
+def sample_batches(
+    batches: Iterable[pd.DataFrame],
+    size: int,
+    method: str = "reservoir",
+    column: str | None = None,
+    seed: int | None = None,
+) -> tuple[pd.DataFrame, int]:
+    """
+    Sample the rows of a resource read in batches, keeping in memory
+    at most a sample and a batch. Sampled rows are indexed and ordered
+    by their position in the resource.
+
+    With "head" the first rows are taken and reading stops. With
+    "reservoir" a uniform sample of the rows is taken: every row gets
+    a random key and the rows with the smallest keys are kept. With
+    "stratified" the same is done for every value of a column, and
+    after every batch each value keeps a share of the sample
+    proportional to its rows read so far, at least one row. Rows of a
+    value whose share grows while reading, e.g. in a resource sorted
+    by the column, are kept less often from the first batches.
+
+    Parameters
+    ----------
+    batches : Iterable[pd.DataFrame]
+        Batches of rows.
+    size : int
+        Number of rows of the sample.
+    method : str
+        Sampling method, one of "reservoir", "stratified" or "head".
+    column : str
+        Column to stratify the sample by.
+    seed : int
+        Seed of the random keys.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, int]
+        Sample and number of rows read.
+
+    Raises
+    ------
+    ValueError
+        If the method is not supported, the stratification column is
+        missing or it has more values than the rows of the sample.
+    """
+    check_sample_args(method, column)
+
+    rng = np.random.default_rng(seed)
+    sample = None
+    counts = pd.Series(dtype="int64")
+    rows = 0
+    for batch in batches:
+        if method == "head":
+            batch = batch.iloc[: size - rows]
+        batch = batch.set_axis(pd.RangeIndex(rows, rows + len(batch)))
+        rows += len(batch)
+        batch = batch.assign(**{SAMPLE_KEY: rng.random(len(batch))})
+        sample = batch if sample is None else pd.concat([sample, batch])
+        if method == "head":
+            if rows >= size:
+                break
+        elif method == "reservoir":
+            sample = sample.nsmallest(size, SAMPLE_KEY)
+        elif rows > 0:
+            counts = counts.add(batch[column].value_counts(dropna=False), fill_value=0)
+            if len(counts) > size:
+                raise ValueError(f"Column {column} has more values than the {size} rows of the sample!")
+
+            # Keep for every value a share of the sample proportional to its rows
+            quotas = (counts / rows * size).round().clip(lower=1)
+            sample = sample.sort_values(SAMPLE_KEY)
+            rank = sample.groupby(column, dropna=False, sort=False).cumcount()
+            sample = sample[rank.to_numpy() < sample[column].map(quotas).to_numpy()]
+
+    if sample is None:
+        return pd.DataFrame(), 0
+    return sample.sort_index().drop(columns=SAMPLE_KEY), rows